@@ -11,32 +11,54 @@ from flask_jwt_extended import JWTManager
 from flask_migrate import Migrate
 
 from backend.config import Config
-from backend.database import db
+from backend.database import apply_sqlite_pragmas, db
 from backend.routes.events import bp as events_bp
 from backend.routes.entrants import bp as entrants_bp
 from backend.routes.matches import bp as matches_bp
 from backend.routes.auth import auth_bp
-from backend.blocklist import jwt_blocklist
+from backend.routes.metrics import metrics_bp
+from backend.blocklist import init_revocation_store
+from backend.response_cache import init_response_cache
+from backend.broker import init_broker
+from backend.metrics import init_metrics
+from backend.logging_setup import init_logging
+from backend.passwords import init_password_hasher
 
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    init_logging(app)
 
     # Extensions
     db.init_app(app)
     Migrate(app, db)
+    if app.config.get("SQLITE_PRAGMAS"):
+        with app.app_context():
+            apply_sqlite_pragmas(db.engine, app.config["SQLITE_PRAGMAS"])
 
     # Explicit CORS config
     CORS(
         app,
         origins=[Config.FRONTEND_URL],
         supports_credentials=True,
-        allow_headers=["Content-Type", "Authorization"],
-        methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        # Conditional GET validators (backend/etags.py) must cross origins both ways
+        allow_headers=[
+            "Content-Type",
+            "Authorization",
+            "If-None-Match",
+            "If-Modified-Since",
+        ],
+        expose_headers=["ETag", "Last-Modified"],
+        methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     )
 
     jwt = JWTManager(app)
+    revocation_store = init_revocation_store(app)
+    init_password_hasher(app)
+    init_response_cache(app)
+    init_broker(app)
+    init_metrics(app)
 
     # ------------------------
     # Custom JWT error handlers (normalize to 401)
@@ -59,7 +81,7 @@ def create_app(config_class=Config):
 
     @jwt.token_in_blocklist_loader
     def check_if_token_revoked(jwt_header, jwt_payload):
-        return jwt_payload["jti"] in jwt_blocklist
+        return revocation_store.is_revoked(jwt_payload["jti"])
 
     # ------------------------
     # Register Blueprints
@@ -68,6 +90,7 @@ def create_app(config_class=Config):
     app.register_blueprint(entrants_bp)
     app.register_blueprint(matches_bp)
     app.register_blueprint(auth_bp)
+    app.register_blueprint(metrics_bp)
 
     return app
 
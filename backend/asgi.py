@@ -0,0 +1,292 @@
+# File: backend/asgi.py
+# Purpose: ASGI serving mode for high-concurrency spectator traffic.
+# Notes:
+# - Run with: uvicorn --factory backend.asgi:create_asgi_app --port 5500
+#   (deps: asgiref, uvicorn, aiosqlite or asyncpg; see requirements.txt).
+# - The spectator hot paths are served natively on the event loop with an
+#   async SQLAlchemy session:
+#     GET /events/<id>         same ETag/304 + response cache as the WSGI route
+#     GET /events/<id>/stream  SSE, one coroutine per client instead of a thread
+# - Everything else (writes, auth, lists) goes to the Flask app through
+#   asgiref's WsgiToAsgi thread pool, so its behavior is unchanged.
+# - Writes publish to the in-process broker, which wakes async subscribers
+#   thread-safely; run a single worker unless a shared broker is configured.
+
+import asyncio
+import logging
+import re
+
+from asgiref.wsgi import WsgiToAsgi
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from werkzeug.http import http_date, is_resource_modified
+
+from backend.app import create_app
+from backend.broker import CLOSED, format_sse
+from backend.config import Config
+from backend.etags import etag_for, event_token
+from backend.models import Entrant, Event
+from backend.response_cache import event_scope
+from backend.routes.events import serialize_event_detail
+
+log = logging.getLogger(__name__)
+
+EVENT_PATH = re.compile(r"^/events/(\d+)(/stream)?$")
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def async_database_url(url):
+    """Map a sync database URL to the matching asyncio driver."""
+    url = make_url(url)
+    try:
+        return url.set(drivername=ASYNC_DRIVERS[url.get_backend_name()])
+    except KeyError:
+        raise ValueError(f"No async driver for {url.get_backend_name()!r}")
+
+
+class AsgiApp:
+    """Routes spectator reads natively and everything else to Flask."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+        config = flask_app.config
+        url = config.get("ASYNC_DATABASE_URL") or async_database_url(
+            config["SQLALCHEMY_DATABASE_URI"]
+        )
+        self.engine = create_async_engine(url, **config.get("ASYNC_ENGINE_OPTIONS", {}))
+        self.sessions = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.broker = flask_app.extensions["broker"]
+        self.cache = flask_app.extensions.get("response_cache")
+        self.keepalive = config.get("EVENT_STREAM_KEEPALIVE", 15.0)
+        self.frontend_url = config.get("FRONTEND_URL")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            return await self._lifespan(receive, send)
+        if scope["type"] == "http" and scope["method"] == "GET":
+            found = EVENT_PATH.match(scope["path"])
+            if found:
+                event_id = int(found.group(1))
+                if found.group(2):
+                    return await self._stream(scope, receive, send, event_id)
+                try:
+                    return await self._event_detail(scope, send, event_id)
+                except Exception:
+                    log.exception(
+                        "Error serving request (asgi)", extra={"path": scope["path"]}
+                    )
+                    return await self._json(
+                        scope, send, 500, {"error": "Failed to fetch event"}
+                    )
+        await self.wsgi(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.engine.dispose()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    # ------------------------
+    # GET /events/<id>
+    # ------------------------
+    async def _event_detail(self, scope, send, event_id):
+        full_path = f"{scope['path']}?{scope['query_string'].decode('latin-1')}"
+        async with self.sessions() as session:
+            row = (
+                await session.execute(
+                    select(Event.version, Event.updated_at).where(Event.id == event_id)
+                )
+            ).one_or_none()
+            if row is None:
+                return await self._json(scope, send, 404, {"error": "Event not found"})
+
+            version = event_token(event_id, row.version, row.updated_at)
+            etag = etag_for(version, full_path)
+            validators = _validators(etag, version)
+            if not is_resource_modified(
+                _conditional_environ(scope),
+                etag=etag,
+                last_modified=version.updated_at,
+            ):
+                return await self._respond(scope, send, 304, b"", validators)
+
+            key = f"{event_scope(event_id)}:{full_path}"
+            body = self.cache.get(key, etag) if self.cache is not None else None
+            if body is None:
+                body = await self._load_detail_body(session, event_id)
+                if body is None:
+                    return await self._json(
+                        scope, send, 404, {"error": "Event not found"}
+                    )
+                if self.cache is not None:
+                    self.cache.put(key, etag, body)
+
+        headers = validators + [(b"content-type", b"application/json")]
+        await self._respond(scope, send, 200, body, headers)
+
+    async def _load_detail_body(self, session, event_id):
+        event = (
+            await session.execute(
+                select(Event)
+                .options(selectinload(Event.entrants), selectinload(Event.matches))
+                .where(Event.id == event_id)
+            )
+        ).scalar_one_or_none()
+        if event is None:
+            return None
+        # Preload entrants from other events so serialization never lazy-loads
+        registered = {e.id for e in event.entrants}
+        outside = {
+            entrant_id
+            for m in event.matches
+            for entrant_id in (m.entrant1_id, m.entrant2_id, m.winner_id)
+            if entrant_id and entrant_id not in registered
+        }
+        known = []
+        if outside:
+            known = (
+                await session.scalars(select(Entrant).where(Entrant.id.in_(outside)))
+            ).all()
+        data = serialize_event_detail(event, known)
+        return self.flask_app.json.response(data).get_data()
+
+    # ------------------------
+    # GET /events/<id>/stream
+    # ------------------------
+    async def _stream(self, scope, receive, send, event_id):
+        async with self.sessions() as session:
+            exists = await session.scalar(select(Event.id).where(Event.id == event_id))
+        if exists is None:
+            return await self._json(scope, send, 404, {"error": "Event not found"})
+
+        last_event_id = _header(scope, b"last-event-id")
+        subscription = self.broker.subscribe_async(
+            event_id, int(last_event_id) if last_event_id.isdigit() else None
+        )
+        disconnected = asyncio.ensure_future(_wait_for_disconnect(receive))
+        try:
+            await self._start(
+                scope,
+                send,
+                200,
+                [
+                    (b"content-type", b"text/event-stream; charset=utf-8"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                ],
+            )
+            await _send_chunk(send, "retry: 3000\n\n")
+            while True:
+                getter = asyncio.ensure_future(subscription.get())
+                done, _ = await asyncio.wait(
+                    {getter, disconnected},
+                    timeout=self.keepalive,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if disconnected in done:
+                    getter.cancel()
+                    return
+                if getter not in done:
+                    getter.cancel()
+                    await _send_chunk(send, ": keepalive\n\n")
+                    continue
+                message = getter.result()
+                if message is CLOSED:
+                    break
+                await _send_chunk(send, format_sse(message))
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            disconnected.cancel()
+            self.broker.unsubscribe(event_id, subscription)
+
+    # ------------------------
+    # Response helpers
+    # ------------------------
+    async def _start(self, scope, send, status, headers):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers + self._cors_headers(scope),
+            }
+        )
+
+    async def _respond(self, scope, send, status, body, headers):
+        headers = headers + [(b"content-length", str(len(body)).encode())]
+        await self._start(scope, send, status, headers)
+        await send({"type": "http.response.body", "body": body})
+
+    async def _json(self, scope, send, status, data):
+        body = self.flask_app.json.response(data).get_data()
+        headers = [(b"content-type", b"application/json")]
+        await self._respond(scope, send, status, body, headers)
+
+    def _cors_headers(self, scope):
+        """Mirror the Flask-CORS policy in backend/app.py for native routes."""
+        origin = _header(scope, b"origin")
+        if not origin or origin != self.frontend_url:
+            return []
+        return [
+            (b"access-control-allow-origin", origin.encode("latin-1")),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+
+def _header(scope, name):
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _conditional_environ(scope):
+    """The WSGI environ keys werkzeug's is_resource_modified() reads."""
+    environ = {"REQUEST_METHOD": scope["method"]}
+    for header, key in (
+        (b"if-none-match", "HTTP_IF_NONE_MATCH"),
+        (b"if-modified-since", "HTTP_IF_MODIFIED_SINCE"),
+    ):
+        value = _header(scope, header)
+        if value:
+            environ[key] = value
+    return environ
+
+
+def _validators(etag, version):
+    headers = [
+        (b"etag", f'"{etag}"'.encode()),
+        (b"cache-control", b"no-cache"),
+        (b"vary", b"Accept"),
+    ]
+    if version.updated_at is not None:
+        headers.append((b"last-modified", http_date(version.updated_at).encode()))
+    return headers
+
+
+async def _send_chunk(send, text):
+    await send({"type": "http.response.body", "body": text.encode(), "more_body": True})
+
+
+async def _wait_for_disconnect(receive):
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+def create_asgi_app(config_class=Config):
+    """ASGI app factory (uvicorn --factory backend.asgi:create_asgi_app)."""
+    return AsgiApp(create_app(config_class))
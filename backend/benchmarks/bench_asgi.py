@@ -0,0 +1,285 @@
+# File: backend/benchmarks/bench_asgi.py
+# Purpose: Load test comparing the WSGI (threaded) and ASGI serving modes
+#          under spectator traffic: many open SSE streams plus pollers.
+# Notes:
+# - Each mode runs in its own server subprocess against the same throwaway
+#   SQLite file (one published event with entrants and matches).
+# - Per mode: open --streams SSE connections, run --pollers concurrent
+#   GET /events/<id> loops for --duration seconds, then PUT one match result
+#   and time how long until every stream has received it (fan-out).
+# - WSGI mode is werkzeug's threaded server (a thread per open stream); ASGI
+#   mode is uvicorn + backend/asgi.py. ASGI is skipped if uvicorn is missing.
+# - Run with: PYTHONPATH=. python -m backend.benchmarks.bench_asgi
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, text
+
+from backend.models import db
+
+HOST = "127.0.0.1"
+
+
+def populate(url, n_entrants):
+    """One published event; a round of matches between consecutive entrants."""
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        db.metadata.create_all(conn)
+        conn.execute(
+            text(
+                "INSERT INTO events (id, name, status, version) "
+                "VALUES (1, 'Live Cup', 'published', 1)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO entrants (id, name, event_id, dropped) "
+                "VALUES (:id, :name, 1, 0)"
+            ),
+            [{"id": i, "name": f"Hero {i}"} for i in range(1, n_entrants + 1)],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO matches (id, event_id, round, entrant1_id, entrant2_id) "
+                "VALUES (:id, 1, 1, :e1, :e2)"
+            ),
+            [{"id": i // 2 + 1, "e1": i, "e2": i + 1} for i in range(1, n_entrants, 2)],
+        )
+    engine.dispose()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def serve(mode, port):
+    """Subprocess entry point: run one server until killed."""
+    if mode == "wsgi":
+        from werkzeug.serving import run_simple
+
+        from backend.app import create_app
+
+        run_simple(HOST, port, create_app(), threaded=True)
+    else:
+        import uvicorn
+
+        from backend.asgi import create_asgi_app
+
+        uvicorn.run(create_asgi_app(), host=HOST, port=port, log_level="warning")
+
+
+def start_server(mode, port, env):
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "backend.benchmarks.bench_asgi", "--serve", mode],
+        env={**env, "BENCH_PORT": str(port)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 20
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((HOST, port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"{mode} server did not start")
+
+
+# ------------------------
+# Minimal asyncio HTTP/1.1 client (one connection per request)
+# ------------------------
+async def request(port, method, path, body=None, headers=None):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    payload = json.dumps(body).encode() if body is not None else b""
+    lines = [f"{method} {path} HTTP/1.1", f"Host: {HOST}:{port}", "Connection: close"]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    if body is not None:
+        lines += ["Content-Type: application/json", f"Content-Length: {len(payload)}"]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + payload)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, _, content = raw.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), content
+
+
+async def open_stream(port, path):
+    """Open an SSE connection and wait for the first frame."""
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {HOST}:{port}\r\n"
+        "Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    buffer = b""
+    while b"retry:" not in buffer:
+        chunk = await reader.read(4096)
+        if not chunk:
+            raise ConnectionError("stream closed before first frame")
+        buffer += chunk
+    return reader, writer
+
+
+async def wait_for_frame(reader, marker):
+    buffer = b""
+    while marker not in buffer:
+        chunk = await reader.read(4096)
+        if not chunk:
+            raise ConnectionError("stream closed")
+        buffer += chunk
+    return time.perf_counter()
+
+
+async def poll(port, path, until, latencies, errors):
+    while time.perf_counter() < until:
+        start = time.perf_counter()
+        try:
+            status, _ = await request(port, "GET", path)
+        except OSError:
+            errors.append(1)
+            continue
+        if status != 200:
+            errors.append(status)
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def login(port):
+    user = {"username": "bench", "email": "bench@example.com", "password": "bench"}
+    await request(port, "POST", "/signup", user)
+    _, body = await request(port, "POST", "/login", user)
+    return json.loads(body)["access_token"]
+
+
+async def run_mode(port, args):
+    result = {}
+    start = time.perf_counter()
+    streams = await asyncio.gather(
+        *(open_stream(port, "/events/1/stream") for _ in range(args.streams)),
+        return_exceptions=True,
+    )
+    opened = [s for s in streams if not isinstance(s, BaseException)]
+    result["streams_open"] = len(opened)
+    result["stream_connect_s"] = round(time.perf_counter() - start, 3)
+
+    latencies, errors = [], []
+    until = time.perf_counter() + args.duration
+    await asyncio.gather(
+        *(
+            poll(port, "/events/1", until, latencies, errors)
+            for _ in range(args.pollers)
+        )
+    )
+    result["requests"] = len(latencies)
+    result["errors"] = len(errors)
+    result["req_per_s"] = round(len(latencies) / args.duration, 1)
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100)
+        result.update(
+            p50_ms=round(cuts[49], 2),
+            p95_ms=round(cuts[94], 2),
+            p99_ms=round(cuts[98], 2),
+        )
+
+    if opened:
+        token = await login(port)
+        waiters = [
+            asyncio.ensure_future(wait_for_frame(reader, b"match.updated"))
+            for reader, _ in opened
+        ]
+        sent = time.perf_counter()
+        await request(
+            port,
+            "PUT",
+            "/matches/1",
+            {"winner_id": 1},
+            {"Authorization": f"Bearer {token}"},
+        )
+        done = await asyncio.gather(*waiters, return_exceptions=True)
+        arrivals = [t for t in done if not isinstance(t, BaseException)]
+        result["fanout_delivered"] = len(arrivals)
+        if arrivals:
+            result["fanout_ms"] = round((max(arrivals) - sent) * 1000, 1)
+
+    for _, writer in opened:
+        writer.close()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="WSGI vs ASGI load test")
+    parser.add_argument("--serve", choices=("wsgi", "asgi"), help=argparse.SUPPRESS)
+    parser.add_argument("--streams", type=int, default=500)
+    parser.add_argument("--pollers", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--entrants", type=int, default=64)
+    parser.add_argument("--modes", default="wsgi,asgi")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        return serve(args.serve, int(os.environ["BENCH_PORT"]))
+
+    workdir = tempfile.mkdtemp(prefix="bench_asgi_")
+    results = {}
+    for mode in args.modes.split(","):
+        if mode == "asgi":
+            try:
+                import uvicorn  # noqa: F401
+                import asgiref  # noqa: F401
+            except ImportError:
+                print("⚠️ Skipping asgi: install uvicorn, asgiref and aiosqlite")
+                continue
+        url = f"sqlite:///{os.path.join(workdir, f'{mode}.db')}"
+        populate(url, args.entrants)
+        pythonpath = [os.getcwd(), os.environ.get("PYTHONPATH", "")]
+        env = {
+            **os.environ,
+            "DATABASE_URL": url,
+            "PYTHONPATH": os.pathsep.join(filter(None, pythonpath)),
+        }
+        port = free_port()
+        print(f"🚀 {mode}: {args.streams} streams, {args.pollers} pollers...")
+        proc = start_server(mode, port, env)
+        try:
+            results[mode] = asyncio.run(run_mode(port, args))
+        finally:
+            proc.terminate()
+            proc.wait(timeout=10)
+
+    columns = [
+        "streams_open",
+        "stream_connect_s",
+        "req_per_s",
+        "p50_ms",
+        "p95_ms",
+        "p99_ms",
+        "errors",
+        "fanout_delivered",
+        "fanout_ms",
+    ]
+    print(f"\n{'metric':18}" + "".join(f"{mode:>12}" for mode in results))
+    for column in columns:
+        row = "".join(f"{str(r.get(column, '-')):>12}" for r in results.values())
+        print(f"{column:18}{row}")
+
+    if args.json:
+        with open(args.json, "w") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# File: backend/benchmarks/bench_indexes.py
+# Purpose: Compare query plans and latency for the hot FK access paths
+#          with and without the indexes declared in backend/models.py.
+# Notes:
+# - Builds a throwaway SQLite database from the model metadata.
+# - Default scale: 500 events, 50k entrants, 150k matches (override via flags).
+# - Run with: PYTHONPATH=. python -m backend.benchmarks.bench_indexes
+
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, text
+
+from backend.models import db
+
+# Hot-path queries issued by the routes (raw SQL mirrors of the ORM queries)
+QUERIES = {
+    "get_entrants(event_id)": (
+        "SELECT * FROM entrants WHERE event_id = :event_id",
+        lambda ctx: {"event_id": ctx["event_id"]},
+    ),
+    "get_matches(event_id)": (
+        "SELECT * FROM matches WHERE event_id = :event_id ORDER BY round",
+        lambda ctx: {"event_id": ctx["event_id"]},
+    ),
+    "active entrants(event_id)": (
+        "SELECT COUNT(*) FROM entrants WHERE event_id = :event_id AND dropped = 0",
+        lambda ctx: {"event_id": ctx["event_id"]},
+    ),
+    "delete_entrant match check": (
+        "SELECT COUNT(*) FROM matches WHERE entrant1_id = :eid "
+        "OR entrant2_id = :eid OR winner_id = :eid",
+        lambda ctx: {"eid": ctx["entrant_id"]},
+    ),
+    "get_events entrant counts": (
+        "SELECT events.id, COUNT(entrants.id) FROM events "
+        "LEFT OUTER JOIN entrants ON entrants.event_id = events.id "
+        "GROUP BY events.id",
+        lambda ctx: {},
+    ),
+}
+
+INDEX_NAMES = [
+    index.name
+    for table in ("entrants", "matches")
+    for index in db.metadata.tables[table].indexes
+]
+
+
+def populate(conn, n_events, n_entrants, n_matches, seed=42):
+    rng = random.Random(seed)
+    conn.execute(
+        text("INSERT INTO events (id, name, status) VALUES (:id, :name, 'published')"),
+        [{"id": i, "name": f"Event {i}"} for i in range(1, n_events + 1)],
+    )
+    entrant_event = {}
+    rows = []
+    for i in range(1, n_entrants + 1):
+        event_id = rng.randint(1, n_events)
+        entrant_event[i] = event_id
+        rows.append(
+            {"id": i, "name": f"Hero {i}", "event_id": event_id, "dropped": i % 10 == 0}
+        )
+    conn.execute(
+        text(
+            "INSERT INTO entrants (id, name, event_id, dropped) "
+            "VALUES (:id, :name, :event_id, :dropped)"
+        ),
+        rows,
+    )
+    rows = []
+    for i in range(1, n_matches + 1):
+        e1 = rng.randint(1, n_entrants)
+        e2 = e1 % n_entrants + 1
+        rows.append(
+            {
+                "id": i,
+                "event_id": entrant_event[e1],
+                "round": rng.randint(1, 10),
+                "e1": e1,
+                "e2": e2,
+                "w": rng.choice((e1, e2)),
+            }
+        )
+    conn.execute(
+        text(
+            "INSERT INTO matches (id, event_id, round, entrant1_id, entrant2_id, "
+            "winner_id) VALUES (:id, :event_id, :round, :e1, :e2, :w)"
+        ),
+        rows,
+    )
+
+
+def measure(conn, sql, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(text(sql), params).fetchall()
+        timings.append((time.perf_counter() - start) * 1000)
+    plan = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+    return statistics.median(timings), [row[-1] for row in plan]
+
+
+def run_suite(conn, ctx, repeat):
+    return {
+        label: measure(conn, sql, params(ctx), repeat)
+        for label, (sql, params) in QUERIES.items()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FK index benchmark")
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--entrants", type=int, default=50_000)
+    parser.add_argument("--matches", type=int, default=150_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        db.metadata.create_all(conn)
+        for name in INDEX_NAMES:
+            conn.execute(text(f"DROP INDEX {name}"))
+        print(
+            f"🌱 Populating {args.events} events, {args.entrants} entrants, "
+            f"{args.matches} matches..."
+        )
+        populate(conn, args.events, args.entrants, args.matches)
+        conn.execute(text("ANALYZE"))
+
+        ctx = {"event_id": args.events // 2, "entrant_id": args.entrants // 2}
+        before = run_suite(conn, ctx, args.repeat)
+
+        for table in ("entrants", "matches"):
+            for index in db.metadata.tables[table].indexes:
+                index.create(conn)
+        conn.execute(text("ANALYZE"))
+        after = run_suite(conn, ctx, args.repeat)
+
+    print(f"\n{'query':32} {'no index (ms)':>14} {'indexed (ms)':>13} {'speedup':>8}")
+    for label in QUERIES:
+        b_ms, b_plan = before[label]
+        a_ms, a_plan = after[label]
+        speedup = b_ms / a_ms if a_ms else float("inf")
+        print(f"{label:32} {b_ms:14.3f} {a_ms:13.3f} {speedup:7.1f}x")
+        print(f"    before: {' | '.join(b_plan)}")
+        print(f"    after:  {' | '.join(a_plan)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# File: backend/benchmarks/bench_login.py
+# Purpose: Logins/sec per worker process under a check-in storm, for each
+#          password hashing policy and hash pool size.
+# Notes:
+# - --threads client threads POST /login as fast as they can (one Flask test
+#   client each, like gunicorn gthread request threads) while one reader
+#   polls GET /events, whose latency shows how much the storm starves
+#   ordinary requests.
+# - Each profile is PASSWORD_HASH_METHOD x PASSWORD_HASH_WORKERS; users are
+#   created under that profile's method so no login rehashes.
+# - Reports logins/s, login p50/p95, read p95 and 503s (hash pool saturated).
+# - Run with: PYTHONPATH=. python -m backend.benchmarks.bench_login
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+from werkzeug.security import generate_password_hash
+
+from backend.app import create_app
+from backend.config import Config
+from backend.database import db
+from backend.models import User
+from backend.passwords import shutdown_executors
+
+DEFAULT_METHODS = "scrypt,scrypt:16384:8:1,pbkdf2:sha256:600000"
+
+
+def make_config(url, method, workers, threads):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = url
+        JWT_SECRET_KEY = "bench-secret-key-with-enough-bytes!"
+        LOG_LEVEL = "WARNING"
+        PASSWORD_HASH_METHOD = method
+        PASSWORD_HASH_WORKERS = workers
+        # Measure throughput, not load shedding: never 503
+        PASSWORD_HASH_MAX_PENDING = threads
+        PASSWORD_HASH_TIMEOUT = 300.0
+
+    return BenchConfig
+
+
+def percentile(samples, p):
+    if len(samples) < 2:
+        return None
+    return round(statistics.quantiles(samples, n=100)[p - 1], 2)
+
+
+def run_profile(url, method, workers, args):
+    app = create_app(make_config(url, method, workers, args.threads))
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        # One hash shared by every user; hashing each would dominate setup
+        password_hash = generate_password_hash("check-in", method)
+        db.session.add_all(
+            User(
+                username=f"user{i}", email=f"user{i}@bench", password_hash=password_hash
+            )
+            for i in range(args.threads)
+        )
+        db.session.commit()
+
+    login_ms, read_ms, statuses = [], [], []
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def login(n):
+        client = app.test_client()
+        body = {"email": f"user{n}@bench", "password": "check-in"}
+        for _ in range(args.logins):
+            start = time.perf_counter()
+            resp = client.post("/login", json=body)
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                statuses.append(resp.status_code)
+                if resp.status_code == 200:
+                    login_ms.append(elapsed)
+
+    def reader():
+        client = app.test_client()
+        while not stop.is_set():
+            start = time.perf_counter()
+            client.get("/events")
+            read_ms.append((time.perf_counter() - start) * 1000)
+
+    logins = [threading.Thread(target=login, args=(n,)) for n in range(args.threads)]
+    poller = threading.Thread(target=reader)
+    poller.start()
+    start = time.perf_counter()
+    for t in logins:
+        t.start()
+    for t in logins:
+        t.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    poller.join()
+
+    shutdown_executors()
+    with app.app_context():
+        db.engine.dispose()
+
+    return {
+        "logins_per_s": round(len(login_ms) / elapsed, 1),
+        "login_p50_ms": percentile(login_ms, 50),
+        "login_p95_ms": percentile(login_ms, 95),
+        "read_p95_ms": percentile(read_ms, 95),
+        "busy_503": statuses.count(503),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Login storm benchmark")
+    parser.add_argument("--methods", default=DEFAULT_METHODS, help="comma-separated")
+    parser.add_argument(
+        "--hash-workers",
+        default=f"1,{os.cpu_count() or 2}",
+        help="comma-separated PASSWORD_HASH_WORKERS values",
+    )
+    parser.add_argument("--threads", type=int, default=16, help="login threads")
+    parser.add_argument("--logins", type=int, default=10, help="per thread")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="bench_login_")
+    url = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    results = {}
+    for method in args.methods.split(","):
+        for workers in sorted({int(w) for w in args.hash_workers.split(",")}):
+            name = f"{method} x{workers}"
+            print(f"🚀 {name}: {args.threads} threads x {args.logins} logins...")
+            results[name] = run_profile(url, method, workers, args)
+
+    columns = ["logins_per_s", "login_p50_ms", "login_p95_ms", "read_p95_ms"]
+    columns += ["busy_503"]
+    print(f"\n{'profile':28}" + "".join(f"{c:>14}" for c in columns))
+    for name, r in results.items():
+        print(f"{name:28}" + "".join(f"{str(r[c]):>14}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
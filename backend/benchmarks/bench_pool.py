@@ -0,0 +1,137 @@
+# File: backend/benchmarks/bench_pool.py
+# Purpose: Throughput under concurrent writers with the default Config versus
+#          ProductionConfig's pool sizing and SQLite WAL pragmas.
+# Notes:
+# - Writers POST /entrants and readers GET /events/<id> through the real
+#   routes (Flask test clients, one per thread) against a throwaway SQLite
+#   file, or --database-url for another database.
+# - Reports writes/s, write p50/p95/p99, reads/s and failed requests (e.g.
+#   "database is locked").
+# - Run with: PYTHONPATH=. python -m backend.benchmarks.bench_pool
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import timedelta
+
+from flask_jwt_extended import create_access_token
+
+from backend.app import create_app
+from backend.config import Config
+from backend.database import SQLITE_PRAGMAS, db, engine_options
+from backend.models import Event
+
+
+def make_config(profile, url, threads):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = url
+        JWT_SECRET_KEY = "bench-secret"
+        RESPONSE_CACHE_BACKEND = "none"  # measure the database, not the cache
+        LOG_LEVEL = "WARNING"
+
+    if profile == "production":
+        BenchConfig.SQLALCHEMY_ENGINE_OPTIONS = engine_options(url, threads=threads)
+        BenchConfig.SQLITE_PRAGMAS = SQLITE_PRAGMAS
+    return BenchConfig
+
+
+def percentile(cuts, p):
+    return round(cuts[p - 1], 2) if cuts else None
+
+
+def run_profile(profile, url, args):
+    app = create_app(make_config(profile, url, args.writers + args.readers))
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        event = Event(name="Bench Cup", status="published")
+        db.session.add(event)
+        db.session.commit()
+        event_id = event.id
+        token = create_access_token(identity="1", expires_delta=timedelta(hours=1))
+        journal = db.session.execute(db.text("PRAGMA journal_mode")).scalar()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    write_ms, failures, reads = [], [], [0]
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def writer(n):
+        client = app.test_client()
+        for i in range(args.writes):
+            start = time.perf_counter()
+            resp = client.post(
+                "/entrants",
+                json={"name": f"Hero {n}-{i}", "event_id": event_id},
+                headers=headers,
+            )
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                (write_ms if resp.status_code == 201 else failures).append(elapsed)
+
+    def reader():
+        client = app.test_client()
+        while not stop.is_set():
+            resp = client.get(f"/events/{event_id}")
+            with lock:
+                if resp.status_code == 200:
+                    reads[0] += 1
+                else:
+                    failures.append(0)
+
+    writers = [threading.Thread(target=writer, args=(n,)) for n in range(args.writers)]
+    readers = [threading.Thread(target=reader) for _ in range(args.readers)]
+    start = time.perf_counter()
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    for t in readers:
+        t.join()
+
+    with app.app_context():
+        db.engine.dispose()
+
+    cuts = statistics.quantiles(write_ms, n=100) if len(write_ms) > 1 else []
+    return {
+        "journal_mode": journal if url.startswith("sqlite") else "-",
+        "writes_per_s": round(len(write_ms) / elapsed, 1),
+        "write_p50_ms": percentile(cuts, 50),
+        "write_p95_ms": percentile(cuts, 95),
+        "write_p99_ms": percentile(cuts, 99),
+        "reads_per_s": round(reads[0] / elapsed, 1),
+        "failures": len(failures),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent writer benchmark")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=200, help="per writer")
+    parser.add_argument("--database-url", help="default: throwaway SQLite file")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="bench_pool_")
+    results = {}
+    for profile in ("default", "production"):
+        url = args.database_url or f"sqlite:///{os.path.join(workdir, profile)}.db"
+        print(
+            f"🚀 {profile}: {args.writers} writers x {args.writes}, "
+            f"{args.readers} readers..."
+        )
+        results[profile] = run_profile(profile, url, args)
+
+    print(f"\n{'metric':14}" + "".join(f"{name:>12}" for name in results))
+    for metric in results["default"]:
+        row = "".join(f"{str(r[metric]):>12}" for r in results.values())
+        print(f"{metric:14}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,467 @@
+# File: backend/benchmarks/bench_routes.py
+# Purpose: Load-test every API route against a synthetic dataset and report
+#          latency percentiles, throughput and SQL query counts.
+# Notes:
+# - Generates tournaments with backend/benchmarks/synthetic.py, bulk loads them
+#   with backend/scripts/seed_db.py into a throwaway SQLite file (or
+#   --database-url, whose tables are dropped and recreated!), then drives each
+#   route in routes/{auth,events,entrants,matches}.py through the Flask test
+#   client, one request at a time.
+# - Writes run after the reads they could disturb, and deletes consume rows the
+#   matching create made. Untimed setup (fresh events for bracket/Swiss,
+#   tokens for logout) happens outside the timer.
+# - GET /events/<id>/stream is long-lived; bench_asgi covers it.
+# - --save writes a JSON baseline; --baseline compares against one and exits
+#   non-zero when a route's p95 or query count regresses.
+# - Run with: PYTHONPATH=. python -m backend.benchmarks.bench_routes
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+import sqlalchemy
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event as sa_event, select
+
+from backend.app import create_app
+from backend.benchmarks.synthetic import write_seed_dir
+from backend.config import Config
+from backend.models import Entrant, Event, Match, User, db
+from backend.scripts.seed_db import load_seed_dir
+
+ADMIN = {"email": "admin@example.com", "password": "password123"}
+Route = namedtuple("Route", "name method build limit collect")
+ROUTES = []
+
+
+def route(name, limit=None, collect=None):
+    """Register a scenario. build(ctx, i) returns (path, request kwargs), or
+    None when it has nothing left to do. collect names a ctx.created list
+    that receives the id of each created row."""
+
+    def register(build):
+        method = name.split()[0]
+        ROUTES.append(Route(name, method, build, limit, collect))
+        return build
+
+    return register
+
+
+class Context:
+    """Ids and helpers shared by scenario builders."""
+
+    def __init__(self, app, rng):
+        self.app = app
+        self.rng = rng
+        self.created = {"events": [], "entrants": [], "matches": []}
+        with app.app_context():
+            self.admin_id = str(User.query.filter_by(email=ADMIN["email"]).one().id)
+            self.auth = {"Authorization": f"Bearer {self.token()}"}
+            self.events = [
+                e.id for e in Event.query.filter_by(status="published").all()
+            ]
+            self.entrants = {event_id: [] for event_id in self.events}
+            for e in Entrant.query.filter(Entrant.event_id.in_(self.events)):
+                self.entrants[e.event_id].append(e.id)
+            self.decided, self.decided_by_event = [], {}
+            for m in Match.query.filter(
+                Match.event_id.in_(self.events),
+                Match.winner_id.isnot(None),
+                Match.entrant2_id.isnot(None),
+            ):
+                row = (m.id, m.entrant1_id, m.entrant2_id)
+                self.decided.append(row)
+                self.decided_by_event.setdefault(m.event_id, []).append(row)
+
+    def token(self):
+        with self.app.app_context():
+            return create_access_token(identity=self.admin_id)
+
+    def event(self):
+        return self.rng.choice(self.events)
+
+    def fresh_event(self, size=16):
+        """An event with entrants and no matches, for bracket/Swiss pairing."""
+        with self.app.app_context():
+            event = Event(name="Bench Bracket", status="published")
+            db.session.add(event)
+            db.session.flush()
+            db.session.add_all(
+                Entrant(name=f"Seed {n}", event_id=event.id) for n in range(size)
+            )
+            db.session.commit()
+            return event.id
+
+
+# ------------------------
+# auth.py
+# ------------------------
+@route("POST /signup")
+def _signup(ctx, i):
+    user = {"username": f"bench{i}", "email": f"bench{i}@example.com"}
+    return "/signup", {"json": {**user, "password": "bench-password"}}
+
+
+@route("POST /login")
+def _login(ctx, i):
+    return "/login", {"json": ADMIN}
+
+
+@route("GET /protected")
+def _protected(ctx, i):
+    return "/protected", {"headers": ctx.auth}
+
+
+@route("DELETE /logout")
+def _logout(ctx, i):
+    return "/logout", {"headers": {"Authorization": f"Bearer {ctx.token()}"}}
+
+
+# ------------------------
+# events.py
+# ------------------------
+@route("GET /events")
+def _list_events(ctx, i):
+    return "/events", {}
+
+
+@route("GET /events?limit=20")
+def _page_events(ctx, i):
+    return "/events?limit=20", {}
+
+
+@route("GET /events/<id>")
+def _get_event(ctx, i):
+    return f"/events/{ctx.event()}", {}
+
+
+@route("GET /events/<id>/standings")
+def _standings(ctx, i):
+    return f"/events/{ctx.event()}/standings", {}
+
+
+@route("POST /events/<id>/results")
+def _report_results(ctx, i):
+    # A scorekeeper's round: 20 results (winners flipped each time)
+    event_id = ctx.rng.choice(sorted(ctx.decided_by_event))
+    rows = [
+        {
+            "match_id": match_id,
+            "winner_id": (a, b)[i % 2],
+            "scores": ("2-1", "1-2")[i % 2],
+        }
+        for match_id, a, b in ctx.decided_by_event[event_id][:20]
+    ]
+    return f"/events/{event_id}/results", {"json": rows, "headers": ctx.auth}
+
+
+@route("POST /events/<id>/entrants/drop")
+def _drop_entrants(ctx, i):
+    # Check-in close: 32 no-shows, hard-deleted or (every other run) soft-dropped
+    event_id = ctx.fresh_event(32)
+    with ctx.app.app_context():
+        ids = list(db.session.scalars(select(Entrant.id).filter_by(event_id=event_id)))
+    body = {"entrant_ids": ids, "mode": ("delete", "drop")[i % 2]}
+    return f"/events/{event_id}/entrants/drop", {"json": body, "headers": ctx.auth}
+
+
+@route("POST /events", collect="events")
+def _create_event(ctx, i):
+    body = {"name": f"Bench Event {i}", "date": "2026-01-01", "status": "drafting"}
+    return "/events", {"json": body, "headers": ctx.auth}
+
+
+@route("PUT /events/<id>")
+def _update_event(ctx, i, verb="rev"):
+    body = {"rules": f"Best of three ({verb} {i})"}
+    return f"/events/{ctx.event()}", {"json": body, "headers": ctx.auth}
+
+
+@route("PATCH /events/<id>")
+def _patch_event(ctx, i):
+    return _update_event(ctx, i, verb="patch")
+
+
+@route("DELETE /events/<id>")
+def _delete_event(ctx, i):
+    if ctx.created["events"]:
+        return f"/events/{ctx.created['events'].pop()}", {"headers": ctx.auth}
+
+
+# ------------------------
+# entrants.py
+# ------------------------
+@route("GET /entrants?event_id=")
+def _list_entrants(ctx, i):
+    return f"/entrants?event_id={ctx.event()}", {}
+
+
+@route("GET /entrants?event_id=&limit=50")
+def _page_entrants(ctx, i):
+    return f"/entrants?event_id={ctx.event()}&limit=50", {}
+
+
+@route("POST /entrants", collect="entrants")
+def _create_entrant(ctx, i):
+    body = {"name": f"Walk-in {i}", "event_id": ctx.event()}
+    return "/entrants", {"json": body, "headers": ctx.auth}
+
+
+@route("POST /entrants/bulk")
+def _bulk_entrants(ctx, i):
+    event_id = ctx.event()
+    rows = [{"name": f"Bulk {i}-{n}", "event_id": event_id} for n in range(10)]
+    return "/entrants/bulk", {"json": rows, "headers": ctx.auth}
+
+
+@route("PUT /entrants/<id>")
+def _update_entrant(ctx, i, prefix="alias"):
+    created = ctx.created["entrants"]
+    if created:
+        body = {"alias": f"{prefix} {i}"}
+        return f"/entrants/{created[i % len(created)]}", {
+            "json": body,
+            "headers": ctx.auth,
+        }
+
+
+@route("PATCH /entrants/<id>")
+def _patch_entrant(ctx, i):
+    return _update_entrant(ctx, i, prefix="patched")
+
+
+@route("DELETE /entrants/<id>")
+def _delete_entrant(ctx, i):
+    if ctx.created["entrants"]:
+        return f"/entrants/{ctx.created['entrants'].pop()}", {"headers": ctx.auth}
+
+
+# ------------------------
+# matches.py
+# ------------------------
+@route("GET /matches?event_id=")
+def _list_matches(ctx, i):
+    return f"/matches?event_id={ctx.event()}", {}
+
+
+@route("POST /matches", collect="matches")
+def _create_match(ctx, i):
+    event_id = ctx.event()
+    a, b = ctx.rng.sample(ctx.entrants[event_id], 2)
+    body = {"event_id": event_id, "round": 99, "entrant1_id": a, "entrant2_id": b}
+    return "/matches", {"json": body, "headers": ctx.auth}
+
+
+@route("POST /matches/bulk")
+def _bulk_matches(ctx, i):
+    event_id = ctx.event()
+    rows = []
+    for _ in range(10):
+        a, b = ctx.rng.sample(ctx.entrants[event_id], 2)
+        rows.append(
+            {"event_id": event_id, "round": 99, "entrant1_id": a, "entrant2_id": b}
+        )
+    return "/matches/bulk", {"json": rows, "headers": ctx.auth}
+
+
+@route("PUT /matches/<id>")
+def _report_match(ctx, i, flip=0):
+    match_id, a, b = ctx.decided[i % len(ctx.decided)]
+    body = {"winner_id": b, "scores": "1-2"} if (i + flip) % 2 else {"winner_id": a}
+    return f"/matches/{match_id}", {"json": body, "headers": ctx.auth}
+
+
+@route("PATCH /matches/<id>")
+def _patch_match(ctx, i):
+    # Flip each match's result so the patch isn't a no-op after PUT
+    return _report_match(ctx, i, flip=1)
+
+
+@route("POST /matches/bracket", limit=30)
+def _bracket(ctx, i):
+    body = {"event_id": ctx.fresh_event(), "format": "double"}
+    return "/matches/bracket", {"json": body, "headers": ctx.auth}
+
+
+@route("POST /matches/swiss", limit=30)
+def _swiss(ctx, i):
+    body = {"event_id": ctx.fresh_event()}
+    return "/matches/swiss", {"json": body, "headers": ctx.auth}
+
+
+@route("DELETE /matches/<id>")
+def _delete_match(ctx, i):
+    if ctx.created["matches"]:
+        return f"/matches/{ctx.created['matches'].pop()}", {"headers": ctx.auth}
+
+
+# ------------------------
+# Runner
+# ------------------------
+def run_route(client, ctx, spec, requests, queries):
+    latencies, counts, errors = [], [], []
+    total = min(requests, spec.limit or requests)
+    for i in range(total):
+        built = spec.build(ctx, i)
+        if built is None:
+            break
+        path, kwargs = built
+        queries[0] = 0
+        start = time.perf_counter()
+        resp = client.open(path, method=spec.method, **kwargs)
+        latencies.append((time.perf_counter() - start) * 1000)
+        counts.append(queries[0])
+        if resp.status_code >= 400:
+            errors.append(f"{resp.status_code} {resp.get_data(as_text=True)[:120]}")
+        elif spec.collect:
+            ctx.created[spec.collect].append(resp.get_json()["id"])
+    return summarize(latencies, counts, errors)
+
+
+def summarize(latencies, counts, errors):
+    if not latencies:
+        return {"requests": 0}
+    cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    pct = (lambda p: round(cuts[p - 1], 3)) if cuts else (lambda p: latencies[0])
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "p50_ms": pct(50),
+        "p95_ms": pct(95),
+        "p99_ms": pct(99),
+        "req_per_s": round(len(latencies) / (sum(latencies) / 1000), 1),
+        "queries_mean": round(statistics.fmean(counts), 2),
+        "queries_max": max(counts),
+    }
+
+
+def compare(results, baseline, tolerance, min_ms):
+    """Routes whose p95 grew beyond tolerance or that issue more queries."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get("routes", {}).get(name)
+        if not base or not base.get("requests") or not current.get("requests"):
+            continue
+        p95, base_p95 = current["p95_ms"], base["p95_ms"]
+        if p95 > base_p95 * (1 + tolerance) and p95 - base_p95 > min_ms:
+            regressions.append(f"{name}: p95 {base_p95} -> {p95} ms")
+        if current["queries_max"] > base["queries_max"]:
+            regressions.append(
+                f"{name}: queries {base['queries_max']} -> {current['queries_max']}"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API route load test")
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--entrants", type=int, default=64, help="mean per event")
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--requests", type=int, default=200, help="per route")
+    parser.add_argument("--only", help="substring filter on route names")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="default: throwaway SQLite file")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="disable response cache"
+    )
+    parser.add_argument("--save", help="write results as a JSON baseline")
+    parser.add_argument("--baseline", help="compare against a saved baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="p95 growth")
+    parser.add_argument("--min-ms", type=float, default=0.5, help="ignore smaller")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="bench_routes_")
+    url = args.database_url or f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = url
+        JWT_SECRET_KEY = "bench-secret-key-with-enough-bytes!"
+        LOG_LEVEL = "WARNING"
+
+    if args.no_cache:
+        BenchConfig.RESPONSE_CACHE_BACKEND = "none"
+
+    counts = write_seed_dir(
+        os.path.join(workdir, "seeds"),
+        args.events,
+        args.entrants,
+        args.rounds,
+        args.seed,
+    )
+    print(
+        f"🌱 {counts['events']} events, {counts['entrants']} entrants, "
+        f"{counts['matches']} matches"
+    )
+
+    app = create_app(BenchConfig)
+    queries = [0]
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        load_seed_dir(os.path.join(workdir, "seeds"))
+        db.session.commit()
+
+        def count(*_):
+            queries[0] += 1
+
+        sa_event.listen(db.engine, "before_cursor_execute", count)
+        dialect = db.engine.dialect.name
+
+    ctx = Context(app, random.Random(args.seed))
+    client = app.test_client()
+    results = {}
+    for spec in ROUTES:
+        if args.only and args.only not in spec.name:
+            continue
+        results[spec.name] = run_route(client, ctx, spec, args.requests, queries)
+
+    columns = ["requests", "errors", "p50_ms", "p95_ms", "p99_ms", "req_per_s"]
+    columns += ["queries_mean", "queries_max"]
+    print(f"\n{'route':34}" + "".join(f"{c:>13}" for c in columns))
+    for name, r in results.items():
+        print(f"{name:34}" + "".join(f"{str(r.get(c, '-')):>13}" for c in columns))
+        if r.get("first_error"):
+            print(f"    ❌ {r['first_error']}")
+
+    report = {
+        "meta": {
+            "events": args.events,
+            "entrants": args.entrants,
+            "rounds": args.rounds,
+            "requests": args.requests,
+            "rows": counts,
+            "dialect": dialect,
+            "response_cache": not args.no_cache,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+        },
+        "routes": results,
+    }
+    if args.save:
+        with open(args.save, "w") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"\n💾 Baseline written to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(results, baseline, args.tolerance, args.min_ms)
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+# File: backend/benchmarks/synthetic.py
+# Purpose: Generate realistic synthetic tournaments as seed files.
+# Notes:
+# - Writes events.json, entrants.json and matches.json in the same shape as
+#   backend/seeds, so `npm run db:seed -- --dir <out>` (or load_seed_dir)
+#   loads them with the bulk loader.
+# - Each event runs Swiss rounds: entrants are paired within score groups,
+#   an odd entrant out gets a BYE, and winners are drawn from a hidden skill
+#   rating so standings spread out the way real ones do. Some entrants drop
+#   between rounds.
+# - Status mix: completed events have every round decided, published ones
+#   are mid-event (last round unreported), drafting ones have no matches.
+# - Files are written incrementally; memory is bounded by one event.
+# - Run with: PYTHONPATH=. python -m backend.benchmarks.synthetic --out DIR
+
+import argparse
+import json
+import os
+import random
+from datetime import date, timedelta
+
+from backend.brackets import BYE_SCORE
+
+STATUS_WEIGHTS = {"completed": 5, "published": 3, "drafting": 1, "cancelled": 1}
+DROP_RATE = 0.03  # chance an entrant leaves after any round
+START_DATE = date(2025, 1, 1)
+
+
+class ArrayWriter:
+    """Write a JSON array one element at a time."""
+
+    def __init__(self, path):
+        self.fh = open(path, "w", encoding="utf-8")
+        self.fh.write("[")
+        self.count = 0
+
+    def write(self, item):
+        self.fh.write(",\n" if self.count else "\n")
+        self.fh.write(json.dumps(item))
+        self.count += 1
+
+    def close(self):
+        self.fh.write("\n]\n")
+        self.fh.close()
+
+
+def _play(rng, skill, a, b):
+    """Winner first, with a best-of-three score string in entrant1-entrant2 order."""
+    p_a = skill[a] / (skill[a] + skill[b])
+    winner = a if rng.random() < p_a else b
+    games = "2-0" if rng.random() < 0.55 else "2-1"
+    scores = games if winner == a else games[::-1]
+    return winner, scores
+
+
+def swiss_rounds(rng, entrant_ids, rounds, decided_rounds, skill, dropped):
+    """Yield (round, entrant1, entrant2, winner, scores) for one event.
+
+    Rounds after `decided_rounds` are paired but unreported (and end the
+    event). Entrants who drop out are added to `dropped`.
+    """
+    wins = dict.fromkeys(entrant_ids, 0)
+    active = list(entrant_ids)
+    for rnd in range(1, rounds + 1):
+        rng.shuffle(active)
+        active.sort(key=lambda e: -wins[e])  # pair within score groups
+        decided = rnd <= decided_rounds
+        if len(active) % 2:
+            bye = active.pop()
+            if decided:
+                wins[bye] += 1
+            yield rnd, bye, None, bye if decided else None, BYE_SCORE
+            active.append(bye)
+        for i in range(0, len(active) - 1, 2):
+            a, b = active[i], active[i + 1]
+            winner, scores = _play(rng, skill, a, b) if decided else (None, None)
+            if winner:
+                wins[winner] += 1
+            yield rnd, a, b, winner, scores
+        if not decided:
+            break
+        for e in list(active):
+            if len(active) > 2 and rng.random() < DROP_RATE:
+                active.remove(e)
+                dropped.add(e)
+
+
+def write_seed_dir(out, events, entrants, rounds, seed=42):
+    """Generate a dataset into `out`; returns row counts per file."""
+    os.makedirs(out, exist_ok=True)
+    rng = random.Random(seed)
+    writers = {
+        name: ArrayWriter(os.path.join(out, f"{name}.json"))
+        for name in ("events", "entrants", "matches")
+    }
+    statuses, weights = zip(*STATUS_WEIGHTS.items())
+    next_entrant = next_match = 1
+    try:
+        for event_id in range(1, events + 1):
+            status = rng.choices(statuses, weights)[0]
+            writers["events"].write(
+                {
+                    "id": event_id,
+                    "name": f"Synthetic Open {event_id}",
+                    "date": (START_DATE + timedelta(days=event_id)).isoformat(),
+                    "status": status,
+                }
+            )
+
+            size = max(2, int(rng.gauss(entrants, entrants * 0.15)))
+            ids = list(range(next_entrant, next_entrant + size))
+            next_entrant += size
+            skill = {e: rng.lognormvariate(0, 0.5) for e in ids}
+            dropped = set()
+
+            if status in ("completed", "published"):
+                decided = rounds if status == "completed" else rng.randrange(rounds)
+                for rnd, a, b, winner, scores in swiss_rounds(
+                    rng, ids, rounds, decided, skill, dropped
+                ):
+                    writers["matches"].write(
+                        {
+                            "id": next_match,
+                            "round": rnd,
+                            "event_id": event_id,
+                            "entrant1_id": a,
+                            "entrant2_id": b,
+                            "scores": scores,
+                            "winner_id": winner,
+                        }
+                    )
+                    next_match += 1
+
+            for e in ids:
+                writers["entrants"].write(
+                    {
+                        "id": e,
+                        "name": f"Hero {e}",
+                        "alias": f"h{e}" if e % 3 else None,
+                        "event_id": event_id,
+                        "dropped": e in dropped,
+                    }
+                )
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return {name: writer.count for name, writer in writers.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic tournament generator")
+    parser.add_argument("--out", required=True, help="directory for seed files")
+    parser.add_argument("--events", type=int, default=100)
+    parser.add_argument("--entrants", type=int, default=64, help="mean per event")
+    parser.add_argument("--rounds", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    counts = write_seed_dir(
+        args.out, args.events, args.entrants, args.rounds, args.seed
+    )
+    print(
+        f"✅ Wrote {counts['events']} events, {counts['entrants']} entrants, "
+        f"{counts['matches']} matches to {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,177 @@
 # File: backend/blocklist.py
-# Purpose: Global JWT blocklist for revoked tokens.
+# Purpose: JWT revocation store shared by app.py (token check) and auth.py (logout).
 # Notes:
-# - Shared between app.py and auth.py to avoid circular imports.
+# - Backends: "database" (revoked_tokens table, shared across workers and
+#   restarts) or "memory" (single process, handy for scripts).
+# - Entries are evicted once the token's own `exp` has passed; after that the
+#   JWT layer rejects the token anyway.
+# - A per-process LRU cache sits in front of the backend so the hot
+#   token_in_blocklist_loader check rarely touches the DB. Revocations are
+#   cached until expiry; "not revoked" answers only for a short TTL, which
+#   bounds how long another worker's logout can go unnoticed.
+# - The stores are shared by request threads; the memory store and the cache
+#   in front of any store take a lock (LRUCache itself is not thread-safe).
 
-jwt_blocklist = set()
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+from backend.database import db
+
+
+class LRUCache:
+    """Size-bounded LRU mapping with optional per-entry expiry (monotonic).
+
+    Not thread-safe: callers sharing one between threads hold a lock around it.
+    """
+
+    def __init__(self, maxsize=1024, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self.evictions = 0  # entries dropped to stay within maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        item = self._data.get(key)
+        if item is None:
+            return default
+        value, expires = item
+        if expires is not None and expires <= self.clock():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires = self.clock() + ttl if ttl is not None else None
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, key):
+        return self._data.pop(key, None) is not None
+
+    def keys(self):
+        return list(self._data)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class MemoryRevocationStore:
+    """In-process store: jti -> exp. Not shared between workers."""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self._revoked = {}
+        self._lock = threading.Lock()
+
+    def revoke(self, jti, expires_at):
+        with self._lock:
+            self._purge_expired()
+            self._revoked[jti] = expires_at
+
+    def is_revoked(self, jti):
+        with self._lock:
+            expires_at = self._revoked.get(jti)
+        return expires_at is not None and expires_at > self.clock()
+
+    def purge_expired(self):
+        with self._lock:
+            self._purge_expired()
+
+    def _purge_expired(self):
+        now = self.clock()
+        for jti in [j for j, exp in self._revoked.items() if exp <= now]:
+            del self._revoked[jti]
+
+
+class DatabaseRevocationStore:
+    """Store backed by the revoked_tokens table (shared, survives restarts)."""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+
+    def revoke(self, jti, expires_at):
+        from backend.models import RevokedToken  # avoid circular import
+
+        self.purge_expired()
+        db.session.merge(RevokedToken(jti=jti, expires_at=int(expires_at)))
+        db.session.commit()
+
+    def is_revoked(self, jti):
+        from backend.models import RevokedToken
+
+        token = db.session.get(RevokedToken, jti)
+        return token is not None and token.expires_at > self.clock()
+
+    def purge_expired(self):
+        from backend.models import RevokedToken
+
+        RevokedToken.query.filter(RevokedToken.expires_at <= self.clock()).delete(
+            synchronize_session=False
+        )
+
+
+class CachedRevocationStore:
+    """LRU cache in front of another store; safe to share between threads."""
+
+    def __init__(self, backend, maxsize=10_000, negative_ttl=2.0):
+        self.backend = backend
+        self.negative_ttl = negative_ttl
+        self.cache = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def revoke(self, jti, expires_at):
+        self.backend.revoke(jti, expires_at)
+        with self._lock:
+            self.cache.set(jti, True)
+
+    def is_revoked(self, jti):
+        with self._lock:
+            cached = self.cache.get(jti)
+        if cached is not None:
+            return cached
+        # Backend lookup runs unlocked so a DB round trip doesn't serialize requests
+        revoked = self.backend.is_revoked(jti)
+        with self._lock:
+            if not revoked and self.cache.get(jti):
+                return True  # revoked by a concurrent logout meanwhile
+            self.cache.set(jti, revoked, ttl=None if revoked else self.negative_ttl)
+        return revoked
+
+    def purge_expired(self):
+        self.backend.purge_expired()
+
+
+BACKENDS = {
+    "database": DatabaseRevocationStore,
+    "memory": MemoryRevocationStore,
+}
+
+
+def init_revocation_store(app):
+    """Build the store named by JWT_REVOCATION_BACKEND and attach it to app."""
+    backend_name = app.config.get("JWT_REVOCATION_BACKEND", "database")
+    try:
+        backend = BACKENDS[backend_name]()
+    except KeyError:
+        raise ValueError(f"Unknown JWT_REVOCATION_BACKEND: {backend_name!r}")
+    store = CachedRevocationStore(
+        backend,
+        maxsize=app.config.get("JWT_REVOCATION_CACHE_SIZE", 10_000),
+        negative_ttl=app.config.get("JWT_REVOCATION_NEGATIVE_TTL", 2.0),
+    )
+    app.extensions["revocation_store"] = store
+    return store
+
+
+def get_revocation_store():
+    return current_app.extensions["revocation_store"]
@@ -0,0 +1,312 @@
+# File: backend/brackets.py
+# Purpose: Single/double elimination bracket generation and winner advancement.
+# Notes:
+# - Brackets are built in memory from an event's active (non-dropped) entrants,
+#   padded with BYEs to the next power of two using standard seed order
+#   (1v8, 4v5, 2v7, 3v6, ...), then inserted with one bulk INSERT.
+# - Each bracket match links to the match its winner (next_match_*) and, in
+#   double elimination, its loser (loser_match_*) advance to. Slots are 1/2.
+# - Walkovers (a slot that can never be filled) resolve automatically, with
+#   scores set to BYE_SCORE; this happens at generation time for first-round
+#   BYEs and at runtime when a result leaves a downstream slot empty.
+# - advance_matches() propagates results reported together (POST
+#   /events/<id>/results) without them looking like walkovers to each other.
+# - Double elimination ends in a single grand final (no bracket reset).
+# - Automatic BYE/walkover wins are recorded in standings like any result.
+
+import random
+
+from sqlalchemy import insert, or_
+
+from backend.models import db, Entrant, Event, Match
+from backend.scores import BYE_SCORE
+from backend.standings import record_change, snapshot
+
+WINNERS = "winners"
+LOSERS = "losers"
+GRAND_FINAL = "grand_final"
+FORMATS = ("single", "double")
+
+_PENDING = object()  # slot whose feeder match hasn't been decided yet
+
+
+class BracketError(ValueError):
+    """Invalid bracket request or advancement; status is the HTTP code."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def seed_order(size):
+    """Standard bracket seed order for a power-of-two size.
+
+    seed_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]; consecutive pairs meet in
+    round one, and the top seeds can only meet in the final.
+    """
+    order = [1]
+    while len(order) < size:
+        total = len(order) * 2 + 1
+        order = [s for seed in order for s in (seed, total - seed)]
+    return order
+
+
+def _new_node(bracket, round_num, position):
+    return {
+        "key": (bracket, round_num, position),
+        "slots": [_PENDING, _PENDING],
+        "next": None,  # (key, slot) for the winner
+        "loser": None,  # (key, slot) for the loser
+        "winner": None,
+        "bye": False,
+    }
+
+
+def build_bracket(entrant_ids, fmt="single"):
+    """Return bracket nodes in dependency order for the seeded entrant_ids.
+
+    entrant_ids[0] is the top seed. Each node has "key" (bracket, round,
+    position), "slots" (entrant ids, None for BYE), winner/loser links and
+    pre-resolved walkovers.
+    """
+    if fmt not in FORMATS:
+        raise BracketError(f"Unknown bracket format: {fmt!r}")
+    if len(entrant_ids) < 2:
+        raise BracketError("At least two active entrants are required")
+
+    size = 1
+    while size < len(entrant_ids):
+        size *= 2
+    rounds = size.bit_length() - 1
+    double = fmt == "double"
+
+    nodes = {}
+    ordered = []
+
+    def add(bracket, round_num, position):
+        node = _new_node(bracket, round_num, position)
+        nodes[node["key"]] = node
+        ordered.append(node)
+        return node
+
+    # Winners bracket
+    for r in range(1, rounds + 1):
+        count = size >> r
+        for p in range(count):
+            node = add(WINNERS, r, p)
+            if r < rounds:
+                node["next"] = ((WINNERS, r + 1, p // 2), p % 2)
+            elif double:
+                node["next"] = ((GRAND_FINAL, rounds + 1, 0), 0)
+            if not double:
+                continue
+            if r == 1 and rounds > 1:
+                node["loser"] = ((LOSERS, 1, p // 2), p % 2)
+            elif r == 1:
+                node["loser"] = ((GRAND_FINAL, rounds + 1, 0), 1)
+            else:
+                # Alternate drop order to delay rematches from the winners side
+                q = count - 1 - p if r % 2 == 0 else p
+                node["loser"] = ((LOSERS, 2 * (r - 1), q), 1)
+
+    # Losers bracket: odd rounds halve the field, even rounds take WB drop-ins
+    if double:
+        last = 2 * (rounds - 1)
+        for k in range(1, last + 1):
+            count = size >> ((k + 1) // 2 + 1)
+            for p in range(count):
+                node = add(LOSERS, k, p)
+                if k == last:
+                    node["next"] = ((GRAND_FINAL, rounds + 1, 0), 1)
+                elif k % 2 == 1:
+                    node["next"] = ((LOSERS, k + 1, p), 0)
+                else:
+                    node["next"] = ((LOSERS, k + 1, p // 2), p % 2)
+        add(GRAND_FINAL, rounds + 1, 0)
+
+    # Seed round one; slots past the field are BYEs
+    seeds = seed_order(size)
+    for p in range(size // 2):
+        node = nodes[(WINNERS, 1, p)]
+        for slot in (0, 1):
+            seed = seeds[2 * p + slot]
+            node["slots"][slot] = (
+                entrant_ids[seed - 1] if seed <= len(entrant_ids) else None
+            )
+
+    # Resolve walkovers in dependency order (single pass suffices)
+    for node in ordered:
+        if _PENDING in node["slots"]:
+            continue
+        a, b = node["slots"]
+        if a is not None and b is not None:
+            continue
+        node["winner"] = a if a is not None else b
+        node["bye"] = True
+        for link, value in ((node["next"], node["winner"]), (node["loser"], None)):
+            if link:
+                key, slot = link
+                nodes[key]["slots"][slot] = value
+
+    return ordered
+
+
+def seeded_entrant_ids(event_id, seeds=None, shuffle=False):
+    """Active entrant ids for event in seed order.
+
+    Explicit seeds come first (must be active entrants of the event); the rest
+    follow in registration order, or shuffled when shuffle is true.
+    """
+    active = [
+        row.id
+        for row in db.session.query(Entrant.id)
+        .filter_by(event_id=event_id, dropped=False)
+        .order_by(Entrant.id)
+    ]
+    seeds = [int(s) for s in (seeds or [])]
+    active_set = set(active)
+    if len(set(seeds)) != len(seeds) or not set(seeds) <= active_set:
+        raise BracketError("Seeds must be distinct active entrants of the event")
+
+    rest = [eid for eid in active if eid not in set(seeds)]
+    if shuffle:
+        random.shuffle(rest)
+    return seeds + rest
+
+
+def generate_bracket(event_id, fmt="single", seeds=None, shuffle=False):
+    """Create the full bracket for an event. Caller commits.
+
+    Returns the inserted Match objects in bracket order.
+    """
+    if db.session.get(Event, event_id) is None:
+        raise BracketError("Event not found", status=404)
+    existing = Match.query.filter(
+        Match.event_id == event_id,
+        Match.bracket.in_((WINNERS, LOSERS, GRAND_FINAL)),
+    ).first()
+    if existing is not None:
+        raise BracketError("Event already has a bracket", status=409)
+
+    nodes = build_bracket(seeded_entrant_ids(event_id, seeds, shuffle), fmt)
+    rows = [
+        {
+            "event_id": event_id,
+            "bracket": node["key"][0],
+            "round": node["key"][1],
+            "position": node["key"][2],
+            "entrant1_id": _slot_value(node["slots"][0]),
+            "entrant2_id": _slot_value(node["slots"][1]),
+            "winner_id": node["winner"],
+            "scores": BYE_SCORE if node["bye"] else None,
+        }
+        for node in nodes
+    ]
+    # RETURNING order isn't guaranteed for multi-row inserts (and asking for
+    # it makes SQLite insert row by row), so match rows back up by key.
+    inserted = db.session.scalars(insert(Match).returning(Match), rows).all()
+    by_key = {(m.bracket, m.round, m.position): m for m in inserted}
+    matches = [by_key[node["key"]] for node in nodes]
+
+    for match in matches:
+        if match.winner_id is not None:
+            record_change(None, snapshot(match))
+
+    ids = {key: m.id for key, m in by_key.items()}
+    for node, match in zip(nodes, matches):
+        if node["next"]:
+            match.next_match_id = ids[node["next"][0]]
+            match.next_match_slot = node["next"][1] + 1
+        if node["loser"]:
+            match.loser_match_id = ids[node["loser"][0]]
+            match.loser_match_slot = node["loser"][1] + 1
+    return matches
+
+
+def _slot_value(value):
+    return None if value is _PENDING else value
+
+
+def _slot_attr(slot):
+    return "entrant1_id" if slot == 1 else "entrant2_id"
+
+
+def is_decided(match):
+    return match.winner_id is not None or match.scores == BYE_SCORE
+
+
+def advance_match(match):
+    """Propagate match's result into its linked matches. Caller commits.
+
+    Clearing a winner clears the downstream slots again, as long as those
+    matches haven't been decided themselves.
+    """
+    advance_matches([match])
+
+
+def advance_matches(matches):
+    """advance_match() for results reported together. Caller commits.
+
+    Fill every target slot before checking walkovers, since one match can
+    feed both slots of the same target (2-entrant double elimination), and
+    results decided in the same batch mustn't look like byes to each other.
+    """
+    targets = []
+    for match in matches:
+        entrants = (match.entrant1_id, match.entrant2_id)
+        if match.winner_id is not None and match.winner_id not in entrants:
+            raise BracketError("Winner ID must match one of the entrants")
+
+        loser = None
+        if match.winner_id is not None and None not in entrants:
+            loser = entrants[1] if match.winner_id == entrants[0] else entrants[0]
+        targets.append(
+            _deliver(match.next_match_id, match.next_match_slot, match.winner_id)
+        )
+        targets.append(_deliver(match.loser_match_id, match.loser_match_slot, loser))
+    for target in targets:
+        if target is not None:
+            _resolve_walkover(target)
+
+
+def _deliver(target_id, slot, value):
+    """Place value in the target's slot; return the target if still open."""
+    if target_id is None:
+        return None
+    target = db.session.get(Match, target_id)
+    attr = _slot_attr(slot)
+    if is_decided(target):
+        if getattr(target, attr) != value:
+            raise BracketError(
+                f"Match {target.id} is already decided; clear it first", status=409
+            )
+        return None
+    setattr(target, attr, value)
+    return target
+
+
+def _resolve_walkover(match):
+    """Auto-advance match if one slot is filled and the other never will be."""
+    if is_decided(match):
+        return
+    if match.entrant1_id is not None and match.entrant2_id is not None:
+        return
+
+    feeders = Match.query.filter(
+        or_(Match.next_match_id == match.id, Match.loser_match_id == match.id)
+    ).all()
+    for slot in (1, 2):
+        if getattr(match, _slot_attr(slot)) is not None:
+            continue
+        for f in feeders:
+            feeds_slot = (
+                f.next_match_id == match.id and f.next_match_slot == slot
+            ) or (f.loser_match_id == match.id and f.loser_match_slot == slot)
+            if feeds_slot and not is_decided(f):
+                return
+
+    before = snapshot(match)
+    match.winner_id = match.entrant1_id or match.entrant2_id
+    match.scores = BYE_SCORE
+    record_change(before, snapshot(match))
+    advance_match(match)
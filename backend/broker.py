@@ -0,0 +1,180 @@
+# File: backend/broker.py
+# Purpose: Fan-out of event change messages to Server-Sent Events subscribers.
+# Notes:
+# - Channels are event ids. Write routes publish after committing, so
+#   subscribers never see changes that were rolled back.
+# - "memory" fans out within one process. Multi-worker deployments need a
+#   shared broker with the same publish/subscribe/unsubscribe interface
+#   (e.g. Redis pub/sub), registered in BACKENDS.
+# - Each channel keeps its last few messages so reconnecting clients can
+#   resume from Last-Event-ID without missing updates.
+# - A subscriber that falls too far behind is dropped; its stream ends and
+#   the browser's EventSource reconnects (and replays from history).
+# - subscribe() returns a thread queue (WSGI streams); subscribe_async() an
+#   AsyncSubscription fed thread-safely into the running event loop (ASGI).
+
+import asyncio
+import itertools
+import json
+import queue
+import threading
+from collections import defaultdict, deque, namedtuple
+from contextlib import contextmanager
+
+from flask import current_app
+from sqlalchemy import event as sa_event
+
+from backend.database import db
+
+Message = namedtuple("Message", "id kind data")
+
+SUBSCRIBER_QUEUE_SIZE = 256
+CLOSED = object()  # queued to a subscriber that has been dropped
+
+
+class AsyncSubscription:
+    """Subscriber queue living on an asyncio loop; publish() may run in any
+    thread (e.g. a WSGI worker thread under the ASGI adapter)."""
+
+    def __init__(self, maxsize=SUBSCRIBER_QUEUE_SIZE):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self.maxsize = maxsize
+
+    def put_nowait(self, message):
+        if self.queue.qsize() >= self.maxsize:
+            raise queue.Full
+        try:
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, message)
+        except RuntimeError:  # loop already closed
+            raise queue.Full
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        try:
+            self.loop.call_soon_threadsafe(self._close)
+        except RuntimeError:
+            pass
+
+    def _close(self):
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(CLOSED)
+
+
+class MemoryBroker:
+    """In-process broker: one bounded queue per subscriber."""
+
+    def __init__(self, history=100):
+        self.history = history
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._subscribers = defaultdict(set)
+        self._recent = defaultdict(lambda: deque(maxlen=self.history))
+
+    def publish(self, channel, kind, data):
+        with self._lock:
+            message = Message(next(self._ids), kind, data)
+            self._recent[channel].append(message)
+            subscribers = list(self._subscribers[channel])
+        for q in subscribers:
+            try:
+                q.put_nowait(message)
+            except queue.Full:
+                self._drop(channel, q)
+        return message
+
+    def subscribe(self, channel, last_event_id=None):
+        """Return a queue of Messages, pre-filled with any missed history."""
+        return self._attach(
+            channel, queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE), last_event_id
+        )
+
+    def subscribe_async(self, channel, last_event_id=None):
+        """Like subscribe(), for a coroutine on the running event loop."""
+        return self._attach(channel, AsyncSubscription(), last_event_id)
+
+    def _attach(self, channel, q, last_event_id):
+        with self._lock:
+            if last_event_id is not None:
+                for message in self._recent[channel]:
+                    if message.id > last_event_id:
+                        q.put_nowait(message)
+            self._subscribers[channel].add(q)
+        return q
+
+    def unsubscribe(self, channel, q):
+        with self._lock:
+            self._subscribers[channel].discard(q)
+            if not self._subscribers[channel]:
+                del self._subscribers[channel]
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+    def _drop(self, channel, q):
+        self.unsubscribe(channel, q)
+        if isinstance(q, AsyncSubscription):
+            q.close()
+            return
+        with q.mutex:
+            q.queue.clear()
+        q.put_nowait(CLOSED)
+
+
+BACKENDS = {
+    "memory": MemoryBroker,
+}
+
+
+def init_broker(app):
+    """Build the broker named by EVENT_STREAM_BACKEND and attach it to app."""
+    backend_name = app.config.get("EVENT_STREAM_BACKEND", "memory")
+    try:
+        broker = BACKENDS[backend_name](app.config.get("EVENT_STREAM_HISTORY", 100))
+    except KeyError:
+        raise ValueError(f"Unknown EVENT_STREAM_BACKEND: {backend_name!r}")
+    app.extensions["broker"] = broker
+    return broker
+
+
+def get_broker():
+    return current_app.extensions["broker"]
+
+
+def publish(event_id, kind, data):
+    """Publish a change for an event's subscribers (call after commit)."""
+    broker = current_app.extensions.get("broker")
+    if broker is not None:
+        broker.publish(event_id, kind, data)
+
+
+@contextmanager
+def track_changes(model):
+    """Collect every `model` instance inserted or updated by flushes inside
+    the block (including the final commit), keyed by identity.
+
+    Used to publish rows changed indirectly, e.g. bracket advancement.
+    """
+    session = db.session()
+    touched = {}
+
+    def collect(sess, flush_context):
+        for obj in itertools.chain(sess.new, sess.dirty):
+            if isinstance(obj, model):
+                touched[id(obj)] = obj
+
+    sa_event.listen(session, "after_flush", collect)
+    try:
+        yield touched
+    finally:
+        sa_event.remove(session, "after_flush", collect)
+
+
+def format_sse(message):
+    """Encode a Message as one SSE frame."""
+    payload = json.dumps(message.data, separators=(",", ":"))
+    return f"id: {message.id}\nevent: {message.kind}\ndata: {payload}\n\n"
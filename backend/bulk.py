@@ -0,0 +1,61 @@
+# File: backend/bulk.py
+# Purpose: Shared request handling for bulk create/update endpoints.
+# Notes:
+# - Bulk bodies are a JSON array of row objects (or {"items": [...]}).
+# - Rows are validated together; any invalid row rejects the whole batch with
+#   per-row errors, so a batch is either fully inserted or not at all.
+
+from collections import defaultdict, deque
+
+from flask import jsonify, request
+
+MAX_BULK_ROWS = 5000
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+IN_CHUNK = 500
+
+
+class BulkError(ValueError):
+    """Malformed bulk request body (maps to 400)."""
+
+
+def bulk_items():
+    """Return the list of row dicts from the request body."""
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("items")
+    if not isinstance(data, list) or not data:
+        raise BulkError("Expected a non-empty JSON array of objects")
+    if len(data) > MAX_BULK_ROWS:
+        raise BulkError(f"At most {MAX_BULK_ROWS} rows per request")
+    if not all(isinstance(item, dict) for item in data):
+        raise BulkError("Every row must be a JSON object")
+    return data
+
+
+def row_errors_response(errors, action="created", status=400):
+    """Error response (400 by default) listing [{"index": i, "error": message}]."""
+    return (
+        jsonify(error=f"{len(errors)} invalid row(s); nothing {action}", errors=errors),
+        status,
+    )
+
+
+def chunks(ids):
+    """Sorted ids in IN-list sized slices."""
+    ids = sorted(ids)
+    for start in range(0, len(ids), IN_CHUNK):
+        yield ids[start : start + IN_CHUNK]
+
+
+def in_row_order(rows, objects):
+    """Line up objects from a multi-row INSERT ... RETURNING with their rows.
+
+    RETURNING order isn't guaranteed (and asking for it makes SQLite insert row
+    by row), so objects are matched on the values that were inserted. Rows with
+    identical values are interchangeable, so ties take objects in id order.
+    """
+    keys = list(rows[0])
+    pending = defaultdict(deque)
+    for obj in sorted(objects, key=lambda obj: obj.id):
+        pending[tuple(getattr(obj, key) for key in keys)].append(obj)
+    return [pending[tuple(row[key] for key in keys)].popleft() for row in rows]
@@ -8,6 +8,9 @@ import os
 from dotenv import load_dotenv
 from datetime import timedelta
 
+from backend.database import SQLITE_PRAGMAS, engine_options
+from backend.logging_setup import DEFAULT_REDACT_KEYS
+
 load_dotenv()
 
 
@@ -25,13 +28,81 @@ class Config:
     JWT_ALGORITHM = "HS256"
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(minutes=15)
 
+    # JWT revocation store (see backend/blocklist.py)
+    JWT_REVOCATION_BACKEND = os.getenv("JWT_REVOCATION_BACKEND", "database")
+    JWT_REVOCATION_CACHE_SIZE = 10_000
+    JWT_REVOCATION_NEGATIVE_TTL = 2.0  # seconds a "not revoked" answer is cached
+
+    # Password hashing (see backend/passwords.py); changing the method
+    # rehashes each user's password on their next login
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt")
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+    PASSWORD_HASH_MAX_PENDING = 64  # queued + running hashes before 503
+    PASSWORD_HASH_TIMEOUT = 5.0  # seconds a request waits for its hash
+
+    # Server-side response cache (see backend/response_cache.py)
+    RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+    RESPONSE_CACHE_SIZE = 1024  # cached bodies per process
+    RESPONSE_CACHE_TTL = 30.0  # seconds; versions already guard freshness
+
+    # Server-Sent Events (see backend/broker.py)
+    EVENT_STREAM_BACKEND = os.getenv("EVENT_STREAM_BACKEND", "memory")
+    EVENT_STREAM_HISTORY = 100  # recent messages kept per event for Last-Event-ID
+    EVENT_STREAM_KEEPALIVE = 15.0  # seconds between keepalive comments
+
+    # Per-request instrumentation (see backend/metrics.py)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1") == "1"  # /metrics + hooks
+    METRICS_SERVER_TIMING = os.getenv("SERVER_TIMING", "1") == "1"
+
+    # Logging (see backend/logging_setup.py)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG")
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # "text" or "json"
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1.0"))
+    LOG_QUEUE_SIZE = 10_000  # records buffered before new ones are dropped
+    LOG_REDACT_KEYS = DEFAULT_REDACT_KEYS
+
+    # ASGI serving mode (see backend/asgi.py); defaults to the async driver
+    # for SQLALCHEMY_DATABASE_URI (aiosqlite / asyncpg)
+    ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
     # CORS / other app configs
     FRONTEND_URL = os.getenv("REACT_APP_API_URL", "http://localhost:3000")
 
 
+class ProductionConfig(Config):
+    """Served by backend/wsgi.py (gunicorn); pool sized from the worker env."""
+
+    DEBUG = False
+    PROPAGATE_EXCEPTIONS = False
+
+    # Must match the server's worker/thread counts (see backend/gunicorn.conf.py)
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "4"))
+    WEB_THREADS = int(os.getenv("WEB_THREADS", "8"))
+
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options(
+        Config.SQLALCHEMY_DATABASE_URI,
+        workers=WEB_CONCURRENCY,
+        threads=WEB_THREADS,
+        max_connections=int(os.getenv("DB_MAX_CONNECTIONS", "100")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        statement_timeout_ms=int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "5000")),
+    )
+    SQLITE_PRAGMAS = SQLITE_PRAGMAS
+
+    # Timing headers reveal backend detail to clients; opt in with SERVER_TIMING=1
+    METRICS_SERVER_TIMING = os.getenv("SERVER_TIMING", "0") == "1"
+
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))
+
+
 class TestConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     SQLALCHEMY_ENGINE_OPTIONS = {"connect_args": {"check_same_thread": False}}
     JWT_SECRET_KEY = "test-secret"
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(seconds=1)
+    LOG_LEVEL = "WARNING"
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1000"  # fast hashes for tests
@@ -1,9 +1,77 @@
 # backend/database.py
+# Notes:
+# - engine_options() sizes the SQLAlchemy pool per worker process so that
+#   workers * (pool_size + max_overflow) stays within the database's budget.
+# - apply_sqlite_pragmas() enables WAL and friends on every new SQLite
+#   connection; other dialects are left untouched.
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event as sa_event
+from sqlalchemy.engine import make_url
 
 db = SQLAlchemy()
 Base = db.Model
 
+# Applied to every SQLite connection in production (see ProductionConfig)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",  # readers don't block the writer
+    "synchronous": "NORMAL",  # safe with WAL, far fewer fsyncs
+    "busy_timeout": 5000,  # ms to wait on a locked DB instead of failing
+    "temp_store": "MEMORY",
+}
+
 
 def init_db():
     db.create_all()
+
+
+def engine_options(
+    url,
+    workers=1,
+    threads=1,
+    max_connections=100,
+    pool_recycle=1800,
+    pool_timeout=10,
+    statement_timeout_ms=None,
+):
+    """SQLALCHEMY_ENGINE_OPTIONS for one worker process.
+
+    Each worker gets a pool of `threads` connections (one per request thread)
+    plus overflow, shrunk if needed so that all workers together never open
+    more than max_connections. Statement timeouts are applied on PostgreSQL.
+    """
+    url = make_url(url)
+    options = {"pool_pre_ping": True}
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            return options  # single shared connection; no pool to size
+        # One writer at a time: a small pool avoids piling up on the lock
+        options.update(pool_size=max(1, threads), max_overflow=0)
+        return options
+
+    per_worker = max(1, max_connections // max(1, workers))
+    pool_size = max(1, min(threads, per_worker))
+    options.update(
+        pool_size=pool_size,
+        max_overflow=max(0, per_worker - pool_size),
+        pool_recycle=pool_recycle,
+        pool_timeout=pool_timeout,
+    )
+    if statement_timeout_ms and url.get_backend_name() == "postgresql":
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={int(statement_timeout_ms)}"
+        }
+    return options
+
+
+def apply_sqlite_pragmas(engine, pragmas):
+    """Run PRAGMA statements on each new connection of a SQLite engine."""
+    if engine.dialect.name != "sqlite" or not pragmas:
+        return
+
+    @sa_event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
@@ -0,0 +1,110 @@
+# File: backend/drops.py
+# Purpose: Set-based entrant removal (DELETE /entrants/<id> and the bulk
+#          POST /events/<id>/entrants/drop used to clear no-shows).
+# Notes:
+# - "In a match" is three EXISTS probes, one per ix_matches_entrant1_id /
+#   entrant2_id / winner_id index, instead of COUNT(*) over an OR that has to
+#   scan matches.
+# - Entrants that never played are deleted with one
+#   DELETE ... WHERE NOT EXISTS (...) RETURNING id; the rest (or, with
+#   delete_unplayed=False, all of them) are soft-deleted with one UPDATE, like
+#   Entrant.soft_delete(). The EXISTS guard sits in the DELETE itself, so an
+#   entrant paired in the meantime is dropped instead of failing the batch.
+# - Both are Core statements: event counts are adjusted here and row versions
+#   bumped in the UPDATE, whose RETURNING supplies the versions reported back;
+#   the caller bumps the event version and commits.
+
+from sqlalchemy import delete, exists, or_, select, update
+
+from backend.bulk import chunks
+from backend.entrant_counts import adjust_entrant_counts
+from backend.models import db, Entrant, Match
+from backend.standings import delete_standings
+
+DROPPED_NAME = "Dropped"
+
+
+def in_matches(entrant_id):
+    """SQL condition: the entrant (id value or column) appears in any match."""
+    return or_(
+        *(
+            exists().where(column == entrant_id)
+            for column in (Match.entrant1_id, Match.entrant2_id, Match.winner_id)
+        )
+    )
+
+
+def has_matches(entrant_id):
+    """True if the entrant is in any match; stops at the first index hit."""
+    return db.session.scalar(select(in_matches(entrant_id)))
+
+
+def drop_entrants(event_id, entrant_ids, delete_unplayed=True):
+    """Remove many of an event's entrants; caller bumps versions and commits.
+
+    Raises ValueError naming ids that aren't entrants of the event. Returns
+    (deleted ids, dropped entrant dicts); already-dropped entrants that stay
+    are left alone.
+    """
+    ids = set(entrant_ids)
+    current = {}
+    for chunk in chunks(ids):
+        query = select(Entrant.id, Entrant.dropped).where(
+            Entrant.event_id == event_id, Entrant.id.in_(chunk)
+        )
+        current.update((row.id, row) for row in db.session.execute(query))
+    missing = sorted(ids - set(current))
+    if missing:
+        listed = ", ".join(str(i) for i in missing[:10])
+        raise ValueError(f"Not entrants of event {event_id}: {listed}")
+
+    deleted = []
+    if delete_unplayed:
+        for chunk in chunks(ids):
+            deleted.extend(
+                db.session.scalars(
+                    delete(Entrant)
+                    .where(
+                        Entrant.event_id == event_id,
+                        Entrant.id.in_(chunk),
+                        ~in_matches(Entrant.id),
+                    )
+                    .returning(Entrant.id)
+                    .execution_options(synchronize_session="fetch")
+                )
+            )
+    for chunk in chunks(deleted):
+        delete_standings(chunk)
+    to_drop = sorted(i for i in ids - set(deleted) if not current[i].dropped)
+    versions = {}
+    for chunk in chunks(to_drop):
+        versions.update(
+            db.session.execute(
+                update(Entrant)
+                .where(Entrant.id.in_(chunk), Entrant.dropped.is_(False))
+                .values(
+                    name=DROPPED_NAME,
+                    alias=None,
+                    dropped=True,
+                    version=Entrant.version + 1,
+                )
+                .returning(Entrant.id, Entrant.version)
+                .execution_options(synchronize_session=False)
+            ).all()
+        )
+
+    if deleted or versions:
+        was_active = sum(not current[i].dropped for i in deleted)
+        adjust_entrant_counts({event_id: [-len(deleted), -was_active - len(versions)]})
+    dropped = [
+        {
+            "id": i,
+            "name": DROPPED_NAME,
+            "alias": None,
+            "event_id": event_id,
+            "dropped": True,
+            "version": versions[i],
+        }
+        for i in sorted(versions)
+    ]
+    return sorted(deleted), dropped
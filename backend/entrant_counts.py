@@ -0,0 +1,176 @@
+# File: backend/entrant_counts.py
+# Purpose: Keep Event.entrant_count / active_entrant_count in step with the
+#          entrants table, plus a consistency check and repair.
+# Notes:
+# - A before_flush hook turns every ORM insert, delete, move (event_id
+#   change) and drop/undrop of an Entrant into per-event deltas and applies
+#   them with one UPDATE per flush, in the same transaction as the write. So
+#   create/update/delete_entrant, soft_delete() and fixtures need no calls.
+# - Core writes (insert(Entrant) in POST /entrants/bulk, the seed loader,
+#   PATCH /entrants/<id>) bypass the ORM flush and call
+#   adjust_entrant_counts() / repair_entrant_counts() themselves.
+# - Entrants of a brand-new Event (no id yet) update the object's attributes
+#   instead; events being deleted are skipped.
+# - Counts are applied as relative increments, so concurrent writers can't
+#   lose each other's updates.
+
+from collections import defaultdict
+
+from sqlalchemy import case, event as sa_event, func, inspect, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.util import identity_key
+
+from backend.models import db, Entrant, Event
+
+COUNT_COLUMNS = ("entrant_count", "active_entrant_count")
+
+
+def _before(entrant):
+    """(event_id, dropped) as stored, before the pending change."""
+    state = inspect(entrant)
+    old = {}
+    for name in ("event_id", "dropped"):
+        history = state.attrs[name].history
+        old[name] = history.deleted[0] if history.deleted else getattr(entrant, name)
+    return old["event_id"], bool(old["dropped"])
+
+
+def _after(entrant):
+    event_id = entrant.event_id
+    if event_id is None and entrant.event is not None:
+        event_id = entrant.event.id or entrant.event
+    return event_id, bool(entrant.dropped)
+
+
+def _add(deltas, key, sign, dropped):
+    if key is None:
+        return
+    deltas[key][0] += sign
+    if not dropped:
+        deltas[key][1] += sign
+
+
+def collect_deltas(session):
+    """{event_id or new Event: [d_total, d_active]} for pending entrant changes."""
+    deltas = defaultdict(lambda: [0, 0])
+    for obj in session.new:
+        if isinstance(obj, Entrant):
+            event_id, dropped = _after(obj)
+            _add(deltas, event_id, 1, dropped)
+    for obj in session.deleted:
+        if isinstance(obj, Entrant):
+            event_id, dropped = _before(obj)
+            _add(deltas, event_id, -1, dropped)
+    for obj in session.dirty:
+        if isinstance(obj, Entrant) and session.is_modified(obj):
+            before, after = _before(obj), _after(obj)
+            if before != after:
+                _add(deltas, before[0], -1, before[1])
+                _add(deltas, after[0], 1, after[1])
+    return {k: v for k, v in deltas.items() if v != [0, 0]}
+
+
+def move_deltas(before, after):
+    """Deltas for one entrant going from (event_id, dropped) before to after."""
+    deltas = defaultdict(lambda: [0, 0])
+    _add(deltas, before[0], -1, bool(before[1]))
+    _add(deltas, after[0], 1, bool(after[1]))
+    return {k: v for k, v in deltas.items() if v != [0, 0]}
+
+
+def adjust_entrant_counts(deltas, session=None):
+    """Apply {event_id: (d_total, d_active)} in one UPDATE; caller commits."""
+    session = session or db.session
+    if not deltas:
+        return
+    ids = sorted(deltas)
+
+    def shift(column, index):
+        whens = {i: deltas[i][index] for i in ids if deltas[i][index]}
+        if not whens:
+            return column
+        return column + case(whens, value=Event.id, else_=0)
+
+    session.execute(
+        update(Event)
+        .where(Event.id.in_(ids))
+        .values(
+            entrant_count=shift(Event.entrant_count, 0),
+            active_entrant_count=shift(Event.active_entrant_count, 1),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+@sa_event.listens_for(Entrant.event_id, "set", active_history=True)
+@sa_event.listens_for(Entrant.dropped, "set", active_history=True)
+def _keep_previous(target, value, oldvalue, initiator):
+    """No-op; active_history loads the old value of an expired attribute on
+    set, so _before() still sees it."""
+
+
+@sa_event.listens_for(Session, "before_flush")
+def _track_entrant_counts(session, flush_context, instances):
+    deltas = collect_deltas(session)
+    if not deltas:
+        return
+    persisted = {}
+    for key, (d_total, d_active) in deltas.items():
+        if isinstance(key, Event):
+            # New event: nothing to UPDATE yet, count on the object
+            key.entrant_count = (key.entrant_count or 0) + d_total
+            key.active_entrant_count = (key.active_entrant_count or 0) + d_active
+            continue
+        loaded = session.identity_map.get(identity_key(Event, key))
+        if loaded is not None and loaded in session.deleted:
+            continue
+        persisted[key] = (d_total, d_active)
+        if loaded is not None:
+            session.expire(loaded, list(COUNT_COLUMNS))
+    adjust_entrant_counts(persisted, session)
+
+
+def actual_counts(event_ids=None):
+    """{event_id: (entrant_count, active_entrant_count)} counted from entrants."""
+    query = select(
+        Entrant.event_id,
+        func.count(Entrant.id),
+        func.sum(case((Entrant.dropped.is_(False), 1), else_=0)),
+    ).group_by(Entrant.event_id)
+    if event_ids is not None:
+        query = query.where(Entrant.event_id.in_(event_ids))
+    return {
+        event_id: (total, int(active or 0))
+        for event_id, total, active in db.session.execute(query)
+    }
+
+
+def check_entrant_counts(fix=False):
+    """List events whose stored counts disagree with their entrants.
+
+    Returns [(event_id, stored, actual)]; with fix=True the stored counts are
+    corrected in the current transaction (caller commits).
+    """
+    actual = actual_counts()
+    stored = db.session.execute(
+        select(Event.id, Event.entrant_count, Event.active_entrant_count)
+    )
+    mismatches = [
+        (event_id, (total, active), actual.get(event_id, (0, 0)))
+        for event_id, total, active in stored
+        if (total, active) != actual.get(event_id, (0, 0))
+    ]
+    if fix and mismatches:
+        db.session.execute(
+            update(Event),
+            [
+                {"id": event_id, "entrant_count": t, "active_entrant_count": a}
+                for event_id, _, (t, a) in mismatches
+            ],
+        )
+    return mismatches
+
+
+def repair_entrant_counts():
+    """Recompute every event's counts; returns the number corrected."""
+    return len(check_entrant_counts(fix=True))
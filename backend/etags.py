@@ -0,0 +1,139 @@
+# File: backend/etags.py
+# Purpose: Per-event version counters and conditional GET handling.
+# Notes:
+# - Every write that changes an event, its entrants or its matches calls
+#   bump_event_versions() before committing, so Event.version/updated_at move
+#   together with the data readers see.
+# - Reads ask for a version token first (one small query) and only build the
+#   payload when the client's If-None-Match / If-Modified-Since is stale.
+# - Collection reads without an event filter use an aggregate over all events;
+#   creating or deleting an event changes it through count/max(id).
+# - ETags hash the version with the request path, query string and response
+#   format, so each distinct representation gets its own tag.
+# - Last-Modified has one-second resolution; clients sending If-None-Match are
+#   compared by ETag only, which stays exact.
+# - With a cache_scope, JSON bodies are also cached server-side under the same
+#   ETag (see backend/response_cache.py).
+
+import hashlib
+from collections import namedtuple
+
+from flask import make_response, request
+from sqlalchemy import func, update
+from werkzeug.http import is_resource_modified
+
+from backend.models import db, Event, utcnow
+from backend.response_cache import get_response_cache, invalidate_events
+from backend.streaming import wants_stream
+
+Version = namedtuple("Version", "token updated_at")
+
+
+def bump_event_versions(event_ids):
+    """Increment version and touch updated_at for the given events.
+
+    Runs as a single UPDATE in the caller's transaction and drops the events'
+    cached responses; caller commits.
+    """
+    ids = sorted({int(i) for i in event_ids if i is not None})
+    if not ids:
+        return
+    invalidate_events(ids)
+    db.session.execute(
+        update(Event)
+        .where(Event.id.in_(ids))
+        .values(version=Event.version + 1, updated_at=utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def event_version(event_id):
+    """Version of one event, or None if it doesn't exist."""
+    row = (
+        db.session.query(Event.version, Event.updated_at)
+        .filter(Event.id == event_id)
+        .one_or_none()
+    )
+    if row is None:
+        return None
+    return event_token(event_id, row.version, row.updated_at)
+
+
+def event_token(event_id, version, updated_at):
+    """Version for one event's (version, updated_at) columns."""
+    # updated_at keeps tags unique if a deleted event's id is reused
+    stamp = updated_at.isoformat() if updated_at else ""
+    return Version(f"e{event_id}.{version}.{stamp}", updated_at)
+
+
+def catalog_version():
+    """Version covering every event (and so every entrant and match)."""
+    count, max_id, total, updated_at = db.session.query(
+        func.count(Event.id),
+        func.max(Event.id),
+        func.sum(Event.version),
+        func.max(Event.updated_at),
+    ).one()
+    stamp = updated_at.isoformat() if updated_at else ""
+    return Version(f"all.{count}.{max_id}.{total}.{stamp}", updated_at)
+
+
+def collection_version(event_id=None):
+    """Version for a list read, scoped to one event when filtered."""
+    if event_id:
+        return event_version(event_id) or Version(f"e{event_id}.missing", None)
+    return catalog_version()
+
+
+def etag_for(version, full_path, fmt="json"):
+    """ETag for one representation (path + query, json/ndjson) of a version."""
+    representation = "|".join((version.token, full_path, fmt))
+    return hashlib.sha1(representation.encode()).hexdigest()
+
+
+def make_etag(version):
+    fmt = "ndjson" if wants_stream() else "json"
+    return etag_for(version, request.full_path, fmt)
+
+
+def conditional_get(version, build, cache_scope=None):
+    """Return 304 if the client's copy matches version, else build().
+
+    build() returns a normal view result; successful (200) responses get
+    ETag, Last-Modified and Cache-Control: no-cache so clients revalidate.
+    With version None (e.g. missing event) build() is returned untouched.
+    With cache_scope, non-streamed 200 bodies are served from and stored in
+    the response cache.
+    """
+    if version is None:
+        return build()
+
+    etag = make_etag(version)
+    if not is_resource_modified(
+        request.environ, etag=etag, last_modified=version.updated_at
+    ):
+        response = make_response("", 304)
+        _set_validators(response, etag, version)
+        return response
+
+    cache = get_response_cache() if cache_scope and not wants_stream() else None
+    key = f"{cache_scope}:{request.full_path}"
+    body = cache.get(key, etag) if cache is not None else None
+    if body is not None:
+        response = make_response(body)
+        response.mimetype = "application/json"
+    else:
+        response = make_response(build())
+        if cache is not None and response.status_code == 200:
+            cache.put(key, etag, response.get_data())
+    if response.status_code == 200:
+        _set_validators(response, etag, version)
+    return response
+
+
+def _set_validators(response, etag, version):
+    response.set_etag(etag)
+    if version.updated_at is not None:
+        response.last_modified = version.updated_at
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept")
@@ -0,0 +1,18 @@
+# File: backend/gunicorn.conf.py
+# Purpose: gunicorn settings for backend/wsgi.py.
+# Notes:
+# - Worker and thread counts come from the same env vars ProductionConfig uses
+#   to size each worker's DB pool, so the two can't drift apart.
+# - Threaded workers: each request thread holds at most one pooled connection.
+
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:5500")
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+threads = int(os.getenv("WEB_THREADS", "8"))
+worker_class = "gthread"
+timeout = int(os.getenv("WEB_TIMEOUT", "30"))
+keepalive = 5
+max_requests = 10_000  # recycle workers to bound memory growth
+max_requests_jitter = 1_000
+accesslog = "-"
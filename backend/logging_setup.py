@@ -0,0 +1,242 @@
+# File: backend/logging_setup.py
+# Purpose: Structured, leveled, non-blocking logging for the backend.
+# Notes:
+# - Modules log with logging.getLogger(__name__); init_logging(app) configures
+#   the "backend" logger once per process (later calls reconfigure it).
+# - Request threads only filter and enqueue records (bounded queue, dropped
+#   and counted when full); a QueueListener thread formats and writes them to
+#   stderr, so slow terminals or pipes never stall a request.
+# - Filters run in the request thread, in order: sampling (DEBUG records kept
+#   at LOG_DEBUG_SAMPLE_RATE), request context (request_id, method, path) and
+#   redaction of secret-looking keys (LOG_REDACT_KEYS) in every extra field.
+# - Structured fields go in `extra=`: log.info("entrant created",
+#   extra={"entrant_id": 5}). LOG_FORMAT "json" writes one object per line;
+#   "text" appends key=value pairs for local development.
+# - Each request gets an id (X-Request-ID header if sent), echoed back in the
+#   response and attached to every record logged while handling it.
+# - Under gunicorn the listener thread starts in each worker (no preload_app).
+
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+import uuid
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from flask import g, has_request_context, request
+
+LOGGER_NAME = "backend"
+REDACTED = "[REDACTED]"
+DEFAULT_REDACT_KEYS = (
+    "password",
+    "token",
+    "access_token",
+    "refresh_token",
+    "authorization",
+    "secret",
+    "jwt",
+)
+# LogRecord attributes that are not user-supplied extras
+RESERVED_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+_state = {"listener": None, "handler": None, "queue": None}
+
+
+def redact(value, keys):
+    """Copy of value with dict entries whose key is in keys masked."""
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if str(k).lower() in keys else redact(v, keys)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(v, keys) for v in value]
+    return value
+
+
+def extra_fields(record):
+    return {k: v for k, v in vars(record).items() if k not in RESERVED_ATTRS}
+
+
+class SampleFilter(logging.Filter):
+    """Keep DEBUG records with probability `rate`; other levels always pass."""
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class RequestContextFilter(logging.Filter):
+    def filter(self, record):
+        if has_request_context():
+            record.request_id = g.get("request_id")
+            record.method = request.method
+            record.path = request.path
+        return True
+
+
+class RedactFilter(logging.Filter):
+    def __init__(self, keys=DEFAULT_REDACT_KEYS):
+        super().__init__()
+        self.keys = frozenset(k.lower() for k in keys)
+
+    def filter(self, record):
+        for name, value in extra_fields(record).items():
+            if name.lower() in self.keys:
+                setattr(record, name, REDACTED)
+            elif isinstance(value, (dict, list, tuple)):
+                setattr(record, name, redact(value, self.keys))
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that drops (and counts) records when the queue is full."""
+
+    def __init__(self, q):
+        super().__init__(q)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        # Keep extras intact for the formatter; only render the message and
+        # traceback here, while args and exc_info are still valid.
+        record.message = record.getMessage()
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.msg, record.args = record.message, None
+        return record
+
+
+class StderrHandler(logging.StreamHandler):
+    """Writes to whatever sys.stderr is at emit time (test capture swaps it)."""
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        entry.update(extra_fields(record))
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record):
+        line = super().format(record)
+        fields = " ".join(
+            f"{k}={json.dumps(v, default=str)}" for k, v in extra_fields(record).items()
+        )
+        return f"{line} {fields}" if fields else line
+
+
+FORMATTERS = {"json": JSONFormatter, "text": TextFormatter}
+
+
+def flush_logs():
+    """Block until every queued record has been written."""
+    if _state["queue"] is not None and _state["listener"] is not None:
+        _state["queue"].join()
+
+
+def _stop_listener():
+    if _state["listener"] is not None:
+        _state["listener"].stop()
+        _state["listener"] = None
+
+
+def configure_logging(
+    level="INFO",
+    fmt="text",
+    sample_rate=1.0,
+    redact_keys=DEFAULT_REDACT_KEYS,
+    queue_size=10_000,
+):
+    """(Re)configure the "backend" logger; returns the queue handler."""
+    try:
+        formatter = FORMATTERS[fmt]()
+    except KeyError:
+        raise ValueError(f"Unknown LOG_FORMAT: {fmt!r}")
+
+    logger = logging.getLogger(LOGGER_NAME)
+    _stop_listener()
+    if _state["handler"] is not None:
+        logger.removeHandler(_state["handler"])
+
+    q = queue.Queue(maxsize=queue_size)
+    handler = NonBlockingQueueHandler(q)
+    handler.addFilter(SampleFilter(sample_rate))
+    handler.addFilter(RequestContextFilter())
+    handler.addFilter(RedactFilter(redact_keys))
+
+    output = StderrHandler()
+    output.setFormatter(formatter)
+    listener = QueueListener(q, output)
+    listener.start()
+
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+    _state.update(listener=listener, handler=handler, queue=q)
+    return handler
+
+
+def init_logging(app):
+    """Configure logging from app.config and tag requests with an id."""
+    handler = configure_logging(
+        level=app.config.get("LOG_LEVEL", "INFO"),
+        fmt=app.config.get("LOG_FORMAT", "text"),
+        sample_rate=app.config.get("LOG_DEBUG_SAMPLE_RATE", 1.0),
+        redact_keys=app.config.get("LOG_REDACT_KEYS", DEFAULT_REDACT_KEYS),
+        queue_size=app.config.get("LOG_QUEUE_SIZE", 10_000),
+    )
+
+    @app.before_request
+    def assign_request_id():
+        g.request_id = (
+            request.headers.get("X-Request-ID", "")[:64] or uuid.uuid4().hex[:16]
+        )
+
+    @app.after_request
+    def echo_request_id(response):
+        if g.get("request_id"):
+            response.headers["X-Request-ID"] = g.request_id
+        return response
+
+    return handler
+
+
+atexit.register(_stop_listener)
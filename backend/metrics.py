@@ -0,0 +1,227 @@
+# File: backend/metrics.py
+# Purpose: Per-request instrumentation: SQL query count and time, JSON
+#          serialization time, Server-Timing headers and Prometheus metrics.
+# Notes:
+# - init_metrics(app) hooks SQLAlchemy cursor events on the app's engines and
+#   Flask before_request/after_request. Per-request numbers live on flask.g,
+#   so queries run outside a request (CLI, seeding) are ignored.
+# - "serialize" is time spent in app.json.dumps (jsonify); bodies served from
+#   the response cache skip it.
+# - Streaming bodies (NDJSON, SSE) are produced after after_request, so their
+#   queries and encoding are not included.
+# - The registry is per process: under gunicorn each worker exposes its own
+#   /metrics (see backend/routes/metrics.py).
+# - Routes are labelled by URL rule ("/events/<int:event_id>"), never by raw
+#   path, so label cardinality stays bounded.
+
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+from flask import current_app, g, has_app_context, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event as sa_event
+
+from backend.database import db
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestMetrics:
+    """Counters for the request in flight (stored on flask.g)."""
+
+    __slots__ = ("start", "queries", "db_time", "serialize_time")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+
+
+def current_request_metrics():
+    return g.get("request_metrics") if has_app_context() else None
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Aggregated per-route metrics; safe to share between request threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = defaultdict(int)  # (method, route, status) -> count
+        self.durations = defaultdict(lambda: Histogram(DURATION_BUCKETS))
+        self.queries = defaultdict(lambda: Histogram(QUERY_BUCKETS))
+        self.db_seconds = defaultdict(float)
+        self.serialize_seconds = defaultdict(float)
+
+    def record(self, method, route, status, stats, duration):
+        key = (method, route)
+        with self._lock:
+            self.requests[(method, route, str(status))] += 1
+            self.durations[key].observe(duration)
+            self.queries[key].observe(stats.queries)
+            self.db_seconds[key] += stats.db_time
+            self.serialize_seconds[key] += stats.serialize_time
+
+    def render(self, extra=()):
+        """Prometheus text exposition format (version 0.0.4).
+
+        extra: (name, type, help, value) tuples for process-level series.
+        """
+        with self._lock:
+            lines = []
+            _family(lines, "http_requests_total", "counter", "Requests handled.")
+            for (method, route, status), n in sorted(self.requests.items()):
+                labels = _labels(method=method, route=route, status=status)
+                lines.append(f"http_requests_total{labels} {n}")
+            _histograms(
+                lines,
+                "http_request_duration_seconds",
+                "Time from before_request to after_request.",
+                self.durations,
+            )
+            _histograms(
+                lines,
+                "http_request_db_queries",
+                "SQL statements executed per request.",
+                self.queries,
+            )
+            for name, help_text, values in (
+                ("http_request_db_seconds_total", "Time in SQL.", self.db_seconds),
+                (
+                    "http_request_serialize_seconds_total",
+                    "Time encoding JSON responses.",
+                    self.serialize_seconds,
+                ),
+            ):
+                _family(lines, name, "counter", help_text)
+                for (method, route), value in sorted(values.items()):
+                    labels = _labels(method=method, route=route)
+                    lines.append(f"{name}{labels} {value:.6f}")
+
+        for name, kind, help_text, value in extra:
+            _family(lines, name, kind, help_text)
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return "{" + inner + "}"
+
+
+def _family(lines, name, kind, help_text):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _histograms(lines, name, help_text, histograms):
+    _family(lines, name, "histogram", help_text)
+    for (method, route), hist in sorted(histograms.items()):
+        cumulative = 0
+        bounds = [str(b) for b in hist.buckets] + ["+Inf"]
+        for bound, n in zip(bounds, hist.counts):
+            cumulative += n
+            labels = _labels(method=method, route=route, le=bound)
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _labels(method=method, route=route)
+        lines.append(f"{name}_sum{labels} {hist.sum:.6f}")
+        lines.append(f"{name}_count{labels} {hist.count}")
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, adding encode time to the current request."""
+
+    def dumps(self, obj, **kwargs):
+        stats = current_request_metrics()
+        if stats is None:
+            return super().dumps(obj, **kwargs)
+        start = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            stats.serialize_time += time.perf_counter() - start
+
+
+def _before_cursor_execute(conn, cursor, statement, params, context, executemany):
+    if context is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, params, context, executemany):
+    stats = current_request_metrics()
+    if stats is None:
+        return
+    stats.queries += 1
+    start = getattr(context, "_metrics_start", None)
+    if start is not None:
+        stats.db_time += time.perf_counter() - start
+
+
+def instrument_engine(engine):
+    if not sa_event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        sa_event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        sa_event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def server_timing(stats, total):
+    return (
+        f'db;dur={stats.db_time * 1000:.2f};desc="{stats.queries} queries", '
+        f"serialize;dur={stats.serialize_time * 1000:.2f}, "
+        f"total;dur={total * 1000:.2f}"
+    )
+
+
+def init_metrics(app):
+    """Install request hooks, engine listeners and the JSON timer on app."""
+    if not app.config.get("METRICS_ENABLED", True):
+        return None
+    registry = MetricsRegistry()
+    app.extensions["metrics"] = registry
+    app.json = TimedJSONProvider(app)
+    with app.app_context():
+        for engine in db.engines.values():
+            instrument_engine(engine)
+
+    @app.before_request
+    def start_request_metrics():
+        g.request_metrics = RequestMetrics()
+
+    @app.after_request
+    def finish_request_metrics(response):
+        stats = g.pop("request_metrics", None)
+        if stats is None:
+            return response
+        total = time.perf_counter() - stats.start
+        if app.config.get("METRICS_SERVER_TIMING", True):
+            response.headers["Server-Timing"] = server_timing(stats, total)
+        route = request.url_rule.rule if request.url_rule else UNMATCHED_ROUTE
+        if route != "/metrics":
+            registry.record(request.method, route, response.status_code, stats, total)
+        return response
+
+    return registry
+
+
+def get_metrics():
+    return current_app.extensions.get("metrics")
@@ -0,0 +1,117 @@
+"""Add standings table for incrementally maintained event standings
+
+Revision ID: e83b17f4c6d0
+Revises: d5a8c3e7b912
+Create Date: 2026-10-17 13:41:27.302958
+
+"""
+import re
+from collections import defaultdict
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e83b17f4c6d0'
+down_revision = 'd5a8c3e7b912'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of backend/standings.py's rules at this revision: a decided match
+# counts a win/loss per side, a one-entrant decided match is a BYE, and games
+# come from "X-Y" scores (entrant1-entrant2) only.
+SCORE_RE = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+COUNTERS = ('wins', 'losses', 'byes', 'games_won', 'games_lost')
+BATCH = 1000
+
+
+def _backfill(conn):
+    """Populate standings from existing matches (as rebuild_standings() does).
+
+    record_change() only applies deltas, so rows must start from the
+    current record or the first edit of a decided match goes negative.
+    """
+    matches = sa.table(
+        'matches',
+        sa.column('event_id', sa.Integer),
+        sa.column('entrant1_id', sa.Integer),
+        sa.column('entrant2_id', sa.Integer),
+        sa.column('winner_id', sa.Integer),
+        sa.column('scores', sa.String),
+    )
+    standings = sa.table(
+        'standings',
+        sa.column('entrant_id', sa.Integer),
+        sa.column('event_id', sa.Integer),
+        *(sa.column(c, sa.Integer) for c in COUNTERS + ('opp_wins', 'opp_losses')),
+    )
+    totals = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    event_of, opponents = {}, defaultdict(list)
+    for event_id, a, b, w, scores in conn.execute(
+        sa.select(
+            matches.c.event_id,
+            matches.c.entrant1_id,
+            matches.c.entrant2_id,
+            matches.c.winner_id,
+            matches.c.scores,
+        ).where(matches.c.winner_id.isnot(None))
+    ):
+        if w not in (a, b):
+            continue
+        if a is None or b is None:
+            totals[w]['wins'] += 1
+            totals[w]['byes'] += 1
+            event_of[w] = event_id
+            continue
+        found = SCORE_RE.match(scores or '')
+        g1, g2 = (int(found.group(1)), int(found.group(2))) if found else (0, 0)
+        for me, them, won, lost in ((a, b, g1, g2), (b, a, g2, g1)):
+            totals[me]['wins'] += int(w == me)
+            totals[me]['losses'] += int(w != me)
+            totals[me]['games_won'] += won
+            totals[me]['games_lost'] += lost
+            event_of[me] = event_id
+            opponents[me].append(them)
+
+    rows = [
+        {
+            'entrant_id': entrant_id,
+            'event_id': event_of[entrant_id],
+            'opp_wins': sum(totals[o]['wins'] for o in opponents[entrant_id]),
+            'opp_losses': sum(totals[o]['losses'] for o in opponents[entrant_id]),
+            **counters,
+        }
+        for entrant_id, counters in totals.items()
+    ]
+    for start in range(0, len(rows), BATCH):
+        conn.execute(standings.insert(), rows[start:start + BATCH])
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('standings',
+    sa.Column('entrant_id', sa.Integer(), nullable=False),
+    sa.Column('event_id', sa.Integer(), nullable=False),
+    sa.Column('wins', sa.Integer(), nullable=False),
+    sa.Column('losses', sa.Integer(), nullable=False),
+    sa.Column('byes', sa.Integer(), nullable=False),
+    sa.Column('games_won', sa.Integer(), nullable=False),
+    sa.Column('games_lost', sa.Integer(), nullable=False),
+    sa.Column('opp_wins', sa.Integer(), nullable=False),
+    sa.Column('opp_losses', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['entrant_id'], ['entrants.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['event_id'], ['events.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('entrant_id')
+    )
+    op.create_index(op.f('ix_standings_event_id'), 'standings', ['event_id'], unique=False)
+    # ### end Alembic commands ###
+
+    _backfill(op.get_bind())
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index(op.f('ix_standings_event_id'), table_name='standings')
+    op.drop_table('standings')
+    # ### end Alembic commands ###
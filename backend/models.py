@@ -4,15 +4,34 @@
 # - Enforces DB-level constraints: non-null names, valid statuses, sane match setup.
 # - Uses "soft delete" for entrants (mark as dropped instead of hard delete).
 # - Includes to_dict() methods with optional related info.
+# - Indexes cover the hot FK access paths (event lookups, entrant-in-match checks).
+# - Match scores are structured: typed game counts on Match, per-game points in
+#   MatchGame (parsed and validated by backend/scores.py).
+# - Standing holds per-entrant records kept in sync by backend/standings.py.
+# - User passwords are hashed off the request thread (backend/passwords.py).
+# - serialize_matches() resolves entrant names for many matches in batched queries.
+# - Event.version/updated_at change on every write to the event or its entrants
+#   and matches; they back ETag/Last-Modified (see backend/etags.py).
+# - Event.entrant_count/active_entrant_count are denormalized counts kept in
+#   step by backend/entrant_counts.py.
+# - Entrant.version/Match.version are row versions for optimistic concurrency,
+#   bumped on every ORM flush and by PATCH writes (see backend/patching.py).
 
-from sqlalchemy import Enum, CheckConstraint
-from werkzeug.security import generate_password_hash, check_password_hash
+from datetime import datetime, timezone
+
+from sqlalchemy import Enum, CheckConstraint, Index
 from backend.database import db
+from backend.passwords import get_password_hasher
 
 # Allowed event statuses
 EVENT_STATUSES = ("drafting", "published", "cancelled", "completed")
 
 
+def utcnow():
+    """Naive UTC timestamp (DateTime columns are stored without a zone)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class Event(db.Model):
     __tablename__ = "events"
 
@@ -25,6 +44,13 @@ class Event(db.Model):
         nullable=False,
         default="drafting",
     )
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    updated_at = db.Column(db.DateTime, nullable=True, default=utcnow)
+    # Maintained on every entrant write (backend/entrant_counts.py)
+    entrant_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    active_entrant_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
 
     entrants = db.relationship(
         "Entrant", back_populates="event", cascade="all, delete-orphan"
@@ -43,7 +69,9 @@ class Event(db.Model):
             "date": self.date,
             "rules": self.rules,
             "status": self.status,
-            "entrant_count": len(self.entrants) if self.entrants else 0,
+            "entrant_count": self.entrant_count or 0,
+            "active_entrant_count": self.active_entrant_count or 0,
+            "version": self.version,
         }
         if include_related:
             data["entrants"] = [e.to_dict() for e in self.entrants]
@@ -59,9 +87,12 @@ class Entrant(db.Model):
     alias = db.Column(db.String(80), nullable=True)
     event_id = db.Column(db.Integer, db.ForeignKey("events.id"), nullable=False)
     dropped = db.Column(db.Boolean, default=False, nullable=False)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
 
     event = db.relationship("Event", back_populates="entrants")
 
+    __table_args__ = (Index("ix_entrants_event_id_dropped", "event_id", "dropped"),)
+
     def __repr__(self):
         status = "dropped" if self.dropped else "active"
         return f"<Entrant {self.name} ({self.alias}) - {status}>"
@@ -79,6 +110,7 @@ class Entrant(db.Model):
             "alias": self.alias,
             "event_id": self.event_id,
             "dropped": self.dropped,
+            "version": self.version,
         }
 
 
@@ -90,14 +122,40 @@ class Match(db.Model):
     round = db.Column(db.Integer, nullable=True)
     entrant1_id = db.Column(db.Integer, db.ForeignKey("entrants.id"), nullable=True)
     entrant2_id = db.Column(db.Integer, db.ForeignKey("entrants.id"), nullable=True)
+    # Normalized text plus typed game counts; see backend/scores.py
     scores = db.Column(db.String, nullable=True)
+    games1 = db.Column(db.Integer, nullable=True)
+    games2 = db.Column(db.Integer, nullable=True)
     winner_id = db.Column(db.Integer, db.ForeignKey("entrants.id"), nullable=True)
 
+    # Bracket placement (NULL for ad-hoc matches); see backend/brackets.py
+    bracket = db.Column(db.String(16), nullable=True)
+    position = db.Column(db.Integer, nullable=True)
+    next_match_id = db.Column(
+        db.Integer,
+        db.ForeignKey("matches.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    next_match_slot = db.Column(db.Integer, nullable=True)
+    loser_match_id = db.Column(
+        db.Integer,
+        db.ForeignKey("matches.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    loser_match_slot = db.Column(db.Integer, nullable=True)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+
     __table_args__ = (
         CheckConstraint(
             "entrant1_id IS NULL OR entrant1_id != entrant2_id",
             name="check_distinct_entrants",
         ),
+        Index("ix_matches_event_id_round", "event_id", "round"),
+        Index("ix_matches_entrant1_id", "entrant1_id"),
+        Index("ix_matches_entrant2_id", "entrant2_id"),
+        Index("ix_matches_winner_id", "winner_id"),
     )
 
     event = db.relationship("Event", back_populates="matches")
@@ -105,7 +163,9 @@ class Match(db.Model):
     def __repr__(self):
         return f"<Match Event {self.event_id} Round {self.round}>"
 
-    def to_dict(self, include_names=False):
+    def to_dict(self, include_names=False, entrant_map=None):
+        """Serialize match. With include_names, resolve entrants from
+        entrant_map (id -> Entrant) when given, else one lookup per slot."""
         data = {
             "id": self.id,
             "event_id": self.event_id,
@@ -113,21 +173,115 @@ class Match(db.Model):
             "entrant1_id": self.entrant1_id,
             "entrant2_id": self.entrant2_id,
             "scores": self.scores,
+            "games1": self.games1,
+            "games2": self.games2,
             "winner_id": self.winner_id,
+            "bracket": self.bracket,
+            "position": self.position,
+            "next_match_id": self.next_match_id,
+            "loser_match_id": self.loser_match_id,
+            "version": self.version,
         }
 
         if include_names:
-            e1 = db.session.get(Entrant, self.entrant1_id) if self.entrant1_id else None
-            e2 = db.session.get(Entrant, self.entrant2_id) if self.entrant2_id else None
-            w = db.session.get(Entrant, self.winner_id) if self.winner_id else None
+            if entrant_map is None:
+                entrant_map = build_entrant_map([self])
+
+            def resolve(entrant_id):
+                entrant = entrant_map.get(entrant_id) if entrant_id else None
+                return entrant.to_dict() if entrant else None
 
-            data["entrant1"] = e1.to_dict() if e1 else None
-            data["entrant2"] = e2.to_dict() if e2 else None
-            data["winner"] = w.to_dict() if w else None
+            data["entrant1"] = resolve(self.entrant1_id)
+            data["entrant2"] = resolve(self.entrant2_id)
+            data["winner"] = resolve(self.winner_id)
 
         return data
 
 
+class MatchGame(db.Model):
+    """Points of one game of a match, entrant1 first (see backend/scores.py)."""
+
+    __tablename__ = "match_games"
+
+    match_id = db.Column(
+        db.Integer, db.ForeignKey("matches.id", ondelete="CASCADE"), primary_key=True
+    )
+    number = db.Column(db.Integer, primary_key=True)  # 1-based game number
+    points1 = db.Column(db.Integer, nullable=False)
+    points2 = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        CheckConstraint(
+            "points1 >= 0 AND points2 >= 0", name="check_game_points_non_negative"
+        ),
+    )
+
+    def __repr__(self):
+        return (
+            f"<MatchGame {self.match_id}#{self.number} {self.points1}-{self.points2}>"
+        )
+
+
+# Keep IN (...) lists well under SQLite's bound-parameter limit
+ENTRANT_LOOKUP_CHUNK = 500
+
+
+def build_entrant_map(matches, known=None):
+    """Return {entrant_id: Entrant} for every entrant referenced by matches.
+
+    Entrants already present in `known` (e.g. an event's loaded entrants)
+    are reused; the rest are fetched with chunked IN queries instead of
+    one lookup per match slot.
+    """
+    entrant_map = {e.id: e for e in (known or [])}
+    missing = set()
+    for m in matches:
+        for entrant_id in (m.entrant1_id, m.entrant2_id, m.winner_id):
+            if entrant_id and entrant_id not in entrant_map:
+                missing.add(entrant_id)
+
+    missing = sorted(missing)
+    for start in range(0, len(missing), ENTRANT_LOOKUP_CHUNK):
+        chunk = missing[start : start + ENTRANT_LOOKUP_CHUNK]
+        for entrant in Entrant.query.filter(Entrant.id.in_(chunk)):
+            entrant_map[entrant.id] = entrant
+    return entrant_map
+
+
+def serialize_matches(matches, include_names=False, entrant_map=None):
+    """Serialize a list of matches, sharing one entrant map across them."""
+    if include_names and entrant_map is None:
+        entrant_map = build_entrant_map(matches)
+    return [m.to_dict(include_names, entrant_map) for m in matches]
+
+
+class Standing(db.Model):
+    """Per-entrant record, maintained incrementally (see backend/standings.py)."""
+
+    __tablename__ = "standings"
+
+    entrant_id = db.Column(
+        db.Integer, db.ForeignKey("entrants.id", ondelete="CASCADE"), primary_key=True
+    )
+    event_id = db.Column(
+        db.Integer,
+        db.ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    byes = db.Column(db.Integer, nullable=False, default=0)
+    games_won = db.Column(db.Integer, nullable=False, default=0)
+    games_lost = db.Column(db.Integer, nullable=False, default=0)
+    # Sums of every decided opponent's wins/losses (Buchholz, opponent win %)
+    opp_wins = db.Column(db.Integer, nullable=False, default=0)
+    opp_losses = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<Standing Entrant {self.entrant_id} {self.wins}-{self.losses}>"
+
+
 class User(db.Model):
     __tablename__ = "users"
 
@@ -138,10 +292,11 @@ class User(db.Model):
     is_admin = db.Column(db.Boolean, default=False)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        """Hash with the app's current policy (see backend/passwords.py)."""
+        self.password_hash = get_password_hasher().hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return get_password_hasher().verify(self.password_hash, password)[0]
 
     def to_dict(self):
         return {
@@ -150,3 +305,15 @@ class User(db.Model):
             "email": self.email,
             "is_admin": self.is_admin,
         }
+
+
+class RevokedToken(db.Model):
+    """Revoked JWT, kept until the token's own expiry (see backend/blocklist.py)."""
+
+    __tablename__ = "revoked_tokens"
+
+    jti = db.Column(db.String(36), primary_key=True)
+    expires_at = db.Column(db.Integer, nullable=False, index=True)  # unix seconds
+
+    def __repr__(self):
+        return f"<RevokedToken {self.jti} exp={self.expires_at}>"
@@ -0,0 +1,96 @@
+# File: backend/pagination.py
+# Purpose: Keyset (cursor) pagination helpers shared by list routes.
+# Notes:
+# - Clients pass ?limit=N and optionally ?after=<cursor> from a previous page.
+# - Cursors are opaque URL-safe base64 JSON of the last row's sort key values.
+# - Sort keys must end in a unique column (id) so pages never overlap or skip.
+# - Decoded cursors are type-checked (str/int keys, int id) before use.
+
+import base64
+import json
+
+from flask import request
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class PaginationError(ValueError):
+    """Raised for malformed limit/after query parameters (maps to 400)."""
+
+
+def encode_cursor(values):
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token, size):
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise PaginationError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise PaginationError("Invalid cursor")
+    # Values go straight into the keyset WHERE: sort keys are str/int scalars
+    # and the last one is the integer id
+    if not all(_is_key(v, (str, int)) for v in values[:-1]) or not _is_key(
+        values[-1], int
+    ):
+        raise PaginationError("Invalid cursor")
+    return values
+
+
+def _is_key(value, types):
+    return isinstance(value, types) and not isinstance(value, bool)
+
+
+def page_args():
+    """Return (limit, after) from the query string, or (None, None) when the
+    request is unpaginated. `after` is the raw cursor token."""
+    limit = request.args.get("limit")
+    after = request.args.get("after")
+    if limit is None and after is None:
+        return None, None
+    try:
+        limit = int(limit) if limit is not None else DEFAULT_PAGE_SIZE
+    except ValueError:
+        raise PaginationError("limit must be an integer")
+    if limit < 1:
+        raise PaginationError("limit must be positive")
+    return min(limit, MAX_PAGE_SIZE), after
+
+
+def keyset_filter(keys, values):
+    """Build the "row comes after values" predicate for mixed-direction keys.
+
+    keys is a list of (column_expression, "asc" | "desc").
+    """
+    clauses = []
+    for i, (expr, direction) in enumerate(keys):
+        prefix = [k == v for (k, _), v in zip(keys[:i], values[:i])]
+        step = expr > values[i] if direction == "asc" else expr < values[i]
+        clauses.append(and_(*prefix, step))
+    return or_(*clauses)
+
+
+def keyset_order(keys):
+    return [expr.asc() if d == "asc" else expr.desc() for expr, d in keys]
+
+
+def paginate(query, keys, limit, after, key_of):
+    """Apply keyset ordering/filtering to query and fetch one page.
+
+    key_of(row) returns the sort key values for a row (same order as keys).
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    query = query.order_by(*keyset_order(keys))
+    if after:
+        query = query.filter(keyset_filter(keys, decode_cursor(after, len(keys))))
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(key_of(rows[-1]))
+    return rows, next_cursor
@@ -0,0 +1,122 @@
+# File: backend/passwords.py
+# Purpose: Password hashing policy and a bounded executor that runs the hashes.
+# Notes:
+# - PASSWORD_HASH_METHOD is a werkzeug method string: "scrypt" (default,
+#   scrypt:32768:8:1), "scrypt:16384:8:1", "pbkdf2:sha256:600000", ...
+# - Hashes run on a per-process thread pool of PASSWORD_HASH_WORKERS threads.
+#   hashlib's scrypt/pbkdf2 release the GIL, so hashes use real cores while
+#   the pool caps how many run at once; a login storm queues here instead of
+#   starving every other request of CPU.
+# - Scope: this bounds hashing concurrency, it does not free the request
+#   thread. The route still waits on the result (up to PASSWORD_HASH_TIMEOUT),
+#   so a sync worker stays busy for the length of its own hash.
+# - Pools are shared by every app in the process with the same worker count
+#   (tests build many apps) and shut down at exit.
+# - At most PASSWORD_HASH_MAX_PENDING hashes may be queued or running; beyond
+#   that (or after PASSWORD_HASH_TIMEOUT seconds) HasherBusy is raised and the
+#   route answers 503 with Retry-After.
+# - Hashes made under an older policy still verify; verify() reports them as
+#   stale so /login can rehash with the current policy.
+# - Unknown emails are checked against a dummy hash so a failed login costs
+#   the same whether or not the account exists.
+
+import atexit
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+from flask import current_app
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class HasherBusy(Exception):
+    """Too many password hashes queued; the caller should retry later."""
+
+
+_executors = {}  # worker count -> shared ThreadPoolExecutor
+_executors_lock = threading.Lock()
+
+
+def _shared_executor(workers):
+    with _executors_lock:
+        executor = _executors.get(workers)
+        if executor is None:
+            executor = _executors[workers] = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="pwhash"
+            )
+        return executor
+
+
+def shutdown_executors():
+    """Stop every hash pool; later hashers start fresh ones."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PasswordHasher:
+    def __init__(self, method="scrypt", workers=4, max_pending=64, timeout=5.0):
+        self.timeout = timeout
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max_pending)
+        # Hashing once normalizes the method ("scrypt" -> "scrypt:32768:8:1")
+        # and rejects bad method strings at startup
+        self._dummy = generate_password_hash(secrets.token_hex(16), method)
+        self.method = self.policy_of(self._dummy)
+
+    @staticmethod
+    def policy_of(password_hash):
+        return password_hash.split("$", 1)[0]
+
+    def needs_rehash(self, password_hash):
+        return self.policy_of(password_hash) != self.method
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy("Password hashing queue is full")
+        try:
+            future = _shared_executor(self.workers).submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        try:
+            return future.result(self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise HasherBusy("Timed out waiting for password hashing")
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        """(matches, stale) for password against password_hash.
+
+        password_hash None (no such user) burns a dummy check and never matches.
+        """
+        if password_hash is None:
+            self._run(check_password_hash, self._dummy, password)
+            return False, False
+        ok = self._run(check_password_hash, password_hash, password)
+        return ok, ok and self.needs_rehash(password_hash)
+
+
+def init_password_hasher(app):
+    hasher = PasswordHasher(
+        method=app.config.get("PASSWORD_HASH_METHOD", "scrypt"),
+        workers=app.config.get("PASSWORD_HASH_WORKERS", 4),
+        max_pending=app.config.get("PASSWORD_HASH_MAX_PENDING", 64),
+        timeout=app.config.get("PASSWORD_HASH_TIMEOUT", 5.0),
+    )
+    app.extensions["password_hasher"] = hasher
+    return hasher
+
+
+def get_password_hasher():
+    return current_app.extensions["password_hasher"]
+
+
+atexit.register(shutdown_executors)
@@ -0,0 +1,200 @@
+# File: backend/patching.py
+# Purpose: Schema-driven partial updates for the PUT/PATCH routes.
+# Notes:
+# - Each route declares an allowlist {field: parser}; anything else in the
+#   body (id, relationships, derived columns) is rejected with a 400, and
+#   every field is validated before the database is touched.
+# - apply_patch() reads only the columns it needs by primary key, drops values
+#   that didn't change and writes the rest with one
+#   UPDATE ... SET <changed>, version = version + 1 WHERE id = ? AND version = ?.
+# - A "version" in the body is the client's expected row version; a stale one
+#   (or a write that lands in between read and UPDATE) gets a 409 carrying the
+#   current version.
+# - The UPDATE bypasses ORM flush hooks, so callers handle side effects
+#   (entrant counts, standings, event versions) from the returned Patch.
+# - ORM writes to entrants and matches (bracket advancement, soft deletes)
+#   bump the row version in a before_flush hook. Unlike version_id_col this
+#   keeps multi-row UPDATEs batched; those writers don't check the version.
+
+from collections import namedtuple
+
+from flask import jsonify
+from sqlalchemy import event as sa_event, select, update
+from sqlalchemy.orm import Session
+
+from backend.models import db, Entrant, Match
+
+Patch = namedtuple("Patch", "id version before after changes")
+
+VERSIONED = (Entrant, Match)
+
+
+class PatchError(ValueError):
+    """Rejected partial update; status is the HTTP code, details go in the body."""
+
+    def __init__(self, message, status=400, **details):
+        super().__init__(message)
+        self.status = status
+        self.details = details
+
+
+def patch_error_response(error):
+    """Response for a PatchError: {"error": message, **details}, error.status."""
+    return jsonify(error=str(error), **error.details), error.status
+
+
+# ------------------------
+# Field parsers: parser(name, value) -> column value, ValueError if invalid
+# ------------------------
+def text(max_length=None, required=False):
+    def parse(name, value):
+        if value is None or value == "":
+            if required:
+                raise ValueError(f"{name} is required")
+            return None
+        if not isinstance(value, str):
+            raise ValueError(f"{name} must be a string")
+        if max_length and len(value) > max_length:
+            raise ValueError(f"{name} must be at most {max_length} characters")
+        return value
+
+    return parse
+
+
+def integer(nullable=False, minimum=None):
+    def parse(name, value):
+        if value is None or value == "":
+            if nullable:
+                return None
+            raise ValueError(f"{name} is required")
+        if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+            value = int(value)
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"{name} must be an integer")
+        if minimum is not None and value < minimum:
+            raise ValueError(f"{name} must be at least {minimum}")
+        return value
+
+    return parse
+
+
+def boolean():
+    def parse(name, value):
+        if not isinstance(value, bool):
+            raise ValueError(f"{name} must be true or false")
+        return value
+
+    return parse
+
+
+def integer_list(max_items=None):
+    def parse(name, value):
+        if not isinstance(value, list) or not value:
+            raise ValueError(f"{name} must be a non-empty list of integers")
+        if max_items and len(value) > max_items:
+            raise ValueError(f"{name} must have at most {max_items} items")
+        return [integer()(name, item) for item in value]
+
+    return parse
+
+
+def choice(values):
+    def parse(name, value):
+        if value not in values:
+            raise ValueError(f"{name} must be one of: {', '.join(values)}")
+        return value
+
+    return parse
+
+
+# ------------------------
+# Engine
+# ------------------------
+def parse_patch(data, schema):
+    """Validate a request body against schema.
+
+    Returns ({field: parsed value}, expected version or None); raises
+    PatchError listing every unknown field or invalid value.
+    """
+    if not isinstance(data, dict):
+        raise PatchError("Expected a JSON object")
+    data = dict(data)
+    expected = data.pop("version", None)
+    if expected is not None:
+        try:
+            expected = integer()("version", expected)
+        except ValueError as e:
+            raise PatchError(str(e))
+
+    unknown = sorted(set(data) - set(schema))
+    if unknown:
+        raise PatchError(f"Unknown or read-only field(s): {', '.join(unknown)}")
+    values, errors = {}, []
+    for name, value in data.items():
+        try:
+            values[name] = schema[name](name, value)
+        except ValueError as e:
+            errors.append(str(e))
+    if errors:
+        raise PatchError("; ".join(errors))
+    return values, expected
+
+
+def _conflict(model, row_id, version):
+    if version is None:
+        return PatchError(f"{model.__name__} {row_id} not found", 404)
+    return PatchError(
+        f"{model.__name__} {row_id} was changed by someone else; " "reload and retry",
+        409,
+        version=version,
+    )
+
+
+def apply_patch(
+    model, row_id, values, expected_version=None, columns=(), check=None, extra=None
+):
+    """Write the changed `values` of one row in a single UPDATE; caller commits.
+
+    Reads `values`' columns plus `columns` and the row version by primary key.
+    check(before, after, changes) may raise PatchError before anything is
+    written; `extra` holds additional column values written with a change.
+    Returns a Patch whose `changes` is empty when nothing differed (no UPDATE).
+    """
+    names = list(dict.fromkeys(["version", *columns, *values]))
+    row = db.session.execute(
+        select(*(getattr(model, name) for name in names)).where(model.id == row_id)
+    ).one_or_none()
+    if row is None:
+        raise PatchError(f"{model.__name__} {row_id} not found", 404)
+
+    before = dict(zip(names, row))
+    version = before["version"]
+    if expected_version is not None and expected_version != version:
+        raise _conflict(model, row_id, version)
+    changes = {k: v for k, v in values.items() if before[k] != v}
+    after = {**before, **changes}
+    if not changes:
+        return Patch(row_id, version, before, after, changes)
+    if check is not None:
+        check(before, after, changes)
+
+    result = db.session.execute(
+        update(model)
+        .where(model.id == row_id, model.version == version)
+        .values(**changes, **(extra or {}), version=version + 1)
+    )
+    if result.rowcount != 1:
+        # Changed (or deleted) between our read and the UPDATE
+        current = db.session.scalar(select(model.version).where(model.id == row_id))
+        raise _conflict(model, row_id, current)
+    after["version"] = version + 1
+    return Patch(row_id, version + 1, before, after, changes)
+
+
+@sa_event.listens_for(Session, "before_flush")
+def _bump_row_versions(session, flush_context, instances):
+    for obj in session.dirty:
+        if isinstance(obj, VERSIONED) and session.is_modified(
+            obj, include_collections=False
+        ):
+            obj.version = (obj.version or 0) + 1
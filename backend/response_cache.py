@@ -0,0 +1,146 @@
+# File: backend/response_cache.py
+# Purpose: Server-side cache of serialized GET /events and GET /events/<id> bodies.
+# Notes:
+# - Entries are keyed by scope ("events" or "event:<id>") plus request path
+#   and hold (etag, body). A hit requires the stored ETag to equal the one
+#   computed from the current event version (backend/etags.py), so a body
+#   cached before another worker's commit is never served.
+# - Writes also drop the affected event's entries and the catalog list right
+#   away (invalidate_events), so dead versions don't hold cache slots.
+# - Backends: "memory" (per-process LRU with TTL) or "none" (disabled). A
+#   shared store only needs get/set/delete_prefix/evictions; add it to BACKENDS.
+# - stats() reports hits, misses, size-based evictions and invalidations.
+
+import threading
+
+from flask import current_app
+
+from backend.blocklist import LRUCache
+
+CATALOG_SCOPE = "events"
+
+
+def event_scope(event_id):
+    return f"event:{event_id}"
+
+
+class MemoryResponseStore:
+    """Per-process LRU store; safe to share between request threads."""
+
+    def __init__(self, maxsize=1024):
+        self.cache = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    @property
+    def evictions(self):
+        return self.cache.evictions
+
+    def get(self, key):
+        with self._lock:
+            return self.cache.get(key)
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self.cache.set(key, value, ttl)
+
+    def delete_prefix(self, prefix):
+        with self._lock:
+            keys = [k for k in self.cache.keys() if k.startswith(prefix)]
+            return sum(self.cache.delete(k) for k in keys)
+
+    def __len__(self):
+        return len(self.cache)
+
+
+class NullResponseStore:
+    """Caching disabled: every lookup misses."""
+
+    evictions = 0
+
+    def __init__(self, maxsize=0):
+        pass
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl=None):
+        pass
+
+    def delete_prefix(self, prefix):
+        return 0
+
+    def __len__(self):
+        return 0
+
+
+class ResponseCache:
+    """Version-checked body cache in front of a store; counters are thread-safe."""
+
+    def __init__(self, store, ttl=30.0):
+        self.store = store
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()  # guards the counters
+
+    def get(self, key, etag):
+        entry = self.store.get(key)
+        hit = entry is not None and entry[0] == etag
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry[1] if hit else None
+
+    def put(self, key, etag, body):
+        self.store.set(key, (etag, body), ttl=self.ttl)
+
+    def invalidate_events(self, event_ids):
+        """Drop cached bodies for the events and the catalog list."""
+        dropped = sum(
+            self.store.delete_prefix(f"{event_scope(event_id)}:")
+            for event_id in set(event_ids)
+        )
+        dropped += self.store.delete_prefix(f"{CATALOG_SCOPE}:")
+        with self._lock:
+            self.invalidations += dropped
+
+    def stats(self):
+        with self._lock:
+            counters = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+        return {**counters, "evictions": self.store.evictions, "size": len(self.store)}
+
+
+BACKENDS = {
+    "memory": MemoryResponseStore,
+    "none": NullResponseStore,
+}
+
+
+def init_response_cache(app):
+    """Build the cache named by RESPONSE_CACHE_BACKEND and attach it to app."""
+    backend_name = app.config.get("RESPONSE_CACHE_BACKEND", "memory")
+    try:
+        store = BACKENDS[backend_name](app.config.get("RESPONSE_CACHE_SIZE", 1024))
+    except KeyError:
+        raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {backend_name!r}")
+    cache = ResponseCache(store, ttl=app.config.get("RESPONSE_CACHE_TTL", 30.0))
+    app.extensions["response_cache"] = cache
+    return cache
+
+
+def get_response_cache():
+    return current_app.extensions.get("response_cache")
+
+
+def invalidate_events(event_ids):
+    """Invalidate cached bodies for event_ids (no-op without a cache)."""
+    cache = get_response_cache()
+    if cache is not None:
+        cache.invalidate_events(event_ids)
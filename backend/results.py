@@ -0,0 +1,180 @@
+# File: backend/results.py
+# Purpose: Apply a batch of match results for one event (POST
+#          /events/<id>/results), e.g. a whole round at once.
+# Notes:
+# - Every row is validated against its match's current entrants before
+#   anything is written; any invalid row rejects the whole batch.
+# - Current rows are read in chunked IN queries, locked FOR UPDATE where the
+#   database supports it, and written back with one executemany UPDATE
+#   (WHERE id AND version) carrying the same columns for every row.
+# - Per-game points are replaced with one DELETE and one INSERT per batch.
+# - Bracket winners are advanced together after the UPDATE (round order,
+#   all slots before walkovers), then standings are rebuilt once instead of
+#   per-result incremental updates.
+# - A batch is checked against the bracket as it stands: report a round
+#   before results that depend on its advancement.
+
+from collections import namedtuple
+
+from sqlalchemy import bindparam, insert, select
+
+from backend.brackets import advance_matches
+from backend.bulk import chunks
+from backend.models import db, Match, MatchGame
+from backend.patching import integer, parse_patch
+from backend.scores import (
+    delete_games,
+    game_rows,
+    has_games,
+    parse_scores,
+    score_fields,
+)
+from backend.standings import rebuild_standings
+
+RESULT_FIELDS = {
+    "match_id": integer(),
+    "winner_id": integer(nullable=True),
+    "scores": lambda name, value: parse_scores(value),
+}
+RESULT_COLUMNS = ("winner_id", "scores", "games1", "games2")
+
+Change = namedtuple("Change", "match_id version bracket before after score")
+
+
+def _current(event_id, match_ids):
+    """{match_id: row} for the event's matches among match_ids, locked."""
+    rows = {}
+    for chunk in chunks(match_ids):
+        query = (
+            select(
+                Match.id,
+                Match.version,
+                Match.entrant1_id,
+                Match.entrant2_id,
+                Match.bracket,
+                Match.round,
+                Match.position,
+                *(getattr(Match, name) for name in RESULT_COLUMNS),
+            )
+            .where(Match.event_id == event_id, Match.id.in_(chunk))
+            .with_for_update()
+        )
+        rows.update((row.id, row) for row in db.session.execute(query))
+    return rows
+
+
+def plan_results(event_id, items):
+    """Validate result rows against the event's matches.
+
+    Returns (changes, errors): a Change for every row that alters its match,
+    and [{"index", "error"}] row errors ("version" added on a stale one).
+    """
+    parsed, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            values, expected = parse_patch(item, RESULT_FIELDS)
+            if "match_id" not in values:
+                raise ValueError("match_id is required")
+            if "winner_id" not in values and "scores" not in values:
+                raise ValueError("winner_id or scores is required")
+            parsed.append((index, values, expected))
+        except ValueError as e:
+            errors.append({"index": index, "error": str(e)})
+
+    current = _current(event_id, {values["match_id"] for _, values, _ in parsed})
+    changes, seen = [], set()
+    for index, values, expected in parsed:
+        match_id = values["match_id"]
+        row = current.get(match_id)
+        if row is None or match_id in seen:
+            if row is None:
+                message = f"Match {match_id} is not in event {event_id}"
+            else:
+                message = f"Match {match_id} appears more than once"
+            errors.append({"index": index, "error": message})
+            continue
+        seen.add(match_id)
+        if expected is not None and expected != row.version:
+            errors.append(
+                {
+                    "index": index,
+                    "error": f"Match {match_id} was changed by someone else",
+                    "version": row.version,
+                }
+            )
+            continue
+
+        before = {name: getattr(row, name) for name in RESULT_COLUMNS}
+        after = dict(before)
+        score = values.get("scores")
+        if score is not None:
+            after.update(score_fields(score))
+        if "winner_id" in values:
+            after["winner_id"] = values["winner_id"]
+        winner = after["winner_id"]
+        if winner is not None and winner not in (row.entrant1_id, row.entrant2_id):
+            errors.append(
+                {"index": index, "error": "Winner ID must match one of the entrants"}
+            )
+            continue
+        if after != before:
+            changes.append(
+                Change(match_id, row.version, row.bracket, before, after, score)
+            )
+
+    if errors:
+        return [], errors
+    # Upstream bracket rounds first, so their advancement runs first
+    changes.sort(
+        key=lambda c: (
+            current[c.match_id].round or 0,
+            current[c.match_id].position or 0,
+            c.match_id,
+        )
+    )
+    return changes, []
+
+
+def apply_results(event_id, changes):
+    """Write planned changes, advance brackets, rebuild standings. Caller commits.
+
+    Returns False if a row changed since plan_results() read it (only
+    detectable on drivers reporting executemany rowcounts).
+    """
+    if not changes:
+        return True
+    table = Match.__table__
+    result = db.session.execute(
+        table.update()
+        .where(table.c.id == bindparam("b_id"), table.c.version == bindparam("b_v"))
+        .values(
+            version=table.c.version + 1,
+            **{name: bindparam(name) for name in RESULT_COLUMNS},
+        ),
+        [{"b_id": c.match_id, "b_v": c.version, **c.after} for c in changes],
+    )
+    if (
+        db.session.get_bind().dialect.supports_sane_multi_rowcount
+        and result.rowcount != len(changes)
+    ):
+        return False
+
+    rescored = [c for c in changes if c.after["scores"] != c.before["scores"]]
+    stale = [c.match_id for c in rescored if has_games(c.before["scores"])]
+    for chunk in chunks(stale):
+        delete_games(chunk)
+    games = [row for c in rescored if c.score for row in game_rows(c.match_id, c.score)]
+    if games:
+        db.session.execute(insert(MatchGame), games)
+
+    advanced = [
+        c.match_id
+        for c in changes
+        if c.bracket and c.after["winner_id"] != c.before["winner_id"]
+    ]
+    loaded = {}
+    for chunk in chunks(advanced):
+        loaded.update((m.id, m) for m in Match.query.filter(Match.id.in_(chunk)))
+    advance_matches([loaded[match_id] for match_id in advanced])
+    rebuild_standings(event_id)
+    return True
@@ -3,7 +3,12 @@
 # Notes:
 # - Provides signup, login, logout, and protected routes.
 # - Uses JWT for token-based authentication.
-# - Logout revokes tokens by adding their JTI to a global blocklist.
+# - Logout revokes tokens by recording their JTI in the revocation store.
+# - Password hashing runs on a bounded pool (backend/passwords.py); when it is
+#   saturated signup/login answer 503 with Retry-After. Login rehashes
+#   passwords stored under an older PASSWORD_HASH_METHOD.
+
+import logging
 
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import (
@@ -14,16 +19,25 @@ from flask_jwt_extended import (
 )
 from backend.database import db
 from backend.models import User
-from backend.blocklist import jwt_blocklist
-import traceback
+from backend.blocklist import get_revocation_store
+from backend.passwords import HasherBusy, get_password_hasher
+
+log = logging.getLogger(__name__)
 
 auth_bp = Blueprint("auth", __name__)
 
 
+def _busy():
+    log.warning("Password hashing saturated")
+    resp = jsonify(error="Too many login attempts, retry shortly")
+    resp.headers["Retry-After"] = "1"
+    return resp, 503
+
+
 @auth_bp.route("/signup", methods=["POST"])
 def signup():
     data = request.get_json() or {}
-    print("DEBUG signup payload:", data)
+    log.debug("signup payload", extra={"payload": data})
 
     try:
         username = data.get("username")
@@ -41,34 +55,51 @@ def signup():
         db.session.add(user)
         db.session.commit()
 
-        print(f"✅ Created user {user.id} ({email})")
+        log.info("Created user", extra={"user_id": user.id})
         return jsonify(user.to_dict()), 201
-    except Exception as e:
+    except HasherBusy:
+        db.session.rollback()
+        return _busy()
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error during signup: {e}")
+        log.exception("Error during signup")
         return jsonify(error="Failed to sign up"), 500
 
 
 @auth_bp.route("/login", methods=["POST"])
 def login():
     data = request.get_json() or {}
-    print("DEBUG login payload:", data)
+    log.debug("login payload", extra={"payload": data})
 
     try:
         email = data.get("email")
         password = data.get("password")
 
+        if not email or not password:
+            return jsonify(error="Invalid credentials"), 401
+
+        hasher = get_password_hasher()
         user = User.query.filter_by(email=email).first()
-        if not user or not user.check_password(password):
+        ok, stale = hasher.verify(user.password_hash if user else None, password)
+        if not ok:
             return jsonify(error="Invalid credentials"), 401
 
+        if stale:
+            # Hashed under an older PASSWORD_HASH_METHOD; upgrade while we
+            # still have the plaintext
+            user.set_password(password)
+            db.session.commit()
+            log.info("Rehashed password", extra={"user_id": user.id})
+
         token = create_access_token(identity=str(user.id))
-        print(f"✅ Login success for {email}")
+        log.info("Login succeeded", extra={"user_id": user.id})
         return jsonify(access_token=token), 200
-    except Exception as e:
-        traceback.print_exc()
-        print(f"❌ Error during login: {e}")
+    except HasherBusy:
+        db.session.rollback()
+        return _busy()
+    except Exception:
+        db.session.rollback()
+        log.exception("Error during login")
         return jsonify(error="Failed to log in"), 500
 
 
@@ -76,13 +107,13 @@ def login():
 @jwt_required()
 def logout():
     try:
-        jti = get_jwt()["jti"]
-        jwt_blocklist.add(jti)
-        print(f"✅ Token revoked: {jti}")
+        claims = get_jwt()
+        jti = claims["jti"]
+        get_revocation_store().revoke(jti, claims["exp"])
+        log.info("Token revoked", extra={"jti": jti})
         return jsonify(message="Logged out"), 200
-    except Exception as e:
-        traceback.print_exc()
-        print(f"❌ Error during logout: {e}")
+    except Exception:
+        log.exception("Error during logout")
         return jsonify(error="Failed to log out"), 500
 
 
@@ -93,7 +124,6 @@ def protected():
         user_id = get_jwt_identity()
         user = User.query.get(int(user_id))
         return jsonify(message=f"Hello {user.username}!"), 200
-    except Exception as e:
-        traceback.print_exc()
-        print(f"❌ Error accessing protected route: {e}")
+    except Exception:
+        log.exception("Error accessing protected route")
         return jsonify(error="Failed to fetch protected resource"), 500
@@ -3,21 +3,63 @@
 # Notes:
 # - Supports create, read (list), update, and delete.
 # - Uses Entrant.to_dict() for consistent serialization.
+# - List supports keyset pagination by id (?limit=&after=) and NDJSON streaming.
+# - POST /entrants/bulk validates many rows together and inserts them in one statement.
+# - Writes bump the owning event's version; the list read is conditional on it
+#   (ETag / Last-Modified, see backend/etags.py).
+# - Committed changes are pushed to GET /events/<id>/stream subscribers.
+# - PUT/PATCH /entrants/<id> go through the allowlisted patch engine
+#   (backend/patching.py): one targeted UPDATE, 409 on a stale "version";
+#   PATCH returns only the changed fields.
+# - DELETE checks for matches with indexed EXISTS probes (backend/drops.py);
+#   POST /events/<id>/entrants/drop does the same for many entrants.
+
+import logging
+from collections import defaultdict
 
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
-from backend.models import db, Entrant
-import traceback
+from sqlalchemy import insert, select
+from backend.models import db, Entrant, Event
+from backend.broker import publish
+from backend.entrant_counts import adjust_entrant_counts, move_deltas
+from backend.bulk import BulkError, bulk_items, in_row_order, row_errors_response
+from backend.drops import has_matches
+from backend.standings import delete_standings
+from backend.etags import bump_event_versions, collection_version, conditional_get
+from backend.patching import (
+    PatchError,
+    apply_patch,
+    boolean,
+    integer,
+    parse_patch,
+    patch_error_response,
+    text,
+)
+from backend.pagination import PaginationError, page_args, paginate
+from backend.streaming import ndjson_response, wants_stream
+
+log = logging.getLogger(__name__)
 
 bp = Blueprint("entrants", __name__, url_prefix="/entrants")
 
+# Writable entrant fields for PUT/PATCH
+ENTRANT_PATCH_FIELDS = {
+    "name": text(80, required=True),
+    "alias": text(80),
+    "event_id": integer(),
+    "dropped": boolean(),
+}
+# Read with every patch so the published entrant needs no second query
+ENTRANT_COLUMNS = ("id", "name", "alias", "event_id", "dropped")
+
 
 @bp.route("", methods=["POST"])
 @jwt_required()
 def create_entrant():
     """Create a new Entrant."""
     data = request.get_json() or {}
-    print("DEBUG create_entrant payload:", data)
+    log.debug("create_entrant payload", extra={"payload": data})
 
     try:
         name = data.get("name")
@@ -32,49 +74,204 @@ def create_entrant():
             dropped=bool(data.get("dropped", False)),
         )
         db.session.add(entrant)
+        bump_event_versions([entrant.event_id])
         db.session.commit()
 
-        print(f"✅ Created entrant {entrant.id} for event {event_id}")
-        return jsonify(entrant.to_dict()), 201
-    except Exception as e:
+        data = entrant.to_dict()
+        publish(entrant.event_id, "entrant.created", data)
+        log.info(
+            "Created entrant",
+            extra={"entrant_id": entrant.id, "event_id": entrant.event_id},
+        )
+        return jsonify(data), 201
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error creating entrant: {e}")
+        log.exception("Error creating entrant")
         return jsonify(error="Failed to create entrant"), 500
 
 
+def _parse_entrant(data):
+    """Validate one entrant payload; raises ValueError with a client message."""
+    name = data.get("name")
+    event_id = data.get("event_id")
+    if not name or not event_id:
+        raise ValueError("Name and event_id are required")
+    if len(name) > 80:
+        raise ValueError("Name must be at most 80 characters")
+    try:
+        event_id = int(event_id)
+    except (TypeError, ValueError):
+        raise ValueError("event_id must be an integer")
+    return {
+        "name": name,
+        "alias": data.get("alias"),
+        "event_id": event_id,
+        "dropped": bool(data.get("dropped", False)),
+    }
+
+
+@bp.route("/bulk", methods=["POST"])
+@jwt_required()
+def create_entrants_bulk():
+    """Create many Entrants in one transaction.
+
+    Body: JSON array of entrant objects. Rows are validated together (including
+    event existence); any error rejects the batch with per-row errors.
+    """
+    try:
+        items = bulk_items()
+        log.debug("create_entrants_bulk", extra={"rows": len(items)})
+
+        rows, errors = [], []
+        for index, item in enumerate(items):
+            try:
+                rows.append((index, _parse_entrant(item)))
+            except ValueError as e:
+                errors.append({"index": index, "error": str(e)})
+
+        event_ids = {row["event_id"] for _, row in rows}
+        existing = set(
+            db.session.scalars(select(Event.id).where(Event.id.in_(event_ids)))
+        )
+        errors.extend(
+            {"index": index, "error": f"Event {row['event_id']} not found"}
+            for index, row in rows
+            if row["event_id"] not in existing
+        )
+        if errors:
+            return row_errors_response(sorted(errors, key=lambda e: e["index"]))
+
+        values = [row for _, row in rows]
+        entrants = in_row_order(
+            values,
+            db.session.scalars(insert(Entrant).returning(Entrant), values).all(),
+        )
+        # Core inserts skip the flush hook that maintains event counts
+        deltas = defaultdict(lambda: [0, 0])
+        for entrant in entrants:
+            deltas[entrant.event_id][0] += 1
+            deltas[entrant.event_id][1] += not entrant.dropped
+        adjust_entrant_counts(deltas)
+        bump_event_versions(event_ids)
+        db.session.commit()
+
+        created = [e.to_dict() for e in entrants]
+        for event_id in sorted(event_ids):
+            group = [item for item in created if item["event_id"] == event_id]
+            publish(event_id, "entrants.created", group)
+        log.info("Bulk created entrants", extra={"rows": len(entrants)})
+        return jsonify(created), 201
+    except BulkError as e:
+        return jsonify(error=str(e)), 400
+    except Exception:
+        db.session.rollback()
+        log.exception("Error bulk creating entrants")
+        return jsonify(error="Failed to create entrants"), 500
+
+
 @bp.route("", methods=["GET"])
 def get_entrants():
-    """Retrieve all Entrants (optionally filter by event_id)."""
+    """Retrieve all Entrants (optionally filter by event_id).
+    Supports keyset pagination by id via ?limit=&after= and NDJSON
+    streaming via ?stream=1. Conditional on the event (or catalog) version."""
     try:
         event_id = request.args.get("event_id", type=int)
-        query = Entrant.query
-        if event_id:
-            query = query.filter_by(event_id=event_id)
-        entrants = query.all()
-        return jsonify([e.to_dict() for e in entrants]), 200
-    except Exception as e:
-        traceback.print_exc()
-        print(f"❌ Error fetching entrants: {e}")
+        return conditional_get(
+            collection_version(event_id), lambda: _list_entrants(event_id)
+        )
+    except PaginationError as e:
+        return jsonify(error=str(e)), 400
+    except Exception:
+        log.exception("Error fetching entrants")
         return jsonify(error="Failed to fetch entrants"), 500
 
 
-@bp.route("/<int:entrant_id>", methods=["PUT"])
+def _list_entrants(event_id):
+    query = Entrant.query
+    if event_id:
+        query = query.filter_by(event_id=event_id)
+    if wants_stream():
+        return ndjson_response(
+            query.order_by(Entrant.id), lambda rows: [e.to_dict() for e in rows]
+        )
+    limit, after = page_args()
+    if limit is None:
+        entrants = query.order_by(Entrant.id).all()
+        return jsonify([e.to_dict() for e in entrants]), 200
+
+    entrants, next_cursor = paginate(
+        query, [(Entrant.id, "asc")], limit, after, lambda e: [e.id]
+    )
+    return (
+        jsonify(items=[e.to_dict() for e in entrants], next_cursor=next_cursor),
+        200,
+    )
+
+
+def _check_entrant(before, after, changes):
+    if "event_id" in changes:
+        exists = db.session.scalar(
+            select(Event.id).where(Event.id == after["event_id"])
+        )
+        if exists is None:
+            raise PatchError(f"Event {after['event_id']} not found")
+        # Matches and standings stay with the old event, so only entrants who
+        # haven't played can move
+        if has_matches(before["id"]):
+            raise PatchError(
+                f"Entrant {before['id']} has matches in event {before['event_id']}",
+                409,
+            )
+
+
+@bp.route("/<int:entrant_id>", methods=["PUT", "PATCH"])
 @jwt_required()
 def update_entrant(entrant_id):
-    """Update an Entrant by ID."""
+    """Update an Entrant's name, alias, event_id and/or dropped flag.
+
+    Send "version" to fail with 409 if the entrant changed since it was read.
+    PATCH returns only {id, version, <changed fields>}; PUT the full entrant.
+    """
     try:
-        entrant = Entrant.query.get_or_404(entrant_id)
-        data = request.get_json() or {}
-        for key, value in data.items():
-            setattr(entrant, key, value)
-        db.session.commit()
-        print(f"✅ Updated entrant {entrant_id}")
-        return jsonify(entrant.to_dict()), 200
-    except Exception as e:
+        values, expected = parse_patch(
+            request.get_json(silent=True), ENTRANT_PATCH_FIELDS
+        )
+        patch = apply_patch(
+            Entrant,
+            entrant_id,
+            values,
+            expected,
+            columns=ENTRANT_COLUMNS,
+            check=_check_entrant,
+        )
+        before, after = patch.before, patch.after
+        data = {name: after[name] for name in (*ENTRANT_COLUMNS, "version")}
+        if patch.changes:
+            # The UPDATE skips the flush hook that maintains event counts
+            adjust_entrant_counts(
+                move_deltas(
+                    (before["event_id"], before["dropped"]),
+                    (after["event_id"], after["dropped"]),
+                )
+            )
+            bump_event_versions([before["event_id"], after["event_id"]])
+            db.session.commit()
+            if before["event_id"] != after["event_id"]:
+                publish(before["event_id"], "entrant.deleted", {"id": entrant_id})
+            publish(after["event_id"], "entrant.updated", data)
+            log.info(
+                "Updated entrant",
+                extra={"entrant_id": entrant_id, "fields": sorted(patch.changes)},
+            )
+        if request.method == "PATCH":
+            return jsonify(id=entrant_id, version=patch.version, **patch.changes), 200
+        return jsonify(data), 200
+    except PatchError as e:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error updating entrant {entrant_id}: {e}")
+        return patch_error_response(e)
+    except Exception:
+        db.session.rollback()
+        log.exception("Error updating entrant", extra={"entrant_id": entrant_id})
         return jsonify(error="Failed to update entrant"), 500
 
 
@@ -87,29 +284,27 @@ def delete_entrant(entrant_id):
     """
     try:
         entrant = Entrant.query.get_or_404(entrant_id)
-        from backend.models import Match  # avoid circular import
-
-        has_matches = (
-            Match.query.filter(
-                (Match.entrant1_id == entrant_id)
-                | (Match.entrant2_id == entrant_id)
-                | (Match.winner_id == entrant_id)
-            ).count()
-            > 0
-        )
 
-        if has_matches:
+        bump_event_versions([entrant.event_id])
+        if has_matches(entrant_id):
             entrant.soft_delete()
             db.session.commit()
-            print(f"⚠️ Entrant {entrant_id} marked as dropped (still in matches)")
-            return jsonify(entrant.to_dict()), 200
+            data = entrant.to_dict()
+            publish(data["event_id"], "entrant.updated", data)
+            log.warning(
+                "Entrant marked as dropped (still in matches)",
+                extra={"entrant_id": entrant_id},
+            )
+            return jsonify(data), 200
         else:
+            event_id = entrant.event_id
+            delete_standings([entrant_id])
             db.session.delete(entrant)
             db.session.commit()
-            print(f"✅ Entrant {entrant_id} fully deleted (no matches)")
+            publish(event_id, "entrant.deleted", {"id": entrant_id})
+            log.info("Deleted entrant", extra={"entrant_id": entrant_id})
             return "", 204
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error deleting entrant {entrant_id}: {e}")
+        log.exception("Error deleting entrant", extra={"entrant_id": entrant_id})
         return jsonify(error="Failed to delete entrant"), 500
@@ -3,12 +3,75 @@
 # Notes:
 # - Adds better error handling + debug logs.
 # - Multi-level sorting: date desc → status priority → name asc.
+# - Optional keyset pagination (?limit=&after=) over the same ordering.
+# - Optional NDJSON streaming (?stream=1) for full exports.
+# - GET /<id>/standings serves precomputed standings (backend/standings.py).
+# - GET /<id>/totals sums per-entrant games and points in SQL (backend/scores.py).
+# - POST /<id>/results applies a batch of match results in one transaction
+#   (see backend/results.py).
+# - POST /<id>/entrants/drop removes many entrants with set-based statements:
+#   unplayed ones are deleted, the rest soft-dropped (see backend/drops.py).
+# - Event detail is loaded eagerly in a fixed number of queries (see load_event_detail).
+# - Reads are conditional (ETag / Last-Modified from event versions): a current
+#   client gets 304 after one version lookup (see backend/etags.py).
+# - List and detail JSON bodies are cached server-side per version
+#   (see backend/response_cache.py).
+# - GET /<id>/stream pushes match/entrant changes as Server-Sent Events
+#   (see backend/broker.py).
+# - PATCH /<id> writes only allowlisted, changed fields in one UPDATE and
+#   returns the delta; PUT runs the same update and returns the full event
+#   (see backend/patching.py).
 
-from flask import Blueprint, request, jsonify
-from sqlalchemy import func, case, asc, desc
+import logging
+import queue
+
+from flask import Blueprint, Response, current_app, request, jsonify
+from sqlalchemy import func, case, select
+from sqlalchemy.orm import selectinload
 from flask_jwt_extended import jwt_required
-from backend.models import db, Event, Entrant
-import traceback
+from backend.models import (
+    db,
+    EVENT_STATUSES,
+    Entrant,
+    Event,
+    Match,
+    build_entrant_map,
+    serialize_matches,
+    utcnow,
+)
+from backend.pagination import PaginationError, page_args, paginate, keyset_order
+from backend.streaming import ndjson_response, wants_stream
+from backend.scores import delete_games, game_totals
+from backend.standings import delete_standings, get_standings
+from backend.bulk import (
+    MAX_BULK_ROWS,
+    BulkError,
+    bulk_items,
+    chunks,
+    row_errors_response,
+)
+from backend.brackets import BracketError
+from backend.results import apply_results, plan_results
+from backend.drops import drop_entrants
+from backend.etags import (
+    bump_event_versions,
+    catalog_version,
+    conditional_get,
+    event_version,
+)
+from backend.response_cache import CATALOG_SCOPE, event_scope, invalidate_events
+from backend.broker import CLOSED, format_sse, get_broker, publish, track_changes
+from backend.patching import (
+    PatchError,
+    apply_patch,
+    choice,
+    integer_list,
+    parse_patch,
+    patch_error_response,
+    text,
+)
+
+log = logging.getLogger(__name__)
 
 bp = Blueprint("events", __name__, url_prefix="/events")
 
@@ -20,12 +83,26 @@ STATUS_ORDER = case(
     else_=5,
 )
 
+# Writable event fields for PUT/PATCH
+EVENT_PATCH_FIELDS = {
+    "name": text(100, required=True),
+    "date": text(),
+    "rules": text(),
+    "status": choice(EVENT_STATUSES),
+}
+
+# Body of POST /<id>/entrants/drop
+DROP_FIELDS = {
+    "entrant_ids": integer_list(MAX_BULK_ROWS),
+    "mode": choice(("delete", "drop")),
+}
+
 
 @bp.route("", methods=["POST"])
 @jwt_required()
 def create_event():
     data = request.get_json() or {}
-    print("DEBUG create_event payload:", data)
+    log.debug("create_event payload", extra={"payload": data})
 
     try:
         event = Event(
@@ -36,90 +113,362 @@ def create_event():
         )
         db.session.add(event)
         db.session.commit()
-        print(f"✅ Created event {event.id}")
+        invalidate_events([event.id])
+        log.info("Created event", extra={"event_id": event.id})
         return jsonify(event.to_dict()), 201
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error creating event: {e}")
+        log.exception("Error creating event")
         return jsonify(error="Failed to create event"), 500
 
 
+# Full list ordering, shared by unpaginated and keyset-paginated reads.
+# Dates are coalesced so NULL dates sort last on every dialect and compare
+# cleanly inside a cursor; id is the unique tie-breaker.
+EVENT_DATE_KEY = func.coalesce(Event.date, "")
+EVENT_SORT_KEYS = [
+    (EVENT_DATE_KEY, "desc"),  # newest first
+    (STATUS_ORDER, "asc"),  # published → drafting → completed → cancelled
+    (Event.name, "asc"),  # alphabetical
+    (Event.id, "asc"),
+]
+
+
+def serialize_event_row(e):
+    return {
+        "id": e.id,
+        "name": e.name,
+        "date": (e.date.isoformat() if hasattr(e.date, "isoformat") else e.date),
+        "rules": e.rules,
+        "status": e.status,
+        "entrant_count": e.entrant_count,
+        "active_entrant_count": e.active_entrant_count,
+        "version": e.version,
+    }
+
+
 @bp.route("", methods=["GET"])
 def get_events():
+    """List events with entrant counts.
+
+    With ?limit= and/or ?after=, returns {"items": [...], "next_cursor": ...}
+    using keyset pagination over the same sort order; with ?stream=1 (or
+    Accept: application/x-ndjson) streams NDJSON; otherwise a plain list.
+    Conditional on the catalog version (If-None-Match / If-Modified-Since).
+    """
     try:
-        events = (
-            db.session.query(
-                Event.id,
-                Event.name,
-                Event.date,
-                Event.rules,
-                Event.status,
-                func.count(Entrant.id).label("entrant_count"),
-            )
-            .outerjoin(Entrant, Entrant.event_id == Event.id)
-            .group_by(Event.id)
-            .order_by(
-                desc(Event.date),  # newest first
-                STATUS_ORDER,  # published → drafting → completed → cancelled
-                asc(Event.name),  # alphabetical
-            )
-            .all()
+        return conditional_get(catalog_version(), _list_events, CATALOG_SCOPE)
+    except PaginationError as e:
+        return jsonify(error=str(e)), 400
+    except Exception:
+        log.exception("Error fetching events")
+        return jsonify(error="Failed to fetch events"), 500
+
+
+def _list_events():
+    limit, after = page_args()
+    # Counts are stored on the event row: one scan, no join over entrants
+    query = db.session.query(
+        Event.id,
+        Event.name,
+        Event.date,
+        Event.rules,
+        Event.status,
+        Event.entrant_count,
+        Event.active_entrant_count,
+        Event.version,
+        EVENT_DATE_KEY.label("date_key"),
+        STATUS_ORDER.label("status_rank"),
+    )
+    if wants_stream():
+        return ndjson_response(
+            query.order_by(*keyset_order(EVENT_SORT_KEYS)),
+            lambda rows: [serialize_event_row(e) for e in rows],
         )
-        return (
-            jsonify(
-                [
-                    {
-                        "id": e.id,
-                        "name": e.name,
-                        "date": (
-                            e.date.isoformat()
-                            if hasattr(e.date, "isoformat")
-                            else e.date
-                        ),
-                        "rules": e.rules,
-                        "status": e.status,
-                        "entrant_count": e.entrant_count,
-                    }
-                    for e in events
-                ]
-            ),
-            200,
+    if limit is None:
+        events = query.order_by(*keyset_order(EVENT_SORT_KEYS)).all()
+        return jsonify([serialize_event_row(e) for e in events]), 200
+
+    events, next_cursor = paginate(
+        query,
+        EVENT_SORT_KEYS,
+        limit,
+        after,
+        lambda e: [e.date_key, e.status_rank, e.name, e.id],
+    )
+    return (
+        jsonify(
+            items=[serialize_event_row(e) for e in events],
+            next_cursor=next_cursor,
+        ),
+        200,
+    )
+
+
+def load_event_detail(event_id):
+    """Load an Event with its entrants and matches eagerly.
+
+    Issues three queries regardless of bracket size: the event row, then one
+    selectin query each for entrants and matches. Returns None if missing.
+    """
+    return (
+        Event.query.options(
+            selectinload(Event.entrants),
+            selectinload(Event.matches),
         )
-    except Exception as e:
-        traceback.print_exc()
-        print(f"❌ Error fetching events: {e}")
-        return jsonify(error="Failed to fetch events"), 500
+        .filter_by(id=event_id)
+        .one_or_none()
+    )
 
 
 @bp.route("/<int:event_id>", methods=["GET"])
 def get_event(event_id):
     try:
-        event = Event.query.get_or_404(event_id)
-        data = event.to_dict(include_related=True)
-        data["matches"] = [m.to_dict(include_names=True) for m in event.matches]
-        return jsonify(data), 200
-    except Exception as e:
-        traceback.print_exc()
-        print(f"❌ Error fetching event {event_id}: {e}")
+        return conditional_get(
+            event_version(event_id),
+            lambda: _event_detail(event_id),
+            event_scope(event_id),
+        )
+    except Exception:
+        log.exception("Error fetching event", extra={"event_id": event_id})
         return jsonify(error="Failed to fetch event"), 500
 
 
-@bp.route("/<int:event_id>", methods=["PUT"])
+def serialize_event_detail(event, known_entrants=()):
+    """Event with entrants and named matches, from eagerly loaded relations.
+
+    Entrants referenced by matches but not registered to the event are looked
+    up unless passed in known_entrants (the async path preloads them).
+    """
+    data = event.to_dict()
+    data["entrants"] = [e.to_dict() for e in event.entrants]
+    entrant_map = build_entrant_map(
+        event.matches, known=list(event.entrants) + list(known_entrants)
+    )
+    data["matches"] = serialize_matches(
+        event.matches, include_names=True, entrant_map=entrant_map
+    )
+    return data
+
+
+def _event_detail(event_id):
+    event = load_event_detail(event_id)
+    if event is None:
+        return jsonify(error="Event not found"), 404
+    return jsonify(serialize_event_detail(event)), 200
+
+
+@bp.route("/<int:event_id>/standings", methods=["GET"])
+def get_event_standings(event_id):
+    """Ranked standings read from the incrementally maintained table."""
+    try:
+        version = event_version(event_id)
+        if version is None:
+            return jsonify(error="Event not found"), 404
+        return conditional_get(version, lambda: (jsonify(get_standings(event_id)), 200))
+    except Exception:
+        log.exception(
+            "Error fetching standings for event", extra={"event_id": event_id}
+        )
+        return jsonify(error="Failed to fetch standings"), 500
+
+
+@bp.route("/<int:event_id>/totals", methods=["GET"])
+def get_event_totals(event_id):
+    """Per-entrant games and points won/lost over decided matches (SQL sums)."""
+    try:
+        version = event_version(event_id)
+        if version is None:
+            return jsonify(error="Event not found"), 404
+
+        def render():
+            totals = game_totals(event_id)
+            return jsonify([{"entrant_id": k, **v} for k, v in totals.items()]), 200
+
+        return conditional_get(version, render)
+    except Exception:
+        log.exception("Error fetching totals for event", extra={"event_id": event_id})
+        return jsonify(error="Failed to fetch totals"), 500
+
+
+@bp.route("/<int:event_id>/results", methods=["POST"])
 @jwt_required()
-def update_event(event_id):
+def report_results(event_id):
+    """Apply many match results for an event in one transaction.
+
+    Body: JSON array of {"match_id", "winner_id", "scores", "version"}
+    (winner_id and/or scores; version optional). Rows are checked against
+    each match's entrants; any invalid row rejects the batch with per-row
+    errors (409 if a row's version is stale). Returns the updated matches,
+    including those moved by bracket advancement.
+    """
     try:
-        event = Event.query.get_or_404(event_id)
-        data = request.get_json() or {}
-        for key, value in data.items():
-            setattr(event, key, value)
+        items = bulk_items()
+        if db.session.scalar(select(Event.id).where(Event.id == event_id)) is None:
+            return jsonify(error="Event not found"), 404
+        log.debug("report_results", extra={"event_id": event_id, "rows": len(items)})
+
+        changes, errors = plan_results(event_id, items)
+        if errors:
+            stale = any("version" in error for error in errors)
+            return row_errors_response(errors, "updated", 409 if stale else 400)
+
+        with track_changes(Match) as touched:
+            if not apply_results(event_id, changes):
+                db.session.rollback()
+                return jsonify(error="Matches changed during the update; retry"), 409
+            if changes:
+                bump_event_versions([event_id])
+            db.session.commit()
+
+        ids = {c.match_id for c in changes} | {m.id for m in touched.values()}
+        matches = []
+        for chunk in chunks(ids):
+            matches.extend(Match.query.filter(Match.id.in_(chunk)).order_by(Match.id))
+        updated = serialize_matches(matches, include_names=True)
+        if updated:
+            publish(event_id, "matches.updated", updated)
+        log.info(
+            "Reported results",
+            extra={"event_id": event_id, "rows": len(items), "changed": len(updated)},
+        )
+        return jsonify(updated), 200
+    except BulkError as e:
+        return jsonify(error=str(e)), 400
+    except BracketError as e:
+        db.session.rollback()
+        return jsonify(error=str(e)), e.status
+    except Exception:
+        db.session.rollback()
+        log.exception("Error reporting results", extra={"event_id": event_id})
+        return jsonify(error="Failed to report results"), 500
+
+
+@bp.route("/<int:event_id>/entrants/drop", methods=["POST"])
+@jwt_required()
+def drop_event_entrants(event_id):
+    """Remove many of an event's entrants, e.g. no-shows at check-in close.
+
+    Body: {"entrant_ids": [...], "mode": "delete" | "drop"}. "delete" (the
+    default) hard-deletes entrants that are in no match and soft-drops the
+    rest; "drop" soft-drops all of them. Returns {"deleted": [ids],
+    "dropped": [entrants]}.
+    """
+    try:
+        values, _ = parse_patch(request.get_json(silent=True), DROP_FIELDS)
+        if "entrant_ids" not in values:
+            raise PatchError("entrant_ids is required")
+        if db.session.scalar(select(Event.id).where(Event.id == event_id)) is None:
+            return jsonify(error="Event not found"), 404
+
+        deleted, dropped = drop_entrants(
+            event_id,
+            values["entrant_ids"],
+            delete_unplayed=values.get("mode", "delete") == "delete",
+        )
+        if deleted or dropped:
+            bump_event_versions([event_id])
         db.session.commit()
-        print(f"✅ Updated event {event_id}")
-        return jsonify(event.to_dict()), 200
-    except Exception as e:
+
+        if deleted:
+            publish(event_id, "entrants.deleted", [{"id": i} for i in deleted])
+        if dropped:
+            publish(event_id, "entrants.updated", dropped)
+        log.info(
+            "Dropped entrants",
+            extra={
+                "event_id": event_id,
+                "deleted": len(deleted),
+                "dropped": len(dropped),
+            },
+        )
+        return jsonify(deleted=deleted, dropped=dropped), 200
+    except PatchError as e:
+        return patch_error_response(e)
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify(error=str(e)), 400
+    except Exception:
+        db.session.rollback()
+        log.exception("Error dropping entrants", extra={"event_id": event_id})
+        return jsonify(error="Failed to drop entrants"), 500
+
+
+@bp.route("/<int:event_id>/stream", methods=["GET"])
+def stream_event(event_id):
+    """Server-Sent Events feed of an event's match and entrant changes.
+
+    Each frame is `event: <kind>` (match.updated, entrant.created, ...) with
+    the serialized row as JSON data. Comment frames keep idle connections
+    open; Last-Event-ID resumes from the broker's recent history.
+    """
+    try:
+        if db.session.get(Event, event_id) is None:
+            return jsonify(error="Event not found"), 404
+        last_event_id = request.headers.get("Last-Event-ID", type=int)
+        keepalive = current_app.config.get("EVENT_STREAM_KEEPALIVE", 15.0)
+        broker = get_broker()
+        # Subscribe now, not on first read, so nothing published after the
+        # response starts can be missed.
+        subscription = broker.subscribe(event_id, last_event_id)
+    except Exception:
+        log.exception("Error opening stream for event", extra={"event_id": event_id})
+        return jsonify(error="Failed to open event stream"), 500
+
+    def frames():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    message = subscription.get(timeout=keepalive)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                if message is CLOSED:
+                    return
+                yield format_sse(message)
+        finally:
+            broker.unsubscribe(event_id, subscription)
+
+    # No request context or DB session is held while the stream is open
+    return Response(
+        frames(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@bp.route("/<int:event_id>", methods=["PUT", "PATCH"])
+@jwt_required()
+def update_event(event_id):
+    """Update an Event's name, date, rules and/or status.
+
+    Send "version" to fail with 409 if the event changed since it was read.
+    PATCH returns only {id, version, <changed fields>}; PUT the full event.
+    """
+    try:
+        values, expected = parse_patch(
+            request.get_json(silent=True), EVENT_PATCH_FIELDS
+        )
+        patch = apply_patch(
+            Event, event_id, values, expected, extra={"updated_at": utcnow()}
+        )
+        if patch.changes:
+            invalidate_events([event_id])
+            db.session.commit()
+            log.info(
+                "Updated event",
+                extra={"event_id": event_id, "fields": sorted(patch.changes)},
+            )
+        if request.method == "PATCH":
+            return jsonify(id=event_id, version=patch.version, **patch.changes), 200
+        return jsonify(db.session.get(Event, event_id).to_dict()), 200
+    except PatchError as e:
+        db.session.rollback()
+        return patch_error_response(e)
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error updating event {event_id}: {e}")
+        log.exception("Error updating event", extra={"event_id": event_id})
         return jsonify(error="Failed to update event"), 500
 
 
@@ -128,12 +477,14 @@ def update_event(event_id):
 def delete_event(event_id):
     try:
         event = Event.query.get_or_404(event_id)
+        delete_games(select(Match.id).where(Match.event_id == event_id))
+        delete_standings(select(Entrant.id).where(Entrant.event_id == event_id))
         db.session.delete(event)
+        invalidate_events([event_id])
         db.session.commit()
-        print(f"✅ Deleted event {event_id}")
+        log.info("Deleted event", extra={"event_id": event_id})
         return "", 204
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error deleting event {event_id}: {e}")
+        log.exception("Error deleting event", extra={"event_id": event_id})
         return jsonify(error="Failed to delete event"), 500
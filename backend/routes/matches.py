@@ -2,95 +2,446 @@
 # Purpose: Defines Flask Blueprint for Match CRUD routes.
 # Notes:
 # - Adds better error handling and validation.
+# - List reads resolve entrant names in batch via serialize_matches().
+# - List supports keyset pagination by id (?limit=&after=) and NDJSON streaming.
+# - POST /matches/bracket bulk-generates elimination brackets; setting a
+#   bracket match's winner advances it (see backend/brackets.py).
+# - POST /matches/swiss pairs the next Swiss round (see backend/swiss.py).
+# - Every write updates event standings incrementally (see backend/standings.py).
+# - "scores" is validated and stored as typed game counts plus per-game points
+#   (see backend/scores.py); malformed scores get a 400.
+# - POST /matches/bulk validates many rows together and inserts them in one statement.
+# - Writes bump the owning event's version; the list read is conditional on it
+#   (ETag / Last-Modified, see backend/etags.py).
+# - Committed changes are pushed to GET /events/<id>/stream subscribers
+#   (see backend/broker.py), including matches changed by bracket advancement.
+# - PUT/PATCH /matches/<id> go through the allowlisted patch engine
+#   (backend/patching.py): entrants, winner, round and scores only, one
+#   targeted UPDATE, 409 on a stale "version"; PATCH returns only the delta.
+
+import logging
+from collections import defaultdict
 
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required
-from backend.models import db, Match
-import traceback
+from sqlalchemy import insert, select
+from backend.models import db, Entrant, Event, Match, MatchGame, serialize_matches
+from backend.broker import publish, track_changes
+from backend.bulk import BulkError, bulk_items, in_row_order, row_errors_response
+from backend.etags import bump_event_versions, collection_version, conditional_get
+from backend.brackets import BracketError, advance_match, generate_bracket
+from backend.swiss import generate_swiss_round
+from backend.scores import (
+    delete_games,
+    game_rows,
+    has_games,
+    parse_scores,
+    score_fields,
+    set_games,
+)
+from backend.standings import Result, rebuild_standings, record_change, snapshot
+from backend.patching import (
+    PatchError,
+    apply_patch,
+    integer,
+    parse_patch,
+    patch_error_response,
+)
+from backend.pagination import PaginationError, page_args, paginate
+from backend.streaming import ndjson_response, wants_stream
+
+log = logging.getLogger(__name__)
 
 bp = Blueprint("matches", __name__, url_prefix="/matches")
 
+# Writable match fields for PUT/PATCH; bracket links and event_id are fixed
+MATCH_PATCH_FIELDS = {
+    "round": integer(nullable=True, minimum=1),
+    "entrant1_id": integer(nullable=True),
+    "entrant2_id": integer(nullable=True),
+    "winner_id": integer(nullable=True),
+    "scores": lambda name, value: parse_scores(value),
+}
+# Read with every patch: standings snapshot, stored games, bracket placement
+MATCH_COLUMNS = (*Result._fields, "scores", "bracket")
+
+
+def _parse_match(data):
+    """Validate one match payload; raises ValueError with a client message.
+
+    Returns (column values, Score); per-game points are stored separately.
+    """
+    try:
+        fields = {
+            "event_id": int(data.get("event_id")),
+            "entrant1_id": int(data.get("entrant1_id")),
+            "entrant2_id": int(data.get("entrant2_id")),
+            "round": int(data.get("round")) if data.get("round") else None,
+            "winner_id": int(data["winner_id"]) if data.get("winner_id") else None,
+        }
+    except (TypeError, ValueError):
+        raise ValueError("event_id, entrant1_id and entrant2_id must be integers")
+    score = parse_scores(data.get("scores"))
+    fields.update(score_fields(score))
+
+    if fields["entrant1_id"] == fields["entrant2_id"]:
+        raise ValueError("Entrants must be distinct")
+    if fields["winner_id"] and fields["winner_id"] not in (
+        fields["entrant1_id"],
+        fields["entrant2_id"],
+    ):
+        raise ValueError("Winner ID must match one of the entrants")
+    return fields, score
+
+
+def _publish_created(items):
+    """Push serialized new matches to subscribers, one frame per event."""
+    by_event = defaultdict(list)
+    for item in items:
+        by_event[item["event_id"]].append(item)
+    for event_id, group in by_event.items():
+        publish(event_id, "matches.created", group)
+
 
 @bp.route("", methods=["POST"])
 @jwt_required()
 def create_match():
     data = request.get_json() or {}
-    print("DEBUG create_match payload:", data)
+    log.debug("create_match payload", extra={"payload": data})
 
     try:
-        event_id = int(data.get("event_id"))
-        entrant1_id = int(data.get("entrant1_id"))
-        entrant2_id = int(data.get("entrant2_id"))
-        round_num = int(data.get("round")) if data.get("round") else None
-        winner_id = int(data["winner_id"]) if data.get("winner_id") else None
-
-        if winner_id and winner_id not in (entrant1_id, entrant2_id):
-            return jsonify(error="Winner ID must match one of the entrants"), 400
-
-        match = Match(
-            event_id=event_id,
-            round=round_num,
-            entrant1_id=entrant1_id,
-            entrant2_id=entrant2_id,
-            scores=data.get("scores"),
-            winner_id=winner_id,
-        )
+        try:
+            fields, score = _parse_match(data)
+        except ValueError as e:
+            return jsonify(error=str(e)), 400
+        event_id = fields["event_id"]
+
+        match = Match(**fields)
         db.session.add(match)
+        db.session.flush()
+        set_games(match.id, score, replace=False)
+        record_change(None, snapshot(match))
+        bump_event_versions([event_id])
         db.session.commit()
 
-        print(f"✅ Created match {match.id} for event {event_id}")
-        return jsonify(match.to_dict(include_names=True)), 201
-    except Exception as e:
+        data = match.to_dict(include_names=True)
+        publish(event_id, "match.created", data)
+        log.info("Created match", extra={"match_id": match.id, "event_id": event_id})
+        return jsonify(data), 201
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error creating match: {e}")
+        log.exception("Error creating match")
         return jsonify(error="Failed to create match"), 500
 
 
+@bp.route("/bulk", methods=["POST"])
+@jwt_required()
+def create_matches_bulk():
+    """Create many Matches in one transaction.
+
+    Body: JSON array of match objects. Each row gets the create_match rules,
+    plus event existence and entrants belonging to that event; any error
+    rejects the batch with per-row errors.
+    """
+    try:
+        items = bulk_items()
+        log.debug("create_matches_bulk", extra={"rows": len(items)})
+
+        rows, scores, errors = [], [], []
+        for index, item in enumerate(items):
+            try:
+                fields, score = _parse_match(item)
+                rows.append((index, fields))
+                scores.append(score)
+            except ValueError as e:
+                errors.append({"index": index, "error": str(e)})
+
+        event_ids = {row["event_id"] for _, row in rows}
+        existing = set(
+            db.session.scalars(select(Event.id).where(Event.id.in_(event_ids)))
+        )
+        entrant_ids = {
+            row[key] for _, row in rows for key in ("entrant1_id", "entrant2_id")
+        }
+        entrant_events = dict(
+            db.session.execute(
+                select(Entrant.id, Entrant.event_id).where(Entrant.id.in_(entrant_ids))
+            ).all()
+        )
+        for index, row in rows:
+            if row["event_id"] not in existing:
+                errors.append(
+                    {"index": index, "error": f"Event {row['event_id']} not found"}
+                )
+                continue
+            outsiders = [
+                row[key]
+                for key in ("entrant1_id", "entrant2_id")
+                if entrant_events.get(row[key]) != row["event_id"]
+            ]
+            if outsiders:
+                message = f"Entrant {outsiders[0]} is not in event {row['event_id']}"
+                errors.append({"index": index, "error": message})
+        if errors:
+            return row_errors_response(sorted(errors, key=lambda e: e["index"]))
+
+        values = [row for _, row in rows]
+        matches = in_row_order(
+            values, db.session.scalars(insert(Match).returning(Match), values).all()
+        )
+        # matches[i] is the row inserted for values[i], so scores[i] is its own
+        games = [
+            row
+            for m, score in zip(matches, scores, strict=True)
+            for row in game_rows(m.id, score)
+        ]
+        if games:
+            db.session.execute(insert(MatchGame), games)
+        # One recompute per touched event beats per-row incremental updates
+        for event_id in sorted({m.event_id for m in matches if m.winner_id}):
+            rebuild_standings(event_id)
+        bump_event_versions(event_ids)
+        db.session.commit()
+
+        created = serialize_matches(matches, include_names=True)
+        _publish_created(created)
+        log.info("Bulk created matches", extra={"rows": len(matches)})
+        return jsonify(created), 201
+    except BulkError as e:
+        return jsonify(error=str(e)), 400
+    except Exception:
+        db.session.rollback()
+        log.exception("Error bulk creating matches")
+        return jsonify(error="Failed to create matches"), 500
+
+
 @bp.route("", methods=["GET"])
 def get_matches():
     try:
         event_id = request.args.get("event_id", type=int)
-        query = Match.query
-        if event_id:
-            query = query.filter_by(event_id=event_id)
-        matches = query.all()
-        return jsonify([m.to_dict(include_names=True) for m in matches]), 200
-    except Exception as e:
-        traceback.print_exc()
-        print(f"❌ Error fetching matches: {e}")
+        return conditional_get(
+            collection_version(event_id), lambda: _list_matches(event_id)
+        )
+    except PaginationError as e:
+        return jsonify(error=str(e)), 400
+    except Exception:
+        log.exception("Error fetching matches")
         return jsonify(error="Failed to fetch matches"), 500
 
 
-@bp.route("/<int:match_id>", methods=["PUT"])
+def _list_matches(event_id):
+    query = Match.query
+    if event_id:
+        query = query.filter_by(event_id=event_id)
+    if wants_stream():
+        # Entrant names are resolved once per streamed batch
+        return ndjson_response(
+            query.order_by(Match.id),
+            lambda rows: serialize_matches(rows, include_names=True),
+        )
+    limit, after = page_args()
+    if limit is None:
+        matches = query.order_by(Match.id).all()
+        return jsonify(serialize_matches(matches, include_names=True)), 200
+
+    matches, next_cursor = paginate(
+        query, [(Match.id, "asc")], limit, after, lambda m: [m.id]
+    )
+    return (
+        jsonify(
+            items=serialize_matches(matches, include_names=True),
+            next_cursor=next_cursor,
+        ),
+        200,
+    )
+
+
+@bp.route("/bracket", methods=["POST"])
 @jwt_required()
-def update_match(match_id):
+def create_bracket():
+    """Generate a full single/double elimination bracket for an event.
+
+    Body: {"event_id", "format": "single"|"double", "seeds": [entrant ids],
+    "shuffle": bool}. Unseeded entrants follow in registration order.
+    """
+    data = request.get_json() or {}
+    log.debug("create_bracket payload", extra={"payload": data})
+
     try:
-        match = Match.query.get_or_404(match_id)
-        data = request.get_json() or {}
-        for key, value in data.items():
-            setattr(match, key, value)
+        event_id = data.get("event_id")
+        if not event_id:
+            return jsonify(error="event_id is required"), 400
+
+        matches = generate_bracket(
+            int(event_id),
+            fmt=data.get("format", "single"),
+            seeds=data.get("seeds"),
+            shuffle=bool(data.get("shuffle", False)),
+        )
+        bump_event_versions([event_id])
+        db.session.commit()
+
+        created = serialize_matches(matches, include_names=True)
+        _publish_created(created)
+        log.info(
+            "Created bracket",
+            extra={"event_id": event_id, "matches": len(matches)},
+        )
+        return jsonify(created), 201
+    except BracketError as e:
+        db.session.rollback()
+        return jsonify(error=str(e)), e.status
+    except Exception:
+        db.session.rollback()
+        log.exception("Error creating bracket")
+        return jsonify(error="Failed to create bracket"), 500
+
+
+@bp.route("/swiss", methods=["POST"])
+@jwt_required()
+def create_swiss_round():
+    """Pair the next Swiss round for an event from its match history.
+
+    Body: {"event_id", "round": optional explicit round number}.
+    """
+    data = request.get_json() or {}
+    log.debug("create_swiss_round payload", extra={"payload": data})
+
+    try:
+        event_id = data.get("event_id")
+        if not event_id:
+            return jsonify(error="event_id is required"), 400
+        round_num = int(data["round"]) if data.get("round") else None
+
+        matches = generate_swiss_round(int(event_id), round_num)
+        bump_event_versions([event_id])
         db.session.commit()
-        print(f"✅ Updated match {match_id}")
-        return jsonify(match.to_dict(include_names=True)), 200
-    except Exception as e:
+
+        created = serialize_matches(matches, include_names=True)
+        _publish_created(created)
+        log.info(
+            "Paired Swiss round",
+            extra={"event_id": event_id, "matches": len(matches)},
+        )
+        return jsonify(created), 201
+    except BracketError as e:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error updating match {match_id}: {e}")
+        return jsonify(error=str(e)), e.status
+    except Exception:
+        db.session.rollback()
+        log.exception("Error pairing Swiss round")
+        return jsonify(error="Failed to pair Swiss round"), 500
+
+
+def _check_match(before, after, changes):
+    entrants = (after["entrant1_id"], after["entrant2_id"])
+    if entrants[0] is not None and entrants[0] == entrants[1]:
+        raise PatchError("Entrants must be distinct")
+    if after["winner_id"] is not None and after["winner_id"] not in entrants:
+        raise PatchError("Winner ID must match one of the entrants")
+    moved = [
+        changes[key]
+        for key in ("entrant1_id", "entrant2_id")
+        if changes.get(key) is not None
+    ]
+    if moved:
+        found = set(
+            db.session.scalars(
+                select(Entrant.id).where(
+                    Entrant.id.in_(moved), Entrant.event_id == after["event_id"]
+                )
+            )
+        )
+        outsiders = [entrant_id for entrant_id in moved if entrant_id not in found]
+        if outsiders:
+            raise PatchError(
+                f"Entrant {outsiders[0]} is not in event {after['event_id']}"
+            )
+
+
+@bp.route("/<int:match_id>", methods=["PUT", "PATCH"])
+@jwt_required()
+def update_match(match_id):
+    """Update a Match's entrants, winner, round and/or scores.
+
+    Send "version" to fail with 409 if the match changed since it was read.
+    PATCH returns only {id, version, <changed fields>}; PUT the full match.
+    """
+    try:
+        values, expected = parse_patch(
+            request.get_json(silent=True), MATCH_PATCH_FIELDS
+        )
+        score = values.pop("scores", None)
+        if score is not None:
+            values.update(score_fields(score))
+        with track_changes(Match) as touched:
+            patch = apply_patch(
+                Match,
+                match_id,
+                values,
+                expected,
+                columns=MATCH_COLUMNS,
+                check=_check_match,
+            )
+            if not patch.changes:
+                return _updated_match_response(patch)
+            before, after = patch.before, patch.after
+            if "scores" in patch.changes:
+                set_games(match_id, score, replace=has_games(before["scores"]))
+            # Record this result before advancing, so walkovers it triggers see it
+            record_change(
+                Result(*(before[f] for f in Result._fields)),
+                Result(*(after[f] for f in Result._fields)),
+            )
+            if after["bracket"] and after["winner_id"] != before["winner_id"]:
+                advance_match(db.session.get(Match, match_id))
+            bump_event_versions([after["event_id"]])
+            db.session.commit()
+        match = db.session.get(Match, match_id)
+        changed = [match] + [m for m in touched.values() if m.id != match_id]
+        for item in serialize_matches(changed, include_names=True):
+            publish(item["event_id"], "match.updated", item)
+        log.info(
+            "Updated match",
+            extra={"match_id": match_id, "fields": sorted(patch.changes)},
+        )
+        return _updated_match_response(patch, match)
+    except PatchError as e:
+        db.session.rollback()
+        return patch_error_response(e)
+    except BracketError as e:
+        db.session.rollback()
+        return jsonify(error=str(e)), e.status
+    except Exception:
+        db.session.rollback()
+        log.exception("Error updating match", extra={"match_id": match_id})
         return jsonify(error="Failed to update match"), 500
 
 
+def _updated_match_response(patch, match=None):
+    if request.method == "PATCH":
+        return jsonify(id=patch.id, version=patch.version, **patch.changes), 200
+    match = match or db.session.get(Match, patch.id)
+    return jsonify(match.to_dict(include_names=True)), 200
+
+
 @bp.route("/<int:match_id>", methods=["DELETE"])
 @jwt_required()
 def delete_match(match_id):
     try:
         match = Match.query.get_or_404(match_id)
+        before = snapshot(match)
+        if has_games(match.scores):
+            delete_games([match_id])
         db.session.delete(match)
+        db.session.flush()
+        record_change(before, None)
+        bump_event_versions([before.event_id])
         db.session.commit()
-        print(f"✅ Deleted match {match_id}")
+        publish(before.event_id, "match.deleted", {"id": match_id})
+        log.info("Deleted match", extra={"match_id": match_id})
         return "", 204
-    except Exception as e:
+    except Exception:
         db.session.rollback()
-        traceback.print_exc()
-        print(f"❌ Error deleting match {match_id}: {e}")
+        log.exception("Error deleting match", extra={"match_id": match_id})
         return jsonify(error="Failed to delete match"), 500
@@ -0,0 +1,39 @@
+# File: backend/routes/metrics.py
+# Purpose: Prometheus scrape endpoint.
+# Notes:
+# - GET /metrics renders the per-route registry from backend/metrics.py plus
+#   response cache counters. Numbers are per process (one series per worker).
+# - 404 when METRICS_ENABLED is off.
+
+from flask import Blueprint, Response, abort
+
+from backend.metrics import get_metrics
+from backend.response_cache import get_response_cache
+
+metrics_bp = Blueprint("metrics", __name__)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+CACHE_SERIES = (
+    ("hits", "counter", "Response cache hits."),
+    ("misses", "counter", "Response cache misses."),
+    ("evictions", "counter", "Response cache entries evicted by size."),
+    ("invalidations", "counter", "Response cache invalidations by writes."),
+    ("size", "gauge", "Response cache entries held."),
+)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    registry = get_metrics()
+    if registry is None:
+        abort(404)
+
+    extra = []
+    cache = get_response_cache()
+    if cache is not None:
+        stats = cache.stats()
+        for key, kind, help_text in CACHE_SERIES:
+            suffix = "_total" if kind == "counter" else "_entries"
+            extra.append((f"response_cache_{key}{suffix}", kind, help_text, stats[key]))
+    return Response(registry.render(extra), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,204 @@
+# File: backend/scores.py
+# Purpose: Parse, validate and store structured match scores; per-entrant game
+#          and point totals aggregated in SQL.
+# Notes:
+# - Accepted "scores" values (always entrant1 first):
+#     "2-1"                   games won by each side (no per-game detail)
+#     "21-15, 18-21, 21-19"   per-game points, two or more games
+#     [[21, 15], [18, 21]]    the same as a JSON list of pairs (two or more)
+#     "BYE"                   bracket / Swiss bye marker
+#   A single "X-Y" is always read as games won, as before.
+# - Match.scores keeps the normalized text for display; Match.games1/games2
+#   hold the game counts and MatchGame rows the per-game points. Standings
+#   and aggregates read the integer columns, never the text.
+# - MatchGame has no ORM relationship (like Standing): write paths replace
+#   rows with set_games() and deletes go through delete_games(), so SQLite
+#   without foreign key enforcement never keeps orphans. Normalized text has
+#   a comma exactly when per-game rows exist (has_games), which lets writes
+#   skip the DELETE for the common "2-1" case.
+
+import re
+from collections import namedtuple
+
+from sqlalchemy import and_, delete, func, insert, or_, select, union_all
+from sqlalchemy.orm import aliased
+
+from backend.models import db, Match, MatchGame
+
+BYE_SCORE = "BYE"  # scores of a bye (one entrant, no games)
+
+Score = namedtuple("Score", "text games1 games2 points")
+
+EMPTY = Score(None, None, None, ())
+PAIR_RE = re.compile(r"^\s*(\d+)\s*-\s*(\d+)\s*$")
+MAX_GAMES = 15
+MAX_POINTS = 10_000
+FORMAT_HINT = (
+    'scores must be games won ("2-1"), per-game points ("21-15, 18-21") or "BYE"'
+)
+
+
+class ScoreError(ValueError):
+    """Invalid scores value; the message is safe to show clients."""
+
+
+def _pair(value):
+    if isinstance(value, str):
+        found = PAIR_RE.match(value)
+        if not found:
+            raise ScoreError(FORMAT_HINT)
+        a, b = int(found.group(1)), int(found.group(2))
+    elif isinstance(value, (list, tuple)) and len(value) == 2:
+        a, b = value
+        if not all(isinstance(v, int) and not isinstance(v, bool) for v in (a, b)):
+            raise ScoreError("Game scores must be whole numbers")
+        if a < 0 or b < 0:
+            raise ScoreError("Game scores cannot be negative")
+    else:
+        raise ScoreError(FORMAT_HINT)
+    if a > MAX_POINTS or b > MAX_POINTS:
+        raise ScoreError(f"Game scores cannot exceed {MAX_POINTS}")
+    return a, b
+
+
+def _per_game(pairs):
+    if len(pairs) < 2:
+        raise ScoreError("Per-game scores need at least two games")
+    if len(pairs) > MAX_GAMES:
+        raise ScoreError(f"At most {MAX_GAMES} games per match")
+    if any(a == b for a, b in pairs):
+        raise ScoreError("Each game needs a winner (no tied games)")
+    text = ", ".join(f"{a}-{b}" for a, b in pairs)
+    won1 = sum(a > b for a, b in pairs)
+    return Score(text, won1, len(pairs) - won1, tuple(pairs))
+
+
+def parse_scores(value):
+    """Validate a scores value into a normalized Score; raises ScoreError."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return EMPTY
+    if isinstance(value, str):
+        if value.strip().upper() == BYE_SCORE:
+            return Score(BYE_SCORE, None, None, ())
+        parts = value.split(",")
+        if len(parts) > 1:
+            return _per_game([_pair(p) for p in parts])
+        games1, games2 = _pair(value)
+        if games1 > MAX_GAMES or games2 > MAX_GAMES:
+            raise ScoreError(f"At most {MAX_GAMES} games per match")
+        return Score(f"{games1}-{games2}", games1, games2, ())
+    if isinstance(value, (list, tuple)) and value:
+        return _per_game([_pair(p) for p in value])
+    raise ScoreError(FORMAT_HINT)
+
+
+def score_fields(score):
+    """Column values for a Score (for Match(**fields) and bulk inserts)."""
+    return {"scores": score.text, "games1": score.games1, "games2": score.games2}
+
+
+def game_rows(match_id, score):
+    return [
+        {"match_id": match_id, "number": n, "points1": a, "points2": b}
+        for n, (a, b) in enumerate(score.points, start=1)
+    ]
+
+
+def has_games(scores_text):
+    """True when a match with this (normalized) scores text has MatchGame rows."""
+    return bool(scores_text) and "," in scores_text
+
+
+def set_games(match_id, score, replace=True):
+    """Store score's per-game points; replace=True first drops existing rows."""
+    if replace:
+        db.session.execute(delete(MatchGame).where(MatchGame.match_id == match_id))
+    rows = game_rows(match_id, score)
+    if rows:
+        db.session.execute(insert(MatchGame), rows)
+
+
+def delete_games(match_ids):
+    """Delete the games of match_ids (a list of ids or a SELECT of ids)."""
+    db.session.execute(
+        delete(MatchGame).where(MatchGame.match_id.in_(match_ids)),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def entrant_totals(event_id, decided_only=True):
+    """Subquery of per-entrant games/points won and lost for an event.
+
+    Columns: entrant_id, games_won, games_lost, points_won, points_lost. Each
+    head-to-head match contributes one row per side (UNION ALL), so one
+    GROUP BY sums both seats. With decided_only, undecided matches are left
+    out, matching what standings count.
+    """
+    event_matches = aliased(Match)
+    points = (
+        select(
+            MatchGame.match_id,
+            func.sum(MatchGame.points1).label("p1"),
+            func.sum(MatchGame.points2).label("p2"),
+        )
+        .join(event_matches, event_matches.id == MatchGame.match_id)
+        .where(event_matches.event_id == event_id)
+        .group_by(MatchGame.match_id)
+        .subquery()
+    )
+    conditions = [
+        Match.event_id == event_id,
+        Match.entrant1_id.isnot(None),
+        Match.entrant2_id.isnot(None),
+    ]
+    if decided_only:
+        conditions.append(
+            or_(
+                Match.winner_id == Match.entrant1_id,
+                Match.winner_id == Match.entrant2_id,
+            )
+        )
+
+    def side(entrant, won, lost, p_won, p_lost):
+        return (
+            select(
+                entrant.label("entrant_id"),
+                func.coalesce(won, 0).label("games_won"),
+                func.coalesce(lost, 0).label("games_lost"),
+                func.coalesce(p_won, 0).label("points_won"),
+                func.coalesce(p_lost, 0).label("points_lost"),
+            )
+            .select_from(Match)
+            .outerjoin(points, points.c.match_id == Match.id)
+            .where(and_(*conditions))
+        )
+
+    seats = union_all(
+        side(Match.entrant1_id, Match.games1, Match.games2, points.c.p1, points.c.p2),
+        side(Match.entrant2_id, Match.games2, Match.games1, points.c.p2, points.c.p1),
+    ).subquery()
+    return (
+        select(
+            seats.c.entrant_id,
+            func.sum(seats.c.games_won).label("games_won"),
+            func.sum(seats.c.games_lost).label("games_lost"),
+            func.sum(seats.c.points_won).label("points_won"),
+            func.sum(seats.c.points_lost).label("points_lost"),
+        )
+        .group_by(seats.c.entrant_id)
+        .subquery("entrant_totals")
+    )
+
+
+def game_totals(event_id, decided_only=True):
+    """{entrant_id: {games_won, games_lost, points_won, points_lost}}."""
+    totals = entrant_totals(event_id, decided_only)
+    return {
+        row.entrant_id: {
+            "games_won": row.games_won,
+            "games_lost": row.games_lost,
+            "points_won": row.points_won,
+            "points_lost": row.points_lost,
+        }
+        for row in db.session.execute(select(totals))
+    }
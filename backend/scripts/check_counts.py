@@ -0,0 +1,43 @@
+# File: backend/scripts/check_counts.py
+# Purpose: Compare each event's stored entrant counts with its entrants table
+#          rows and optionally repair them (backend/entrant_counts.py).
+# Notes:
+# - Read-only unless --fix; exits 1 when mismatches remain, so it can run as
+#   a scheduled consistency check.
+# - Drift only comes from writes that bypass the app (manual SQL, restores).
+# - Run with: npm run db:check-counts (-- --fix)
+
+import argparse
+import sys
+
+from backend.app import create_app
+from backend.entrant_counts import check_entrant_counts
+from backend.models import db
+
+
+def run(argv=None):
+    parser = argparse.ArgumentParser(description="Check event entrant counts")
+    parser.add_argument("--fix", action="store_true", help="repair mismatches")
+    args = parser.parse_args(argv)
+
+    app = create_app()
+    with app.app_context():
+        mismatches = check_entrant_counts(fix=args.fix)
+        for event_id, stored, actual in mismatches:
+            print(
+                f"⚠️ Event {event_id}: stored {stored[0]} ({stored[1]} active), "
+                f"actual {actual[0]} ({actual[1]} active)"
+            )
+        if args.fix:
+            db.session.commit()
+            print(f"✅ Repaired {len(mismatches)} event(s)")
+            return 0
+        if mismatches:
+            print(f"❌ {len(mismatches)} event(s) out of step; rerun with --fix")
+            return 1
+        print("✅ Entrant counts are consistent")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
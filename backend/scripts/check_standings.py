@@ -0,0 +1,42 @@
+# File: backend/scripts/check_standings.py
+# Purpose: Compare stored standings with a recompute from each event's
+#          matches and optionally repair them (backend/standings.py).
+# Notes:
+# - Read-only unless --fix; exits 1 when mismatches remain, so it can run as
+#   a scheduled consistency check.
+# - Databases upgraded before the standings backfill, writes that bypass the
+#   app, and rows left by deleted or moved entrants all show up here.
+# - Run with: npm run db:check-standings (-- --fix)
+
+import argparse
+import sys
+
+from backend.app import create_app
+from backend.models import db
+from backend.standings import check_standings
+
+
+def run(argv=None):
+    parser = argparse.ArgumentParser(description="Check event standings")
+    parser.add_argument("--fix", action="store_true", help="repair mismatches")
+    args = parser.parse_args(argv)
+
+    app = create_app()
+    with app.app_context():
+        mismatches = check_standings(fix=args.fix)
+        for event_id, entrant_ids in mismatches:
+            listed = ", ".join(str(i) for i in entrant_ids[:10])
+            print(f"⚠️ Event {event_id}: standings differ for entrant(s) {listed}")
+        if args.fix:
+            db.session.commit()
+            print(f"✅ Rebuilt standings for {len(mismatches)} event(s)")
+            return 0
+        if mismatches:
+            print(f"❌ {len(mismatches)} event(s) out of step; rerun with --fix")
+            return 1
+        print("✅ Standings are consistent")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run())
@@ -1,95 +1,401 @@
 # File: backend/scripts/seed_db.py
 # Purpose: Load JSON seed data into the Flask DB.
 # Notes:
-# - Reads from backend/seeds/events.json, entrants.json, matches.json
-# - Inserts into SQLAlchemy models via Flask app context.
+# - Reads events.json, entrants.json, matches.json from backend/seeds (or --dir).
+# - Seed files are streamed element by element (iter_json_array), so a
+#   million-match file never has to fit in memory as one parsed list.
+# - Rows go in batches through one precompiled INSERT and the driver's
+#   executemany; on PostgreSQL each batch is sent with COPY instead.
+# - Secondary indexes are dropped for the load and rebuilt once at the end.
+#   Everything runs in one transaction.
+# - Per-game points are inserted with each match batch. next_match_id /
+#   loser_match_id can point forward, so they are applied by a second UPDATE
+#   pass that re-streams matches.json (only if it has links) once every match
+#   exists; neither is held in memory for the whole file.
 # - Seeds exactly one admin user (no logins for BYE or entrants).
-# - Resets Postgres sequences to avoid duplicate key issues.
+# - Resets id sequences per dialect so later inserts don't collide, then
+#   recomputes event entrant counts and standings (bulk inserts bypass the
+#   incremental write paths).
 # - Run with: npm run db:clear && npm run db:seed
 
-import os
+import argparse
+import csv
+import io
 import json
+import os
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.sql import text
+
 from backend.app import create_app
-from backend.models import db, Event, Entrant, Match, User
+from backend.entrant_counts import repair_entrant_counts
+from backend.models import db, Event, Entrant, Match, MatchGame, User, utcnow
+from backend.scores import game_rows, parse_scores, score_fields
+from backend.standings import rebuild_standings
 
 SEED_DIR = os.path.join(os.path.dirname(__file__), "..", "seeds")
+BATCH_SIZE = 5000
+CHUNK_SIZE = 1 << 16
+SEQUENCE_TABLES = ("events", "entrants", "matches")
 
 
-def load_seed(filename):
-    with open(os.path.join(SEED_DIR, filename), "r") as f:
-        return json.load(f)
+def iter_json_array(path, chunk_size=CHUNK_SIZE):
+    """Yield the elements of a top-level JSON array one at a time.
 
+    Reads the file in chunks and decodes each element with raw_decode, so
+    memory stays proportional to one element rather than the whole file.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as fh:
+        buf, pos, eof = "", 0, False
 
-def run():
-    app = create_app()
-    with app.app_context():
-        print("🌱 Seeding database...")
+        def refill():
+            nonlocal buf, pos, eof
+            chunk = fh.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
 
-        events = load_seed("events.json")
-        entrants = load_seed("entrants.json")
-        matches = load_seed("matches.json")
+        state = "start"
+        while True:
+            while pos < len(buf) and buf[pos].isspace():
+                pos += 1
+            if pos >= len(buf):
+                if eof:
+                    raise ValueError(f"{path}: unexpected end of JSON array")
+                refill()
+                continue
 
-        # Insert Events
-        for e in events:
-            db.session.add(
-                Event(id=e["id"], name=e["name"], date=e["date"], status=e["status"])
-            )
+            char = buf[pos]
+            if state == "start":
+                if char != "[":
+                    raise ValueError(f"{path}: expected a JSON array")
+                pos, state = pos + 1, "first"
+            elif char == "]" and state in ("first", "next"):
+                return
+            elif state == "first":
+                state = "value"
+            elif state == "next":
+                if char != ",":
+                    raise ValueError(f"{path}: expected ',' or ']'")
+                pos, state = pos + 1, "value"
+            else:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    if eof:
+                        raise
+                    refill()  # element continues in the next chunk
+                    continue
+                if end == len(buf) and not eof:
+                    refill()  # a bare number could still be cut off
+                    continue
+                yield item
+                pos, state = end, "next"
+
+
+def batched(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+# ------------------------
+# Seed record -> row dicts (every column present, so COPY sees full rows)
+# ------------------------
+def event_rows(records):
+    now = utcnow()
+    for e in records:
+        yield {
+            "id": e["id"],
+            "name": e["name"],
+            "date": e.get("date"),
+            "rules": e.get("rules"),
+            "status": e["status"],
+            "version": 1,
+            "updated_at": now,
+            "entrant_count": 0,  # set by repair_entrant_counts() after the load
+            "active_entrant_count": 0,
+        }
+
+
+def entrant_rows(records):
+    for en in records:
+        yield {
+            "id": en["id"],
+            "name": en["name"],
+            "alias": en.get("alias"),
+            "event_id": en["event_id"],
+            "dropped": en.get("dropped", False),
+            "version": 1,
+        }
+
+
+def match_rows(records, games):
+    """Match rows without bracket links (see link_rows).
+
+    Scores are parsed like the API does (backend/scores.py); per-game points
+    are appended to `games` for the caller to insert with the batch.
+    """
+    for m in records:
+        score = parse_scores(m.get("scores"))
+        games.extend(game_rows(m["id"], score))
+        yield {
+            "id": m["id"],
+            "event_id": m["event_id"],
+            "round": m.get("round"),
+            "entrant1_id": m.get("entrant1_id"),
+            "entrant2_id": m.get("entrant2_id"),
+            **score_fields(score),
+            "winner_id": m.get("winner_id"),
+            "bracket": m.get("bracket"),
+            "position": m.get("position"),
+            "next_match_slot": m.get("next_match_slot"),
+            "loser_match_slot": m.get("loser_match_slot"),
+            "version": 1,
+        }
+
+
+def link_rows(records):
+    """Bracket links (next/loser match ids) for the second pass."""
+    for m in records:
+        if m.get("next_match_id") or m.get("loser_match_id"):
+            yield {
+                "match_id": m["id"],
+                "next_id": m.get("next_match_id"),
+                "loser_id": m.get("loser_match_id"),
+            }
+
+
+# ------------------------
+# Loading
+# ------------------------
+def _copy_batch(conn, table, batch):
+    """Send one batch through PostgreSQL COPY (CSV, \\N for NULL)."""
+    columns = list(batch[0])
+    out = io.StringIO()
+    writer = csv.writer(out)
+    for row in batch:
+        writer.writerow(["\\N" if row[c] is None else row[c] for c in columns])
+    out.seek(0)
+    cursor = conn.connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table.name} ({', '.join(columns)}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            out,
+        )
+    finally:
+        cursor.close()
+
+
+@contextmanager
+def secondary_indexes_dropped(conn, table):
+    """Drop a table's non-PK indexes for the load and rebuild them after.
+
+    Building an index once over the loaded rows is much cheaper than
+    updating it on every insert.
+    """
+    for index in table.indexes:
+        index.drop(conn, checkfirst=True)
+    try:
+        yield
+    finally:
+        # DDL isn't transactional everywhere (MySQL), so rebuild even on failure
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def _executemany_batch(conn, table, batch):
+    """INSERT one batch via the driver's executemany.
+
+    The statement is compiled once and rows go in as plain tuples (after the
+    column types' bind processors), skipping Core's per-row parameter
+    building, which otherwise costs more than SQLite's own inserts.
+    """
+    columns = list(batch[0])
+    compiled = table.insert().compile(dialect=conn.dialect, column_keys=columns)
+    keys = list(compiled.positiontup) if compiled.positional else columns
+    processors = [
+        (key, table.c[key].type.dialect_impl(conn.dialect).bind_processor(conn.dialect))
+        for key in keys
+    ]
 
-        # Insert Entrants (skip creating logins for entrants)
-        for en in entrants:
-            db.session.add(
-                Entrant(
-                    id=en["id"],
-                    name=en["name"],
-                    alias=en["alias"],
-                    event_id=en["event_id"],
-                    dropped=en.get("dropped", False),
+    def params(row):
+        values = [proc(row[key]) if proc else row[key] for key, proc in processors]
+        return tuple(values) if compiled.positional else dict(zip(keys, values))
+
+    conn.exec_driver_sql(str(compiled), [params(row) for row in batch])
+
+
+def _batch_inserter(conn):
+    # copy_expert is psycopg2's API; other drivers use executemany
+    return _copy_batch if conn.dialect.driver == "psycopg2" else _executemany_batch
+
+
+def load_rows(conn, table, rows, batch_size=BATCH_SIZE):
+    """Insert rows in batches; COPY on PostgreSQL. Returns the row count."""
+    insert_batch = _batch_inserter(conn)
+    total = 0
+    with secondary_indexes_dropped(conn, table):
+        for batch in batched(rows, batch_size):
+            insert_batch(conn, table, batch)
+            total += len(batch)
+    return total
+
+
+def load_matches(conn, records, batch_size=BATCH_SIZE):
+    """Insert matches batch by batch, each followed by its per-game rows.
+
+    Returns (match count, matches with bracket links); memory holds one batch
+    of matches and games.
+    """
+    insert_batch = _batch_inserter(conn)
+    total = linked = 0
+    with secondary_indexes_dropped(conn, Match.__table__):
+        with secondary_indexes_dropped(conn, MatchGame.__table__):
+            for records in batched(records, batch_size):
+                games = []
+                insert_batch(conn, Match.__table__, list(match_rows(records, games)))
+                for batch in batched(games, batch_size):
+                    insert_batch(conn, MatchGame.__table__, batch)
+                total += len(records)
+                linked += sum(
+                    1
+                    for m in records
+                    if m.get("next_match_id") or m.get("loser_match_id")
                 )
-            )
+    return total, linked
 
-        # Insert Matches
-        for m in matches:
-            db.session.add(
-                Match(
-                    id=m["id"],
-                    round=m["round"],
-                    entrant1_id=m["entrant1_id"],
-                    entrant2_id=m["entrant2_id"],
-                    scores=m["scores"],
-                    winner_id=m["winner_id"],
-                    event_id=m["event_id"],
+
+def link_matches(conn, links, batch_size=BATCH_SIZE):
+    stmt = (
+        update(Match.__table__)
+        .where(Match.__table__.c.id == bindparam("match_id"))
+        .values(
+            next_match_id=bindparam("next_id"), loser_match_id=bindparam("loser_id")
+        )
+    )
+    for batch in batched(links, batch_size):
+        conn.execute(stmt, batch)
+
+
+def reset_sequences(conn):
+    """Move id generators past the seeded ids, per dialect."""
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        for table in SEQUENCE_TABLES:
+            conn.execute(
+                text(
+                    f"""
+                    SELECT setval(
+                      pg_get_serial_sequence('{table}', 'id'),
+                      COALESCE((SELECT MAX(id) FROM {table}), 0) + 1,
+                      false
+                    )
+                """
                 )
             )
-
-        # Create admin user if not exists
-        if not User.query.filter_by(email="admin@example.com").first():
-            admin = User(username="admin", email="admin@example.com")
-            admin.set_password("password123")
-            db.session.add(admin)
-
-        db.session.commit()
-
-        # Reset sequences so autoincrement picks up after max IDs
-        for table in ["events", "entrants", "matches"]:
-            seq_sql = text(
-                f"""
-                SELECT setval(
-                  pg_get_serial_sequence('{table}', 'id'),
-                  COALESCE((SELECT MAX(id) FROM {table}), 1) + 1,
-                  false
+    elif dialect == "sqlite":
+        # INTEGER PRIMARY KEY picks MAX(rowid) + 1; only AUTOINCREMENT tables
+        # keep a counter in sqlite_sequence.
+        has_counters = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'")
+        ).first()
+        if has_counters:
+            for table in SEQUENCE_TABLES:
+                conn.execute(
+                    text(
+                        f"UPDATE sqlite_sequence SET seq = "
+                        f"(SELECT COALESCE(MAX(id), 0) FROM {table}) "
+                        f"WHERE name = '{table}'"
+                    )
                 )
-            """
+    elif dialect in ("mysql", "mariadb"):
+        for table in SEQUENCE_TABLES:
+            next_id = conn.execute(
+                text(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
             )
-            db.session.execute(seq_sql)
+            conn.execute(
+                text(f"ALTER TABLE {table} AUTO_INCREMENT = {next_id.scalar()}")
+            )
+    else:
+        print(f"⚠️ Sequence reset not supported for {dialect}; skipped")
+
+
+def load_seed_dir(seed_dir=SEED_DIR, batch_size=BATCH_SIZE, standings=True):
+    """Bulk load a seed directory into the current session. Caller commits."""
+    conn = db.session.connection()
+
+    def path(name):
+        return os.path.join(seed_dir, name)
+
+    counts = {
+        "events": load_rows(
+            conn,
+            Event.__table__,
+            event_rows(iter_json_array(path("events.json"))),
+            batch_size,
+        ),
+        "entrants": load_rows(
+            conn,
+            Entrant.__table__,
+            entrant_rows(iter_json_array(path("entrants.json"))),
+            batch_size,
+        ),
+    }
+    counts["matches"], linked = load_matches(
+        conn, iter_json_array(path("matches.json")), batch_size
+    )
+    if linked:
+        link_matches(conn, link_rows(iter_json_array(path("matches.json"))), batch_size)
+    reset_sequences(conn)
+    repair_entrant_counts()
+
+    if standings:
+        event_ids = db.session.scalars(select(Event.id).order_by(Event.id)).all()
+        for event_id in event_ids:
+            rebuild_standings(event_id)
+        db.session.flush()
+
+    # Create admin user if not exists
+    if not db.session.scalar(
+        select(func.count()).select_from(User).where(User.email == "admin@example.com")
+    ):
+        admin = User(username="admin", email="admin@example.com")
+        admin.set_password("password123")
+        db.session.add(admin)
+    return counts
 
-        db.session.commit()
+
+def run(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk load JSON seed data")
+    parser.add_argument("--dir", default=SEED_DIR, help="directory of seed files")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument(
+        "--no-standings", action="store_true", help="skip rebuilding standings"
+    )
+    args = parser.parse_args(argv)
+
+    app = create_app()
+    with app.app_context():
+        print("🌱 Seeding database...")
+        start = time.perf_counter()
+        try:
+            counts = load_seed_dir(
+                args.dir, args.batch_size, standings=not args.no_standings
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
 
         print(
-            f"✅ Inserted {len(events)} events, "
-            f"{len(entrants)} entrants, "
-            f"{len(matches)} matches, "
-            f"+ admin user"
+            f"✅ Inserted {counts['events']} events, "
+            f"{counts['entrants']} entrants, "
+            f"{counts['matches']} matches, "
+            f"+ admin user in {time.perf_counter() - start:.1f}s"
         )
         print("🔄 Sequences reset for events, entrants, and matches.")
 
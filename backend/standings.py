@@ -0,0 +1,307 @@
+# File: backend/standings.py
+# Purpose: Incrementally maintained per-event standings (Standing rows).
+# Notes:
+# - Write paths call record_change(before, after) with snapshot()s of a match
+#   taken before and after the write; only decided matches (winner set) count.
+# - A match with a single entrant and a winner is a BYE: it counts as a win
+#   and a bye, with no opponent.
+# - opp_wins/opp_losses hold the sums of every opponent's record, so Buchholz
+#   and opponent win % are read straight off the row. When an entrant's record
+#   changes, each of its past opponents is adjusted by the same delta.
+# - Games come from the typed Match.games1/games2 columns (backend/scores.py);
+#   matches without game counts add none.
+# - Record each change as soon as it is made: opponent lookups read the
+#   session, so an unrecorded decided match would be double counted later.
+# - rebuild_standings() recomputes an event from scratch; check_standings()
+#   compares stored rows with that recompute (scripts/check_standings.py).
+# - Entrant and event deletes call delete_standings(): the FK's ON DELETE
+#   CASCADE never fires on SQLite (foreign keys stay off), and a leftover row
+#   would be picked up by whichever entrant later reuses the id.
+
+from collections import defaultdict, namedtuple
+
+from sqlalchemy import and_, delete, func, or_, select
+
+from backend.models import db, Entrant, Event, Match, Standing
+
+Result = namedtuple(
+    "Result", "id event_id entrant1_id entrant2_id winner_id games1 games2"
+)
+
+COUNTERS = ("wins", "losses", "byes", "games_won", "games_lost")
+
+
+def snapshot(match):
+    """Immutable copy of the fields that affect standings."""
+    if match is None:
+        return None
+    return Result(
+        match.id,
+        match.event_id,
+        match.entrant1_id,
+        match.entrant2_id,
+        match.winner_id,
+        match.games1,
+        match.games2,
+    )
+
+
+def _contributions(result):
+    """Return {entrant_id: {counter: delta}} for a decided result."""
+    a, b, w = result.entrant1_id, result.entrant2_id, result.winner_id
+    if w is None or w not in (a, b):
+        return {}
+    if a is None or b is None:
+        return {w: {"wins": 1, "byes": 1}}
+    g1, g2 = result.games1 or 0, result.games2 or 0
+    return {
+        a: {
+            "wins": int(w == a),
+            "losses": int(w != a),
+            "games_won": g1,
+            "games_lost": g2,
+        },
+        b: {
+            "wins": int(w == b),
+            "losses": int(w != b),
+            "games_won": g2,
+            "games_lost": g1,
+        },
+    }
+
+
+class _Rows:
+    """Get-or-create cache of Standing rows for one write."""
+
+    def __init__(self, event_id):
+        self.event_id = event_id
+        self.rows = {}
+
+    def __getitem__(self, entrant_id):
+        row = self.rows.get(entrant_id)
+        if row is None:
+            row = db.session.get(Standing, entrant_id) or next(
+                (
+                    obj
+                    for obj in db.session.new
+                    if isinstance(obj, Standing) and obj.entrant_id == entrant_id
+                ),
+                None,
+            )
+            if row is None:
+                row = Standing(entrant_id=entrant_id, event_id=self.event_id)
+                for column in COUNTERS + ("opp_wins", "opp_losses"):
+                    setattr(row, column, 0)
+                db.session.add(row)
+            self.rows[entrant_id] = row
+        return row
+
+
+def _opponent_ids(entrant_id, exclude_match_id):
+    """Opponent ids of every decided head-to-head match (one per match)."""
+    query = db.session.query(Match.entrant1_id, Match.entrant2_id).filter(
+        or_(Match.entrant1_id == entrant_id, Match.entrant2_id == entrant_id),
+        Match.entrant1_id.isnot(None),
+        Match.entrant2_id.isnot(None),
+        Match.winner_id.isnot(None),
+    )
+    if exclude_match_id is not None:
+        query = query.filter(Match.id != exclude_match_id)
+    return [e2 if e1 == entrant_id else e1 for e1, e2 in query]
+
+
+def _link(rows, a, b, sign):
+    """Add (sign=1) or remove (sign=-1) a and b from each other's opponent sums."""
+    ra, rb = rows[a], rows[b]
+    ra.opp_wins += sign * rb.wins
+    ra.opp_losses += sign * rb.losses
+    rb.opp_wins += sign * ra.wins
+    rb.opp_losses += sign * ra.losses
+
+
+def apply_result(result, sign):
+    """Add (sign=1) or remove (sign=-1) a decided result's effect."""
+    deltas = _contributions(result)
+    if not deltas:
+        return
+    rows = _Rows(result.event_id)
+    head_to_head = result.entrant1_id is not None and result.entrant2_id is not None
+
+    if head_to_head and sign < 0:
+        _link(rows, result.entrant1_id, result.entrant2_id, -1)
+
+    for entrant_id, delta in deltas.items():
+        row = rows[entrant_id]
+        for column, value in delta.items():
+            setattr(row, column, getattr(row, column) + sign * value)
+        d_wins = sign * delta.get("wins", 0)
+        d_losses = sign * delta.get("losses", 0)
+        if d_wins or d_losses:
+            for opponent in _opponent_ids(entrant_id, result.id):
+                opp = rows[opponent]
+                opp.opp_wins += d_wins
+                opp.opp_losses += d_losses
+
+    if head_to_head and sign > 0:
+        _link(rows, result.entrant1_id, result.entrant2_id, 1)
+
+
+def record_change(before, after):
+    """Move standings from a match's `before` snapshot to its `after` one.
+
+    Pass before=None for inserts and after=None for deletes. Opponent lookups
+    autoflush, so the session must already hold the match's new state.
+    """
+    if before == after:
+        return
+    if before is not None:
+        apply_result(before, -1)
+    if after is not None:
+        apply_result(after, 1)
+
+
+def compute_standings(event_id):
+    """{entrant_id: {column: value}} for an event, recomputed from its matches.
+
+    Only entrants with a decided match get an entry.
+    """
+    totals = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    opponents = defaultdict(list)
+    matches = db.session.query(
+        Match.id,
+        Match.event_id,
+        Match.entrant1_id,
+        Match.entrant2_id,
+        Match.winner_id,
+        Match.games1,
+        Match.games2,
+    ).filter(Match.event_id == event_id)
+    for m in matches:
+        result = Result(*m)
+        deltas = _contributions(result)
+        for entrant_id, delta in deltas.items():
+            for column, value in delta.items():
+                totals[entrant_id][column] += value
+        if deltas and None not in (m.entrant1_id, m.entrant2_id):
+            opponents[m.entrant1_id].append(m.entrant2_id)
+            opponents[m.entrant2_id].append(m.entrant1_id)
+
+    return {
+        entrant_id: {
+            **counters,
+            "opp_wins": sum(totals[o]["wins"] for o in opponents[entrant_id]),
+            "opp_losses": sum(totals[o]["losses"] for o in opponents[entrant_id]),
+        }
+        for entrant_id, counters in totals.items()
+    }
+
+
+def rebuild_standings(event_id):
+    """Recompute an event's standings from its matches. Caller commits."""
+    Standing.query.filter_by(event_id=event_id).delete()
+    rows = [
+        Standing(entrant_id=entrant_id, event_id=event_id, **values)
+        for entrant_id, values in compute_standings(event_id).items()
+    ]
+    db.session.add_all(rows)
+    return rows
+
+
+def check_standings(fix=False):
+    """List events whose stored standings disagree with their matches.
+
+    Returns [(event_id, entrant ids that differ)]. Rows left behind by a
+    deleted or moved entrant count against the event they name. With
+    fix=True those events are rebuilt and the orphaned rows deleted in the
+    current transaction (caller commits).
+    """
+    columns = COUNTERS + ("opp_wins", "opp_losses")
+    stored = defaultdict(dict)
+    orphans = defaultdict(list)
+    query = select(Standing, Entrant.event_id.label("entrant_event")).outerjoin(
+        Entrant, Entrant.id == Standing.entrant_id
+    )
+    for row, entrant_event in db.session.execute(query):
+        if entrant_event != row.event_id:
+            orphans[row.event_id].append(row.entrant_id)
+            continue
+        values = {c: getattr(row, c) for c in columns}
+        if any(values.values()):  # all-zero rows equal no row
+            stored[row.event_id][row.entrant_id] = values
+
+    mismatches = []
+    for event_id in db.session.scalars(select(Event.id).order_by(Event.id)):
+        actual = compute_standings(event_id)
+        differ = {
+            entrant_id
+            for entrant_id in stored[event_id].keys() | actual.keys()
+            if stored[event_id].get(entrant_id) != actual.get(entrant_id)
+        }
+        differ.update(orphans.pop(event_id, ()))
+        if differ:
+            mismatches.append((event_id, sorted(differ)))
+    # Rows naming an event that no longer exists
+    mismatches.extend((event_id, sorted(ids)) for event_id, ids in orphans.items())
+
+    if fix:
+        for event_id, entrant_ids in mismatches:
+            delete_standings(entrant_ids)
+            db.session.flush()
+            rebuild_standings(event_id)
+        db.session.flush()
+    return mismatches
+
+
+def delete_standings(entrant_ids):
+    """Delete the standings of entrant_ids (a list of ids or a SELECT of ids)."""
+    db.session.execute(
+        delete(Standing).where(Standing.entrant_id.in_(entrant_ids)),
+        execution_options={"synchronize_session": False},
+    )
+
+
+def get_standings(event_id):
+    """Ranked standings for every entrant of an event in one query.
+
+    Ordered by wins, Buchholz (opponents' total wins), game differential.
+    """
+    wins = func.coalesce(Standing.wins, 0)
+    buchholz = func.coalesce(Standing.opp_wins, 0)
+    game_diff = func.coalesce(Standing.games_won, 0) - func.coalesce(
+        Standing.games_lost, 0
+    )
+    rows = (
+        db.session.query(Entrant, Standing)
+        .outerjoin(
+            Standing,
+            and_(Standing.entrant_id == Entrant.id, Standing.event_id == event_id),
+        )
+        .filter(Entrant.event_id == event_id)
+        .order_by(wins.desc(), buchholz.desc(), game_diff.desc(), Entrant.id)
+        .all()
+    )
+
+    standings = []
+    for rank, (entrant, standing) in enumerate(rows, start=1):
+        counts = {
+            column: getattr(standing, column) if standing else 0
+            for column in COUNTERS + ("opp_wins", "opp_losses")
+        }
+        opp_games = counts["opp_wins"] + counts["opp_losses"]
+        standings.append(
+            {
+                "rank": rank,
+                "entrant": entrant.to_dict(),
+                "wins": counts["wins"],
+                "losses": counts["losses"],
+                "byes": counts["byes"],
+                "games_won": counts["games_won"],
+                "games_lost": counts["games_lost"],
+                "game_diff": counts["games_won"] - counts["games_lost"],
+                "buchholz": counts["opp_wins"],
+                "opp_win_pct": (
+                    round(counts["opp_wins"] / opp_games, 4) if opp_games else None
+                ),
+            }
+        )
+    return standings
@@ -0,0 +1,49 @@
+# File: backend/streaming.py
+# Purpose: NDJSON streaming helpers for large collection exports.
+# Notes:
+# - Clients opt in with ?stream=1 or "Accept: application/x-ndjson".
+# - Rows are pulled from the DB in batches (yield_per) and written one JSON
+#   object per line, so neither the full ORM result nor the full JSON body
+#   is ever held in memory.
+
+import json
+from itertools import islice
+
+from flask import Response, request, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_BATCH_SIZE = 500
+
+
+def wants_stream():
+    """True when the client asked for an NDJSON stream."""
+    if request.args.get("stream", "").lower() in ("1", "true", "yes"):
+        return True
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+
+def iter_batches(query, batch_size=STREAM_BATCH_SIZE):
+    """Yield lists of rows from query, fetched batch_size at a time."""
+    rows = iter(query.yield_per(batch_size))
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def ndjson_response(query, serialize_batch, batch_size=STREAM_BATCH_SIZE):
+    """Stream query results as NDJSON.
+
+    serialize_batch(rows) turns one batch of rows into a list of dicts, which
+    lets callers resolve related data (e.g. entrant names) once per batch.
+    """
+
+    def generate():
+        for batch in iter_batches(query, batch_size):
+            yield "".join(
+                json.dumps(item, separators=(",", ":")) + "\n"
+                for item in serialize_batch(batch)
+            )
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
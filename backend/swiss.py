@@ -0,0 +1,211 @@
+# File: backend/swiss.py
+# Purpose: Swiss-system pairing for events, driven by existing Match history.
+# Notes:
+# - Standings: 1 point per win (BYEs count as wins), ordered by points then
+#   Buchholz (sum of opponents' points), then entrant id.
+# - Pairing walks the standings top-down and gives each player the closest
+#   ranked opponent they haven't met, backtracking when a choice leaves the
+#   rest unpairable. Sorted order keeps score groups together, so lookups stay
+#   near-linear even at a few thousand players. If the search budget runs
+#   out, a greedy pass pairs the round instead, rematching only players with
+#   nobody unmet left rather than failing the round.
+# - With an odd field, the lowest-ranked player without a previous BYE sits out.
+
+from collections import defaultdict
+
+from sqlalchemy import func, insert, or_
+
+from backend.brackets import BYE_SCORE, BracketError
+from backend.models import db, Entrant, Event, Match
+from backend.standings import record_change, snapshot
+
+SWISS = "swiss"
+PAIRING_STEP_BUDGET = 200_000
+
+
+def standings_from_matches(entrant_ids, matches):
+    """Return (points, opponents, had_bye) dicts for entrant_ids.
+
+    matches is any iterable of objects with entrant1_id/entrant2_id/winner_id
+    and scores. Only decided results score points.
+    """
+    points = {eid: 0 for eid in entrant_ids}
+    opponents = defaultdict(set)
+    had_bye = set()
+    for m in matches:
+        a, b = m.entrant1_id, m.entrant2_id
+        if a is not None and b is not None:
+            opponents[a].add(b)
+            opponents[b].add(a)
+        elif m.scores == BYE_SCORE:
+            had_bye.add(a if a is not None else b)
+        if m.winner_id in points:
+            points[m.winner_id] += 1
+    return points, opponents, had_bye
+
+
+def rank_players(entrant_ids, points, opponents):
+    def buchholz(eid):
+        return sum(points.get(o, 0) for o in opponents.get(eid, ()))
+
+    return sorted(entrant_ids, key=lambda eid: (-points[eid], -buchholz(eid), eid))
+
+
+def pair_round(ranked, opponents, budget=PAIRING_STEP_BUDGET):
+    """Pair an even-length ranked list, avoiding rematches when possible.
+
+    Returns a list of (higher_ranked, lower_ranked) tuples.
+    """
+    pairs = _search(ranked, opponents, budget)
+    if pairs is None:
+        pairs = _greedy(ranked, opponents)
+    return pairs
+
+
+def _greedy(ranked, opponents):
+    """Budget fallback: pair top-down with the nearest unmet opponent.
+
+    Players nobody unmet is left for wait (deferred) and are offered to each
+    later player first; whoever is still deferred at the end is paired in
+    rank order, which is where the (few) rematches go.
+    """
+    rank = {eid: i for i, eid in enumerate(ranked)}
+    free = list(reversed(ranked))  # pop() takes the highest ranked
+    deferred, pairs = [], []
+    while free:
+        a = free.pop()
+        met = opponents.get(a, ())
+        b = next((d for d in deferred if d not in met), None)
+        if b is not None:
+            deferred.remove(b)
+        else:
+            b = next((f for f in reversed(free) if f not in met), None)
+            if b is None:
+                deferred.append(a)
+                continue
+            free.remove(b)
+        pairs.append((a, b))
+    pairs.extend(zip(deferred[::2], deferred[1::2]))
+    pairs = [tuple(sorted(pair, key=rank.get)) for pair in pairs]
+    return sorted(pairs, key=lambda pair: rank[pair[0]])
+
+
+def _search(ranked, opponents, budget):
+    n = len(ranked)
+    used = [False] * n
+    stack = []  # (i, j) index pairs chosen so far
+    i, j = 0, 0  # current player and next candidate to try
+    steps = 0
+
+    while True:
+        while i < n and used[i]:
+            i += 1
+        if i == n:
+            return [(ranked[a], ranked[b]) for a, b in stack]
+
+        used[i] = True
+        met = opponents.get(ranked[i], ())
+        j = max(j, i + 1)
+        while j < n and (used[j] or ranked[j] in met):
+            j += 1
+            steps += 1
+
+        if j < n:
+            used[j] = True
+            stack.append((i, j))
+            i, j = i + 1, 0
+            continue
+
+        # Dead end: undo the last pair and try that player's next candidate
+        used[i] = False
+        if not stack or steps > budget:
+            return None
+        i, j = stack.pop()
+        used[i] = used[j] = False
+        j += 1
+        steps += 1
+
+
+def generate_swiss_round(event_id, round_num=None):
+    """Pair the next Swiss round for an event and insert its matches.
+
+    Caller commits. Returns the inserted Match objects (BYE last).
+    """
+    if db.session.get(Event, event_id) is None:
+        raise BracketError("Event not found", status=404)
+
+    last_round = (
+        db.session.query(func.max(Match.round))
+        .filter(Match.event_id == event_id, Match.bracket == SWISS)
+        .scalar()
+    ) or 0
+    if round_num is None:
+        round_num = last_round + 1
+    elif round_num <= last_round:
+        raise BracketError(f"Round {round_num} is already paired", status=409)
+
+    pending = Match.query.filter(
+        Match.event_id == event_id,
+        Match.bracket == SWISS,
+        Match.winner_id.is_(None),
+        or_(Match.scores.is_(None), Match.scores != BYE_SCORE),
+    ).first()
+    if pending is not None:
+        raise BracketError("Previous Swiss round has unreported matches", status=409)
+
+    entrant_ids = [
+        row.id
+        for row in db.session.query(Entrant.id).filter_by(
+            event_id=event_id, dropped=False
+        )
+    ]
+    if len(entrant_ids) < 2:
+        raise BracketError("At least two active entrants are required")
+
+    history = db.session.query(
+        Match.entrant1_id, Match.entrant2_id, Match.winner_id, Match.scores
+    ).filter(Match.event_id == event_id)
+    points, opponents, had_bye = standings_from_matches(entrant_ids, history)
+    ranked = rank_players(entrant_ids, points, opponents)
+
+    bye = None
+    if len(ranked) % 2:
+        bye = next((eid for eid in reversed(ranked) if eid not in had_bye), ranked[-1])
+        ranked.remove(bye)
+
+    rows = [
+        {
+            "event_id": event_id,
+            "bracket": SWISS,
+            "round": round_num,
+            "position": position,
+            "entrant1_id": a,
+            "entrant2_id": b,
+            "winner_id": None,
+            "scores": None,
+        }
+        for position, (a, b) in enumerate(pair_round(ranked, opponents))
+    ]
+    if bye is not None:
+        rows.append(
+            {
+                "event_id": event_id,
+                "bracket": SWISS,
+                "round": round_num,
+                "position": len(rows),
+                "entrant1_id": bye,
+                "entrant2_id": None,
+                "winner_id": bye,
+                "scores": BYE_SCORE,
+            }
+        )
+
+    # Sort by position rather than asking for RETURNING in parameter order,
+    # which makes SQLite insert one row at a time.
+    matches = sorted(
+        db.session.scalars(insert(Match).returning(Match), rows).all(),
+        key=lambda m: m.position,
+    )
+    if bye is not None:
+        record_change(None, snapshot(matches[-1]))
+    return matches
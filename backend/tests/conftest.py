@@ -4,9 +4,12 @@
 # - app: Flask app created via factory (uses TestConfig)
 # - client: Flask test client for API requests
 # - session: SQLAlchemy session scoped to test context
-# - Helpers: create_event, seed_event_with_entrants, auth_header
+# - Helpers: create_event, seed_event_with_entrants, auth_header, count_queries
 
 import pytest
+from contextlib import contextmanager
+from datetime import timedelta
+from sqlalchemy import event as sa_event
 from backend.app import create_app
 from backend.models import db, Event, Entrant
 from backend.config import TestConfig
@@ -68,6 +71,21 @@ def create_event(session):
     return _create_event
 
 
+@pytest.fixture
+def make_entrants(session):
+    """Helper to add `count` committed Entrants ("Hero 1".."Hero N") to an event."""
+
+    def _make_entrants(event, count):
+        entrants = [
+            Entrant(name=f"Hero {i + 1}", event_id=event.id) for i in range(count)
+        ]
+        session.add_all(entrants)
+        session.commit()
+        return entrants
+
+    return _make_entrants
+
+
 @pytest.fixture
 def seed_event_with_entrants(session, create_event):
     """Helper to create an Event with two Entrants."""
@@ -87,5 +105,36 @@ def seed_event_with_entrants(session, create_event):
 def auth_header(app):
     """Provide Authorization header with a valid test JWT."""
     with app.app_context():
-        token = create_access_token(identity="testuser")
+        # Outlive TestConfig's 1s expiry so multi-request tests don't race it
+        token = create_access_token(
+            identity="testuser", expires_delta=timedelta(minutes=5)
+        )
         return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def count_queries(app):
+    """Context manager that counts SQL statements executed inside its block.
+
+    Usage:
+        with count_queries() as queries:
+            client.get("/events/1")
+        assert len(queries) <= 3
+    """
+
+    @contextmanager
+    def _count_queries():
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        sa_event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            sa_event.remove(engine, "before_cursor_execute", _record)
+
+    return _count_queries
@@ -0,0 +1,138 @@
+# File: backend/tests/test_asgi.py
+# Purpose: Tests for the ASGI serving mode (backend/asgi.py).
+# Notes:
+# - Skipped unless the optional ASGI deps (asgiref, aiosqlite) are installed.
+# - Uses a file-backed SQLite DB so the sync (Flask) and async engines share data.
+# - Drives the ASGI callable directly; no server process is started.
+
+import asyncio
+
+import pytest
+from sqlalchemy.pool import NullPool
+
+pytest.importorskip("asgiref")
+pytest.importorskip("aiosqlite")
+
+from backend.asgi import async_database_url, create_asgi_app  # noqa: E402
+from backend.config import TestConfig  # noqa: E402
+from backend.models import Entrant, Event, Match, db  # noqa: E402
+
+
+@pytest.fixture
+def asgi_app(tmp_path):
+    class FileConfig(TestConfig):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'asgi.db'}"
+        SQLALCHEMY_ENGINE_OPTIONS = {}
+        # Each asyncio.run() gets a fresh loop; don't pool across them
+        ASYNC_ENGINE_OPTIONS = {"poolclass": NullPool}
+
+    app = create_asgi_app(FileConfig)
+    with app.flask_app.app_context():
+        db.create_all()
+        event = Event(name="Live Cup", status="published")
+        db.session.add(event)
+        db.session.flush()
+        a, b = Entrant(name="A", event_id=event.id), Entrant(
+            name="B", event_id=event.id
+        )
+        db.session.add_all([a, b])
+        db.session.flush()
+        db.session.add(
+            Match(event_id=event.id, entrant1_id=a.id, entrant2_id=b.id, winner_id=b.id)
+        )
+        db.session.commit()
+    yield app
+    asyncio.run(app.engine.dispose())
+
+
+def _scope(path, headers=()):
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+
+async def _request(app, path, headers=()):
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(_scope(path, headers), receive, send)
+    start = sent[0]
+    body = b"".join(m.get("body", b"") for m in sent[1:])
+    return start["status"], dict(start["headers"]), body
+
+
+def test_async_database_url():
+    assert str(async_database_url("sqlite:///t.db")) == "sqlite+aiosqlite:///t.db"
+    assert async_database_url("postgresql://u@h/db").drivername == "postgresql+asyncpg"
+
+
+def test_event_detail_matches_wsgi_route(asgi_app):
+    status, headers, body = asyncio.run(_request(asgi_app, "/events/1"))
+    assert status == 200
+
+    with asgi_app.flask_app.test_client() as client:
+        wsgi = client.get("/events/1")
+    assert body == wsgi.get_data()
+    assert headers[b"etag"].decode() == wsgi.headers["ETag"]
+
+    status, _, body = asyncio.run(
+        _request(asgi_app, "/events/1", [("If-None-Match", wsgi.headers["ETag"])])
+    )
+    assert (status, body) == (304, b"")
+
+
+def test_other_routes_fall_through_to_flask(asgi_app):
+    status, _, _ = asyncio.run(_request(asgi_app, "/events/999"))
+    assert status == 404
+    status, _, body = asyncio.run(_request(asgi_app, "/events"))
+    assert status == 200
+    assert b"Live Cup" in body
+
+
+def test_stream_delivers_published_changes(asgi_app):
+    broker = asgi_app.broker
+
+    async def scenario():
+        sent = []
+        frames = asyncio.Queue()
+        disconnect = asyncio.Event()
+
+        async def receive():
+            await disconnect.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            sent.append(message)
+            if message.get("body"):
+                await frames.put(message["body"].decode())
+
+        task = asyncio.ensure_future(
+            asgi_app(_scope("/events/1/stream"), receive, send)
+        )
+        assert (await frames.get()).startswith("retry:")
+        await asyncio.to_thread(broker.publish, 1, "match.updated", {"id": 1})
+        frame = await asyncio.wait_for(frames.get(), timeout=5)
+        disconnect.set()
+        await asyncio.wait_for(task, timeout=5)
+        return sent[0], frame
+
+    start, frame = asyncio.run(scenario())
+    assert start["status"] == 200
+    assert "event: match.updated" in frame
+    assert broker.subscriber_count(1) == 0
@@ -4,8 +4,21 @@
 # - Validates JWT auth flow using flask-jwt-extended
 # - Ensures protected routes require valid tokens
 # - Confirms logout response is returned (and revoked tokens are rejected)
+# - Covers the persistent revocation store and its LRU cache
 
+import threading
 import time
+from datetime import timedelta
+
+from flask_jwt_extended import create_access_token
+
+from backend.blocklist import (
+    CachedRevocationStore,
+    LRUCache,
+    MemoryRevocationStore,
+    get_revocation_store,
+)
+from backend.models import RevokedToken
 
 
 def test_signup_creates_user(client):
@@ -188,3 +201,86 @@ def test_revoked_token_denied(client):
     assert resp.status_code == 401
     # now normalized to one message
     assert resp.get_json()["error"] == "Invalid or expired token"
+
+
+def test_logout_persists_revocation(client, app, session):
+    # Longer-lived token than TestConfig's 1s so expiry can't race the logout
+    with app.app_context():
+        token = create_access_token(identity="1", expires_delta=timedelta(minutes=5))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert client.delete("/logout", headers=headers).status_code == 200
+    assert session.query(RevokedToken).count() == 1
+
+    # A fresh worker (empty cache) still sees the revocation via the DB
+    with app.app_context():
+        store = get_revocation_store()
+        store.cache.clear()
+        jti = session.query(RevokedToken).one().jti
+        assert store.is_revoked(jti) is True
+
+
+def test_memory_store_evicts_expired_entries():
+    now = [1000.0]
+    store = MemoryRevocationStore(clock=lambda: now[0])
+    store.revoke("old", expires_at=1010)
+    assert store.is_revoked("old")
+
+    now[0] = 1011.0
+    assert not store.is_revoked("old")
+    store.revoke("new", expires_at=2000)
+    assert "old" not in store._revoked
+
+
+def test_cached_store_caches_negative_answers_briefly():
+    class CountingStore(MemoryRevocationStore):
+        lookups = 0
+
+        def is_revoked(self, jti):
+            CountingStore.lookups += 1
+            return super().is_revoked(jti)
+
+    backend = CountingStore()
+    store = CachedRevocationStore(backend, negative_ttl=60)
+    assert store.is_revoked("jti-1") is False
+    assert store.is_revoked("jti-1") is False
+    assert CountingStore.lookups == 1
+
+    # Another worker revokes directly in the backend: hidden until TTL lapses
+    backend.revoke("jti-1", expires_at=time.time() + 60)
+    store.cache.set("jti-1", False, ttl=0)
+    assert store.is_revoked("jti-1") is True
+
+
+def test_lru_cache_bounds_size():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+def test_revocation_stores_are_thread_safe():
+    backend = MemoryRevocationStore()
+    store = CachedRevocationStore(backend, maxsize=8, negative_ttl=0.001)
+    errors = []
+
+    def hammer(worker):
+        try:
+            for n in range(2000):
+                jti = f"jti-{n % 32}"
+                if n % 7 == worker:
+                    store.revoke(f"{jti}-{worker}", expires_at=time.time() - 1)
+                store.is_revoked(jti)
+                backend.purge_expired()
+        except Exception as e:  # KeyError / RuntimeError from unlocked access
+            errors.append(e)
+
+    threads = [threading.Thread(target=hammer, args=(w,)) for w in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
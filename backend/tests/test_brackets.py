@@ -0,0 +1,153 @@
+# File: backend/tests/test_brackets.py
+# Purpose: Tests for bracket generation and winner advancement.
+# Notes:
+# - Pure build_bracket() checks (seeding, BYEs, bracket sizes).
+# - Route-level checks for POST /matches/bracket and auto-advancement on PUT.
+
+import pytest
+
+from backend.brackets import BYE_SCORE, BracketError, build_bracket, seed_order
+from backend.models import Match, db
+
+
+def _by_key(matches):
+    return {(m["bracket"], m["round"], m["position"]): m for m in matches}
+
+
+def test_seed_order_standard():
+    assert seed_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+
+
+@pytest.mark.parametrize(
+    "count, fmt, expected",
+    [(1024, "single", 1023), (1024, "double", 2046), (5, "single", 7)],
+)
+def test_build_bracket_sizes(count, fmt, expected):
+    assert len(build_bracket(list(range(1, count + 1)), fmt)) == expected
+
+
+def test_build_bracket_resolves_byes():
+    nodes = build_bracket([10, 20, 30, 40, 50], "single")
+    byes = [n for n in nodes if n["bye"]]
+    assert len(byes) == 3
+    # Seeds 1-3 get byes; seeds 4 and 5 play in round one
+    by_key = {n["key"]: n for n in nodes}
+    assert by_key[("winners", 1, 0)]["slots"] == [10, None]
+    assert by_key[("winners", 1, 1)]["slots"] == [40, 50]
+    assert by_key[("winners", 2, 0)]["slots"][0] == 10
+    assert by_key[("winners", 2, 1)]["slots"] == [20, 30]
+
+
+def test_build_bracket_rejects_bad_input():
+    with pytest.raises(BracketError):
+        build_bracket([1], "single")
+    with pytest.raises(BracketError):
+        build_bracket([1, 2], "swiss-ish")
+
+
+def test_create_bracket_route(
+    client, create_event, make_entrants, session, auth_header
+):
+    event = create_event(status="published")
+    entrants = make_entrants(event, 6)
+    entrants[5].dropped = True
+    session.commit()
+
+    resp = client.post(
+        "/matches/bracket",
+        json={"event_id": event.id, "format": "single"},
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    matches = _by_key(resp.get_json())
+    assert len(matches) == 7  # 5 active entrants -> 8-slot bracket
+
+    bye = matches[("winners", 1, 0)]
+    assert bye["scores"] == BYE_SCORE
+    assert bye["winner_id"] == entrants[0].id
+    assert matches[("winners", 2, 0)]["entrant1_id"] == entrants[0].id
+    assert all(
+        entrants[5].id not in (m["entrant1_id"], m["entrant2_id"])
+        for m in matches.values()
+    )
+
+    again = client.post(
+        "/matches/bracket", json={"event_id": event.id}, headers=auth_header
+    )
+    assert again.status_code == 409
+
+
+def test_create_bracket_requires_entrants(client, create_event, auth_header):
+    event = create_event()
+    resp = client.post(
+        "/matches/bracket", json={"event_id": event.id}, headers=auth_header
+    )
+    assert resp.status_code == 400
+
+
+def test_winner_advances_through_double_elimination(
+    client, create_event, make_entrants, session, auth_header
+):
+    event = create_event(status="published")
+    e1, e2, e3 = make_entrants(event, 3)
+    resp = client.post(
+        "/matches/bracket",
+        json={"event_id": event.id, "format": "double"},
+        headers=auth_header,
+    )
+    matches = _by_key(resp.get_json())
+    wb_r1 = matches[("winners", 1, 1)]
+    assert (wb_r1["entrant1_id"], wb_r1["entrant2_id"]) == (e2.id, e3.id)
+
+    resp = client.put(
+        f"/matches/{wb_r1['id']}", json={"winner_id": e3.id}, headers=auth_header
+    )
+    assert resp.status_code == 200
+
+    wb_final = db.session.get(Match, matches[("winners", 2, 0)]["id"])
+    assert (wb_final.entrant1_id, wb_final.entrant2_id) == (e1.id, e3.id)
+
+    # Loser's first losers-bracket opponent was a BYE: walkover straight through
+    lb_r1 = db.session.get(Match, matches[("losers", 1, 0)]["id"])
+    assert lb_r1.winner_id == e2.id and lb_r1.scores == BYE_SCORE
+    lb_final = db.session.get(Match, matches[("losers", 2, 0)]["id"])
+    assert lb_final.entrant1_id == e2.id
+
+    client.put(
+        f"/matches/{wb_final.id}", json={"winner_id": e1.id}, headers=auth_header
+    )
+    lb_final = db.session.get(Match, lb_final.id)
+    assert (lb_final.entrant1_id, lb_final.entrant2_id) == (e2.id, e3.id)
+    grand_final = db.session.get(Match, matches[("grand_final", 3, 0)]["id"])
+    assert grand_final.entrant1_id == e1.id
+
+
+def test_changing_decided_downstream_is_rejected(
+    client, create_event, make_entrants, session, auth_header
+):
+    event = create_event(status="published")
+    e1, e2 = make_entrants(event, 2)
+    resp = client.post(
+        "/matches/bracket",
+        json={"event_id": event.id, "format": "double"},
+        headers=auth_header,
+    )
+    matches = _by_key(resp.get_json())
+    final = matches[("winners", 1, 0)]
+    grand = matches[("grand_final", 2, 0)]
+
+    client.put(
+        f"/matches/{final['id']}", json={"winner_id": e1.id}, headers=auth_header
+    )
+    gf = db.session.get(Match, grand["id"])
+    assert (gf.entrant1_id, gf.entrant2_id) == (e1.id, e2.id)
+    assert gf.winner_id is None
+    client.put(
+        f"/matches/{grand['id']}", json={"winner_id": e2.id}, headers=auth_header
+    )
+
+    resp = client.put(
+        f"/matches/{final['id']}", json={"winner_id": e2.id}, headers=auth_header
+    )
+    assert resp.status_code == 409
+    assert db.session.get(Match, final["id"]).winner_id == e1.id
@@ -0,0 +1,142 @@
+# File: backend/tests/test_broker.py
+# Purpose: Tests for the SSE broker (backend/broker.py) and GET /events/<id>/stream.
+# Notes:
+# - Streams are read frame by frame from the unbuffered test response; every
+#   publish happens before the read, so no test blocks on the keepalive timer.
+
+import asyncio
+import json
+import threading
+
+from backend.broker import CLOSED, MemoryBroker, SUBSCRIBER_QUEUE_SIZE
+from backend.models import Entrant, Match
+
+
+def _frames(resp):
+    chunks = iter(resp.response)
+
+    def next_frame():
+        chunk = next(chunks)
+        return chunk.decode() if isinstance(chunk, bytes) else chunk
+
+    return next_frame
+
+
+def _parse(frame):
+    fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+def test_broker_fans_out_and_replays_history():
+    broker = MemoryBroker(history=2)
+    first = broker.subscribe(1)
+    other = broker.subscribe(2)
+
+    for n in range(3):
+        broker.publish(1, "match.updated", {"n": n})
+
+    assert [first.get_nowait().data["n"] for _ in range(3)] == [0, 1, 2]
+    assert other.empty()
+
+    # Reconnect after message 1: only what is still in history is replayed
+    resumed = broker.subscribe(1, last_event_id=1)
+    assert [resumed.get_nowait().data["n"] for _ in range(2)] == [1, 2]
+    assert broker.subscriber_count(1) == 2
+
+
+def test_slow_subscriber_is_dropped():
+    broker = MemoryBroker()
+    slow = broker.subscribe(1)
+    for n in range(SUBSCRIBER_QUEUE_SIZE + 1):
+        broker.publish(1, "match.updated", {"n": n})
+
+    assert slow.get_nowait() is CLOSED
+    assert broker.subscriber_count(1) == 0
+
+
+def test_stream_pushes_match_updates(app, client, create_event, session, auth_header):
+    event = create_event(status="published")
+    e1, e2 = Entrant(name="A", event_id=event.id), Entrant(name="B", event_id=event.id)
+    session.add_all([e1, e2])
+    session.flush()
+    match = Match(event_id=event.id, entrant1_id=e1.id, entrant2_id=e2.id)
+    session.add(match)
+    session.commit()
+    event_id, match_id, winner_id = event.id, match.id, e2.id
+
+    resp = client.get(f"/events/{event_id}/stream", buffered=False)
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+    next_frame = _frames(resp)
+    assert next_frame().startswith("retry:")
+
+    client.put(
+        f"/matches/{match_id}", json={"winner_id": winner_id}, headers=auth_header
+    )
+    kind, data = _parse(next_frame())
+    assert kind == "match.updated"
+    assert data["id"] == match_id
+    assert data["winner"]["name"] == "B"
+
+    client.post(
+        "/entrants", json={"name": "C", "event_id": event_id}, headers=auth_header
+    )
+    kind, data = _parse(next_frame())
+    assert (kind, data["name"]) == ("entrant.created", "C")
+
+    resp.close()
+    assert app.extensions["broker"].subscriber_count(event_id) == 0
+
+
+def test_stream_includes_bracket_advancement(
+    client, create_event, session, auth_header
+):
+    event = create_event(status="published")
+    session.add_all(Entrant(name=f"Hero {i}", event_id=event.id) for i in range(4))
+    session.commit()
+    event_id = event.id
+    created = client.post(
+        "/matches/bracket", json={"event_id": event_id}, headers=auth_header
+    ).get_json()
+    semi = next(m for m in created if m["round"] == 1)
+    final = next(m for m in created if m["round"] == 2)
+
+    resp = client.get(f"/events/{event_id}/stream", buffered=False)
+    next_frame = _frames(resp)
+    next_frame()  # retry hint
+
+    client.put(
+        f"/matches/{semi['id']}",
+        json={"winner_id": semi["entrant1_id"]},
+        headers=auth_header,
+    )
+    updated = {}
+    for _ in range(2):
+        kind, data = _parse(next_frame())
+        assert kind == "match.updated"
+        updated[data["id"]] = data
+    assert updated[final["id"]]["entrant1_id"] == semi["entrant1_id"]
+    resp.close()
+
+
+def test_stream_missing_event(client):
+    assert client.get("/events/999/stream").status_code == 404
+
+
+def test_async_subscription_receives_from_other_threads():
+    broker = MemoryBroker()
+
+    async def scenario():
+        subscription = broker.subscribe_async(7)
+        publisher = threading.Thread(
+            target=broker.publish, args=(7, "match.updated", {"id": 1})
+        )
+        publisher.start()
+        message = await asyncio.wait_for(subscription.get(), timeout=5)
+        publisher.join()
+        broker.unsubscribe(7, subscription)
+        return message
+
+    message = asyncio.run(scenario())
+    assert (message.kind, message.data) == ("match.updated", {"id": 1})
+    assert broker.subscriber_count(7) == 0
@@ -0,0 +1,41 @@
+# File: backend/tests/test_database.py
+# Purpose: Tests for pool sizing and SQLite pragmas (backend/database.py).
+
+from sqlalchemy import create_engine, text
+
+from backend.database import SQLITE_PRAGMAS, apply_sqlite_pragmas, engine_options
+
+
+def test_pool_stays_within_connection_budget():
+    options = engine_options(
+        "postgresql://u@h/db",
+        workers=4,
+        threads=8,
+        max_connections=100,
+        statement_timeout_ms=5000,
+    )
+    assert options["pool_size"] == 8
+    assert 4 * (options["pool_size"] + options["max_overflow"]) <= 100
+    assert options["pool_pre_ping"] is True
+    assert "statement_timeout=5000" in options["connect_args"]["options"]
+
+    tight = engine_options(
+        "postgresql://u@h/db", workers=8, threads=8, max_connections=20
+    )
+    assert (tight["pool_size"], tight["max_overflow"]) == (2, 0)
+
+
+def test_sqlite_pool_options():
+    assert engine_options("sqlite://", threads=8) == {"pool_pre_ping": True}
+    options = engine_options("sqlite:////tmp/app.db", threads=8)
+    assert (options["pool_size"], options["max_overflow"]) == (8, 0)
+    assert "connect_args" not in options
+
+
+def test_sqlite_pragmas_apply_to_new_connections(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+    apply_sqlite_pragmas(engine, SQLITE_PRAGMAS)
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+    engine.dispose()
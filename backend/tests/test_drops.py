@@ -0,0 +1,156 @@
+# File: backend/tests/test_drops.py
+# Purpose: Tests for set-based entrant removal (POST /events/<id>/entrants/drop,
+#          DELETE /entrants/<id>, backend/drops.py).
+
+from backend.entrant_counts import check_entrant_counts
+from backend.models import Entrant, Event, Match
+
+
+def _played(session, entrants):
+    """Record a decided match between the first two entrants."""
+    session.add(
+        Match(
+            event_id=entrants[0].event_id,
+            round=1,
+            entrant1_id=entrants[0].id,
+            entrant2_id=entrants[1].id,
+            winner_id=entrants[1].id,
+        )
+    )
+    session.commit()
+    return entrants
+
+
+def test_drop_deletes_unplayed_and_soft_drops_the_rest(
+    client, session, create_event, make_entrants, auth_header
+):
+    event = create_event(status="published")
+    a, b, c, d = (e.id for e in _played(session, make_entrants(event, 4)))
+    version = event.version
+
+    resp = client.post(
+        f"/events/{event.id}/entrants/drop",
+        json={"entrant_ids": [a, c, d]},
+        headers=auth_header,
+    )
+    assert resp.status_code == 200
+    body = resp.get_json()
+    assert body["deleted"] == [c, d]
+    assert body["dropped"] == [
+        {
+            "id": a,
+            "name": "Dropped",
+            "alias": None,
+            "event_id": event.id,
+            "dropped": True,
+            "version": 2,
+        }
+    ]
+
+    session.expire_all()
+    assert session.get(Entrant, c) is None
+    assert session.get(Entrant, a).dropped is True
+    assert (event.entrant_count, event.active_entrant_count) == (2, 1)
+    assert event.version == version + 1
+    assert check_entrant_counts() == []
+
+    # Already-dropped entrants are left alone
+    again = client.post(
+        f"/events/{event.id}/entrants/drop",
+        json={"entrant_ids": [a]},
+        headers=auth_header,
+    )
+    assert again.get_json() == {"deleted": [], "dropped": []}
+
+
+def test_drop_mode_keeps_rows(
+    client, session, create_event, make_entrants, auth_header, count_queries
+):
+    event = create_event()
+    entrants = _played(session, make_entrants(event, 3))
+    ids = [e.id for e in entrants]
+    client.patch(f"/entrants/{ids[0]}", json={"alias": "A"}, headers=auth_header)
+
+    with count_queries() as queries:
+        resp = client.post(
+            f"/events/{event.id}/entrants/drop",
+            json={"entrant_ids": ids, "mode": "drop"},
+            headers=auth_header,
+        )
+    assert resp.get_json()["deleted"] == []
+    # Versions come back from the UPDATE itself, not from the earlier read
+    [drop] = [q for q in queries if q.startswith("UPDATE entrants")]
+    assert "RETURNING" in drop
+    session.expire_all()
+    assert {d["id"]: d["version"] for d in resp.get_json()["dropped"]} == {
+        i: session.get(Entrant, i).version for i in ids
+    }
+    assert [d["version"] for d in resp.get_json()["dropped"]] == [3, 2, 2]
+    assert session.query(Entrant).filter_by(event_id=event.id).count() == 3
+    assert (event.entrant_count, event.active_entrant_count) == (3, 0)
+    assert check_entrant_counts() == []
+
+
+def test_drop_rejects_bad_bodies_and_foreign_ids(
+    client, session, create_event, auth_header
+):
+    event = create_event()
+    (a,) = [Entrant(name="Mine", event_id=event.id)]
+    stranger = Entrant(name="Theirs", event=Event(name="Other"))
+    session.add_all([a, stranger])
+    session.commit()
+    url = f"/events/{event.id}/entrants/drop"
+
+    for body, message in (
+        ({}, "entrant_ids is required"),
+        ({"entrant_ids": []}, "entrant_ids must be a non-empty list"),
+        ({"entrant_ids": ["x"]}, "entrant_ids must be an integer"),
+        ({"entrant_ids": [a.id], "mode": "purge"}, "mode must be one of"),
+        ({"entrant_ids": [a.id, stranger.id]}, f"Not entrants of event {event.id}"),
+    ):
+        resp = client.post(url, json=body, headers=auth_header)
+        assert resp.status_code == 400
+        assert message in resp.get_json()["error"]
+    assert session.get(Entrant, a.id) is not None
+
+    missing = client.post(
+        "/events/999/entrants/drop", json={"entrant_ids": [1]}, headers=auth_header
+    )
+    assert missing.status_code == 404
+
+
+def test_drop_query_count_does_not_grow_with_entrants(
+    client, session, create_event, make_entrants, auth_header, count_queries
+):
+    counts = []
+    for size in (4, 40):
+        event = create_event()
+        ids = [e.id for e in _played(session, make_entrants(event, size))]
+        with count_queries() as queries:
+            resp = client.post(
+                f"/events/{event.id}/entrants/drop",
+                json={"entrant_ids": ids},
+                headers=auth_header,
+            )
+        assert resp.status_code == 200
+        # One SELECT, one DELETE, one UPDATE on entrants, whatever the size
+        touching = [q for q in queries if "entrants" in q.split("WHERE")[0]]
+        counts.append(len(touching))
+        assert not any("count(" in q.lower() for q in queries)
+    assert counts == [3, 3]
+
+
+def test_delete_entrant_uses_exists_probe(
+    client, session, create_event, make_entrants, auth_header, count_queries
+):
+    event = create_event()
+    a, _, c = _played(session, make_entrants(event, 3))
+
+    with count_queries() as queries:
+        resp = client.delete(f"/entrants/{a.id}", headers=auth_header)
+    assert resp.get_json()["dropped"] is True
+    probe = next(q for q in queries if "EXISTS" in q.upper())
+    assert "count(" not in probe.lower()
+
+    assert client.delete(f"/entrants/{c.id}", headers=auth_header).status_code == 204
+    assert session.get(Entrant, c.id) is None
@@ -0,0 +1,102 @@
+# File: backend/tests/test_entrant_counts.py
+# Purpose: Tests for the materialized Event entrant counts
+#          (backend/entrant_counts.py) across every entrant write path.
+
+from sqlalchemy import text
+
+from backend.entrant_counts import check_entrant_counts, repair_entrant_counts
+from backend.models import Entrant, Event, Match
+
+
+def _counts(session, event_id):
+    session.expire_all()
+    event = session.get(Event, event_id)
+    return event.entrant_count, event.active_entrant_count
+
+
+def test_orm_writes_keep_counts(session, create_event):
+    first, second = create_event(name="First"), create_event(name="Second")
+    a = Entrant(name="A", event_id=first.id)
+    b = Entrant(name="B", event_id=first.id, dropped=True)
+    session.add_all([a, b])
+    session.commit()
+    assert _counts(session, first.id) == (2, 1)
+
+    a.soft_delete()
+    session.commit()
+    assert _counts(session, first.id) == (2, 0)
+
+    b.dropped = False
+    b.event_id = second.id
+    session.commit()
+    assert _counts(session, first.id) == (1, 0)
+    assert _counts(session, second.id) == (1, 1)
+
+    session.delete(a)
+    session.commit()
+    assert _counts(session, first.id) == (0, 0)
+
+    # Entrants flushed together with their new event
+    fresh = Event(name="Fresh", date="2025-10-01")
+    session.add_all([Entrant(name="C", event=fresh), Entrant(name="D", event=fresh)])
+    session.commit()
+    assert _counts(session, fresh.id) == (2, 2)
+    assert check_entrant_counts() == []
+
+
+def test_routes_keep_counts(client, session, seed_event_with_entrants, auth_header):
+    event, e1, e2 = seed_event_with_entrants()
+    other = Event(name="Other", date="2025-10-01")
+    session.add(other)
+    session.commit()
+
+    client.post(
+        "/entrants/bulk",
+        json=[
+            {"name": "Bulk A", "event_id": event.id},
+            {"name": "Bulk B", "event_id": event.id, "dropped": True},
+            {"name": "Bulk C", "event_id": other.id},
+        ],
+        headers=auth_header,
+    )
+    assert _counts(session, event.id) == (4, 3)
+    assert _counts(session, other.id) == (1, 1)
+
+    client.put(f"/entrants/{e2.id}", json={"event_id": other.id}, headers=auth_header)
+    assert _counts(session, event.id) == (3, 2)
+    assert _counts(session, other.id) == (2, 2)
+
+    session.add(Match(event_id=event.id, entrant1_id=e1.id, entrant2_id=None))
+    session.commit()
+    client.delete(f"/entrants/{e1.id}", headers=auth_header)  # soft: in a match
+    assert _counts(session, event.id) == (3, 1)
+
+    listed = {e["id"]: e for e in client.get("/events").get_json()}
+    assert listed[event.id]["entrant_count"] == 3
+    assert listed[event.id]["active_entrant_count"] == 1
+    assert check_entrant_counts() == []
+
+
+def test_check_detects_and_repairs_drift(session, seed_event_with_entrants):
+    event, _, _ = seed_event_with_entrants()
+    session.execute(
+        text("UPDATE events SET entrant_count = 7, active_entrant_count = 0")
+    )
+    session.commit()
+
+    assert check_entrant_counts() == [(event.id, (7, 0), (2, 2))]
+    assert repair_entrant_counts() == 1
+    session.commit()
+    assert _counts(session, event.id) == (2, 2)
+    assert check_entrant_counts() == []
+
+
+def test_event_list_does_not_scan_entrants(
+    client, seed_event_with_entrants, count_queries
+):
+    seed_event_with_entrants()
+    with count_queries() as queries:
+        resp = client.get("/events")
+    assert resp.status_code == 200
+    assert resp.get_json()[0]["entrant_count"] == 2
+    assert not any("entrants" in q for q in queries)
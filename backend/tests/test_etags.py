@@ -0,0 +1,117 @@
+# File: backend/tests/test_etags.py
+# Purpose: Tests for per-event versions and conditional GETs (backend/etags.py).
+# Notes:
+# - 304s must cost only the version lookup.
+# - Writes through the API must invalidate exactly the affected event.
+
+from backend.config import Config
+from backend.models import Event, db
+
+
+def test_event_detail_revalidates_with_304(client, create_event, count_queries):
+    event = create_event(name="Live Cup")
+    url = f"/events/{event.id}"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+    assert first.headers.get("Last-Modified")
+
+    with count_queries() as queries:
+        again = client.get(url, headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.data == b""
+    assert again.headers["ETag"] == etag
+    assert len(queries) == 1
+
+    by_date = client.get(
+        url, headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    )
+    assert by_date.status_code == 304
+
+
+def test_writes_bump_only_their_event(
+    client, create_event, make_entrants, session, auth_header
+):
+    live = create_event(name="Live Cup")
+    other = create_event(name="Other Cup")
+    e1, e2 = make_entrants(live, 2)
+    live_id, other_id = live.id, other.id
+
+    live_url = f"/matches?event_id={live_id}"
+    live_etag = client.get(live_url).headers["ETag"]
+    other_etag = client.get(f"/events/{other_id}").headers["ETag"]
+
+    resp = client.post(
+        "/matches",
+        json={"event_id": live_id, "entrant1_id": e1.id, "entrant2_id": e2.id},
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    assert db.session.get(Event, live_id).version == 2
+
+    changed = client.get(live_url, headers={"If-None-Match": live_etag})
+    assert changed.status_code == 200
+    assert len(changed.get_json()) == 1
+    assert changed.headers["ETag"] != live_etag
+
+    unchanged = client.get(f"/events/{other_id}", headers={"If-None-Match": other_etag})
+    assert unchanged.status_code == 304
+
+
+def test_catalog_etag_tracks_events_and_entrants(client, create_event, auth_header):
+    event = create_event(name="Live Cup")
+    etag = client.get("/events").headers["ETag"]
+
+    client.post(
+        "/entrants",
+        json={"name": "Hero", "event_id": event.id},
+        headers=auth_header,
+    )
+    after_entrant = client.get("/events", headers={"If-None-Match": etag})
+    assert after_entrant.status_code == 200
+    assert after_entrant.get_json()[0]["entrant_count"] == 1
+
+    etag = after_entrant.headers["ETag"]
+    client.delete(f"/events/{event.id}", headers=auth_header)
+    after_delete = client.get("/events", headers={"If-None-Match": etag})
+    assert after_delete.status_code == 200
+    assert after_delete.get_json() == []
+
+
+def test_representations_get_distinct_etags(client, create_event):
+    event = create_event()
+    plain = client.get(f"/entrants?event_id={event.id}").headers["ETag"]
+    paged = client.get(f"/entrants?event_id={event.id}&limit=5").headers["ETag"]
+    stream = client.get(
+        f"/entrants?event_id={event.id}",
+        headers={"Accept": "application/x-ndjson"},
+    ).headers["ETag"]
+    assert len({plain, paged, stream}) == 3
+
+
+def test_missing_event_is_not_cached(client):
+    resp = client.get("/events/999")
+    assert resp.status_code == 404
+    assert "ETag" not in resp.headers
+
+
+def test_validators_cross_origins(client, create_event):
+    event = create_event()
+    origin = {"Origin": Config.FRONTEND_URL}
+
+    preflight = client.options(
+        f"/events/{event.id}",
+        headers={
+            **origin,
+            "Access-Control-Request-Method": "GET",
+            "Access-Control-Request-Headers": "If-None-Match, If-Modified-Since",
+        },
+    )
+    allowed = preflight.headers["Access-Control-Allow-Headers"].lower()
+    assert "if-none-match" in allowed and "if-modified-since" in allowed
+
+    resp = client.get(f"/events/{event.id}", headers=origin)
+    exposed = resp.headers["Access-Control-Expose-Headers"].lower()
+    assert "etag" in exposed and "last-modified" in exposed
@@ -0,0 +1,117 @@
+# File: backend/tests/test_logging.py
+# Purpose: Tests for structured logging (backend/logging_setup.py).
+# Notes:
+# - The session app configured the "backend" logger at WARNING; tests that need
+#   lower levels raise it temporarily and capture on the listener's side.
+
+import json
+import logging
+import queue
+
+import pytest
+
+from backend.logging_setup import (
+    REDACTED,
+    JSONFormatter,
+    NonBlockingQueueHandler,
+    RedactFilter,
+    SampleFilter,
+    _state,
+    flush_logs,
+    redact,
+)
+
+
+def _record(level=logging.INFO, msg="hello", **extra):
+    record = logging.LogRecord("backend.test", level, __file__, 1, msg, (), None)
+    record.__dict__.update(extra)
+    return record
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def captured():
+    """Records written by the listener while the logger is at DEBUG."""
+    logger = logging.getLogger("backend")
+    level = logger.level
+    capture = _Capture()
+    listener = _state["listener"]
+    listener.handlers = listener.handlers + (capture,)
+    logger.setLevel(logging.DEBUG)
+    try:
+        yield capture.records
+    finally:
+        flush_logs()
+        logger.setLevel(level)
+        listener.handlers = tuple(h for h in listener.handlers if h is not capture)
+
+
+def test_redact_masks_nested_keys():
+    payload = {"email": "a@b.c", "Password": "x", "tokens": [{"token": "t"}]}
+
+    assert redact(payload, {"password", "token"}) == {
+        "email": "a@b.c",
+        "Password": REDACTED,
+        "tokens": [{"token": REDACTED}],
+    }
+
+
+def test_json_formatter_includes_extras_after_redaction():
+    record = _record(payload={"password": "hunter2"}, event_id=3, jwt="abc")
+    RedactFilter().filter(record)
+
+    entry = json.loads(JSONFormatter().format(record))
+
+    assert entry["msg"] == "hello"
+    assert entry["level"] == "INFO"
+    assert entry["event_id"] == 3
+    assert entry["jwt"] == REDACTED
+    assert entry["payload"] == {"password": REDACTED}
+
+
+def test_sampling_only_drops_debug():
+    never = SampleFilter(rate=0.0)
+
+    assert not never.filter(_record(logging.DEBUG))
+    assert never.filter(_record(logging.INFO))
+    assert SampleFilter(rate=1.0).filter(_record(logging.DEBUG))
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+    for _ in range(5):
+        handler.handle(_record())
+
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_request_logs_carry_request_id_and_hide_password(client, captured):
+    resp = client.post(
+        "/signup",
+        json={"username": "log", "email": "log@x.com", "password": "hunter2"},
+        headers={"X-Request-ID": "req-123"},
+    )
+    flush_logs()
+
+    assert resp.status_code == 201
+    assert resp.headers["X-Request-ID"] == "req-123"
+    mine = [r for r in captured if getattr(r, "request_id", None) == "req-123"]
+    assert {r.getMessage() for r in mine} >= {"signup payload", "Created user"}
+    lines = [JSONFormatter().format(r) for r in mine]
+    assert all("hunter2" not in line for line in lines)
+    assert any(REDACTED in line for line in lines)
+
+
+def test_response_gets_generated_request_id(client):
+    resp = client.get("/events")
+
+    assert len(resp.headers["X-Request-ID"]) == 16
@@ -0,0 +1,81 @@
+# File: backend/tests/test_metrics.py
+# Purpose: Tests for request instrumentation (backend/metrics.py) and /metrics.
+# Notes:
+# - The app (and its registry) is shared across the session, so counters are
+#   compared as before/after deltas.
+
+import re
+
+from backend.metrics import MetricsRegistry, RequestMetrics
+from backend.models import Entrant
+
+
+def _sample(text, name, **labels):
+    """Value of one series from Prometheus text, or 0 if absent."""
+    wanted = ",".join(f'{k}="{v}"' for k, v in labels.items())
+    pattern = rf"^{re.escape(name)}\{{{re.escape(wanted)}\}} (\S+)$"
+    match = re.search(pattern, text, re.MULTILINE)
+    return float(match.group(1)) if match else 0
+
+
+def _timing(header):
+    entries = {}
+    for part in header.split(", "):
+        name, *params = part.split(";")
+        entries[name] = dict(p.split("=", 1) for p in params)
+    return entries
+
+
+def test_server_timing_reports_queries(client, create_event, session, count_queries):
+    event = create_event(status="published")
+    session.add_all(Entrant(name=f"Hero {i}", event_id=event.id) for i in range(3))
+    session.commit()
+    url = f"/matches?event_id={event.id}"
+
+    with count_queries() as queries:
+        resp = client.get(url)
+
+    timing = _timing(resp.headers["Server-Timing"])
+    assert timing["db"]["desc"] == f'"{len(queries)} queries"'
+    assert float(timing["serialize"]["dur"]) >= 0
+    assert float(timing["total"]["dur"]) >= float(timing["db"]["dur"])
+
+
+def test_metrics_endpoint_aggregates_by_route(client, create_event):
+    event = create_event()
+    route = "/events/<int:event_id>"
+    before = client.get("/metrics").get_data(as_text=True)
+
+    client.get(f"/events/{event.id}")
+    client.get(f"/events/{event.id}")
+    client.get("/no-such-page")
+    resp = client.get("/metrics")
+    text = resp.get_data(as_text=True)
+
+    assert resp.content_type.startswith("text/plain; version=0.0.4")
+    labels = {"method": "GET", "route": route, "status": "200"}
+    assert _sample(text, "http_requests_total", **labels) == (
+        _sample(before, "http_requests_total", **labels) + 2
+    )
+    inf = {"method": "GET", "route": route, "le": "+Inf"}
+    assert _sample(text, "http_request_db_queries_bucket", **inf) >= 2
+    unmatched = {"method": "GET", "route": "<unmatched>", "status": "404"}
+    assert _sample(text, "http_requests_total", **unmatched) >= 1
+    assert 'route="/metrics"' not in text
+    assert "response_cache_hits_total" in text
+
+
+def test_histograms_render_cumulative_buckets():
+    registry = MetricsRegistry()
+    for queries in (1, 3, 40):
+        stats = RequestMetrics()
+        stats.queries = queries
+        registry.record("GET", "/events", 200, stats, 0.02)
+
+    text = registry.render()
+    labels = {"method": "GET", "route": "/events"}
+    assert _sample(text, "http_request_db_queries_bucket", **labels, le="1") == 1
+    assert _sample(text, "http_request_db_queries_bucket", **labels, le="3") == 2
+    assert _sample(text, "http_request_db_queries_bucket", **labels, le="+Inf") == 3
+    assert _sample(text, "http_request_db_queries_sum", **labels) == 44
+    assert _sample(text, "http_request_duration_seconds_count", **labels) == 3
@@ -5,8 +5,9 @@
 # - Runs against an in-memory SQLite database for speed & isolation
 
 import pytest
+from sqlalchemy import inspect
 from sqlalchemy.exc import IntegrityError, StatementError
-from backend.models import Event, Entrant, Match
+from backend.models import Event, Entrant, Match, build_entrant_map, serialize_matches
 
 
 def test_create_event_valid_status(session):
@@ -117,3 +118,37 @@ def test_soft_delete_marks_entrant_as_dropped(session):
     assert refreshed.dropped is True
     assert refreshed.name == "Dropped"
     assert refreshed.alias is None
+
+
+def test_serialize_matches_shares_entrant_map(session):
+    event = Event(name="Map Cup", status="drafting")
+    e1 = Entrant(name="Hero", event=event)
+    e2 = Entrant(name="Villain", event=event)
+    session.add_all([event, e1, e2])
+    session.flush()
+    m1 = Match(event=event, round=1, entrant1_id=e1.id, entrant2_id=e2.id)
+    m2 = Match(event=event, round=2, entrant1_id=e2.id, entrant2_id=None)
+    session.add_all([m1, m2])
+    session.commit()
+
+    entrant_map = build_entrant_map([m1, m2])
+    assert set(entrant_map) == {e1.id, e2.id}
+
+    data = serialize_matches([m1, m2], include_names=True, entrant_map=entrant_map)
+    assert data[0]["entrant1"]["name"] == "Hero"
+    assert data[0]["winner"] is None
+    assert data[1]["entrant1"]["name"] == "Villain"
+    assert data[1]["entrant2"] is None
+
+
+def test_fk_access_path_indexes_exist(session):
+    inspector = inspect(session.get_bind())
+    entrant_indexes = {ix["name"] for ix in inspector.get_indexes("entrants")}
+    match_indexes = {ix["name"] for ix in inspector.get_indexes("matches")}
+    assert "ix_entrants_event_id_dropped" in entrant_indexes
+    assert {
+        "ix_matches_event_id_round",
+        "ix_matches_entrant1_id",
+        "ix_matches_entrant2_id",
+        "ix_matches_winner_id",
+    } <= match_indexes
@@ -0,0 +1,89 @@
+# File: backend/tests/test_passwords.py
+# Purpose: Tests for the password hashing policy and executor (backend/passwords.py).
+
+import threading
+
+import pytest
+from werkzeug.security import generate_password_hash
+
+from backend.app import create_app
+from backend.config import TestConfig
+from backend.models import User
+from backend.passwords import (
+    HasherBusy,
+    PasswordHasher,
+    get_password_hasher,
+    shutdown_executors,
+)
+
+
+def _user(session, password_hash):
+    user = User(username="hash", email="hash@example.com", password_hash=password_hash)
+    session.add(user)
+    session.commit()
+    return user
+
+
+def test_policy_is_normalized_and_stale_hashes_detected():
+    hasher = PasswordHasher("pbkdf2:sha256:1000", workers=1)
+
+    assert hasher.method == "pbkdf2:sha256:1000"
+    assert not hasher.needs_rehash(hasher.hash("pw"))
+    assert hasher.verify(hasher.hash("pw"), "pw") == (True, False)
+
+    old = generate_password_hash("pw", "pbkdf2:sha256:500")
+    assert hasher.verify(old, "pw") == (True, True)
+    assert hasher.verify(old, "nope") == (False, False)
+    assert hasher.verify(None, "pw") == (False, False)
+
+
+def test_unknown_method_fails_at_startup():
+    with pytest.raises(ValueError):
+        PasswordHasher("md5")
+
+
+def test_login_rehashes_passwords_from_an_older_policy(app, client, session):
+    old = generate_password_hash("hunter2", "pbkdf2:sha256:500")
+    user = _user(session, old)
+
+    wrong = client.post("/login", json={"email": user.email, "password": "nope"})
+    assert wrong.status_code == 401
+    session.refresh(user)
+    assert user.password_hash == old
+
+    resp = client.post("/login", json={"email": user.email, "password": "hunter2"})
+    assert resp.status_code == 200
+    session.refresh(user)
+    assert user.password_hash.startswith(get_password_hasher().method + "$")
+
+    again = client.post("/login", json={"email": user.email, "password": "hunter2"})
+    assert again.status_code == 200
+
+
+def test_saturated_hasher_returns_503(app, client, session, monkeypatch):
+    _user(session, generate_password_hash("pw", "pbkdf2:sha256:1000"))
+    full = PasswordHasher("pbkdf2:sha256:1000", workers=1, max_pending=0)
+    monkeypatch.setitem(app.extensions, "password_hasher", full)
+
+    resp = client.post("/login", json={"email": "hash@example.com", "password": "pw"})
+
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
+    with pytest.raises(HasherBusy):
+        full.hash("pw")
+
+
+def test_apps_share_hash_pools_instead_of_leaking_threads():
+    def pool_threads():
+        return sum(t.name.startswith("pwhash") for t in threading.enumerate())
+
+    hashers = [create_app(TestConfig).extensions["password_hasher"] for _ in "abcde"]
+    hashers[0].hash("pw")
+    before = pool_threads()
+    for hasher in hashers[1:]:
+        hasher.hash("pw")
+    assert pool_threads() == before
+
+    # Hashers outlive a shutdown: their next hash starts a fresh pool
+    shutdown_executors()
+    assert hashers[0].verify(hashers[1].hash("pw"), "pw") == (True, False)
@@ -0,0 +1,226 @@
+# File: backend/tests/test_patching.py
+# Purpose: Tests for the allowlisted PUT/PATCH engine (backend/patching.py)
+#          on events, entrants and matches.
+
+from backend.config import Config
+from backend.entrant_counts import check_entrant_counts
+from backend.models import Entrant, Event, Match, Standing
+
+
+def _updates(queries):
+    return [q for q in queries if q.lstrip().upper().startswith("UPDATE")]
+
+
+def test_event_patch_writes_only_changed_fields(
+    client, create_event, auth_header, count_queries
+):
+    event = create_event(name="Cup", rules="Bo3")
+    version = client.get(f"/events/{event.id}").get_json()["version"]
+
+    with count_queries() as queries:
+        resp = client.patch(
+            f"/events/{event.id}",
+            json={"rules": "Bo3", "status": "published", "version": version},
+            headers=auth_header,
+        )
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "id": event.id,
+        "version": version + 1,
+        "status": "published",
+    }
+    [statement] = _updates(queries)
+    assert "status=" in statement.replace(" ", "")
+    assert "rules" not in statement
+
+    # A no-op patch reads the row and writes nothing
+    with count_queries() as queries:
+        resp = client.patch(
+            f"/events/{event.id}", json={"status": "published"}, headers=auth_header
+        )
+    assert resp.get_json() == {"id": event.id, "version": version + 1}
+    assert _updates(queries) == []
+
+    full = client.put(f"/events/{event.id}", json={}, headers=auth_header)
+    assert full.get_json()["name"] == "Cup"
+
+
+def test_patch_rejects_unknown_and_invalid_fields(
+    client, seed_event_with_entrants, auth_header
+):
+    event, e1, _ = seed_event_with_entrants()
+
+    resp = client.patch(
+        f"/events/{event.id}", json={"id": 99, "entrants": []}, headers=auth_header
+    )
+    assert resp.status_code == 400
+    assert resp.get_json()["error"] == "Unknown or read-only field(s): entrants, id"
+
+    resp = client.put(
+        f"/events/{event.id}",
+        json={"status": "not-a-valid-status", "name": ""},
+        headers=auth_header,
+    )
+    assert resp.status_code == 400
+    assert "status must be one of" in resp.get_json()["error"]
+    assert "name is required" in resp.get_json()["error"]
+
+    resp = client.patch(
+        f"/entrants/{e1.id}",
+        json={"dropped": "yes", "event_id": "abc"},
+        headers=auth_header,
+    )
+    assert resp.status_code == 400
+    resp = client.patch(
+        f"/entrants/{e1.id}", json={"event_id": 999}, headers=auth_header
+    )
+    assert resp.get_json()["error"] == "Event 999 not found"
+
+    assert client.patch("/events/999", json={}, headers=auth_header).status_code == (
+        404
+    )
+    assert client.put("/entrants/999", json={}, headers=auth_header).status_code == (
+        404
+    )
+
+
+def test_stale_version_conflicts(
+    client, session, seed_event_with_entrants, auth_header
+):
+    _, e1, _ = seed_event_with_entrants()
+
+    first = client.patch(
+        f"/entrants/{e1.id}", json={"alias": "One", "version": 1}, headers=auth_header
+    )
+    assert first.get_json() == {"id": e1.id, "version": 2, "alias": "One"}
+
+    stale = client.patch(
+        f"/entrants/{e1.id}", json={"alias": "Two", "version": 1}, headers=auth_header
+    )
+    assert stale.status_code == 409
+    assert stale.get_json()["version"] == 2
+    listed = client.get("/entrants").get_json()
+    assert [e["alias"] for e in listed if e["id"] == e1.id] == ["One"]
+
+    # ORM writes bump the version too
+    entrant = session.get(Entrant, e1.id)
+    entrant.soft_delete()
+    session.commit()
+    assert entrant.version == 3
+    stale = client.patch(
+        f"/entrants/{e1.id}", json={"dropped": False, "version": 2}, headers=auth_header
+    )
+    assert stale.get_json()["version"] == 3
+
+
+def test_entrant_patch_moves_counts_and_versions(
+    client, session, seed_event_with_entrants, auth_header
+):
+    event, e1, _ = seed_event_with_entrants()
+    other = Event(name="Other", date="2025-10-01")
+    session.add(other)
+    session.commit()
+    versions = (event.version, other.version)
+
+    resp = client.patch(
+        f"/entrants/{e1.id}",
+        json={"event_id": other.id, "dropped": True},
+        headers=auth_header,
+    )
+    assert resp.get_json() == {
+        "id": e1.id,
+        "version": 2,
+        "event_id": other.id,
+        "dropped": True,
+    }
+    session.expire_all()
+    assert (event.entrant_count, other.entrant_count) == (1, 1)
+    assert other.active_entrant_count == 0
+    assert (event.version, other.version) == (versions[0] + 1, versions[1] + 1)
+    assert check_entrant_counts() == []
+
+
+def test_entrant_with_matches_cannot_change_event(
+    client, session, seed_event_with_entrants, auth_header
+):
+    event, e1, e2 = seed_event_with_entrants()
+    other = Event(name="Other", date="2025-10-01")
+    session.add_all(
+        [other, Match(event_id=event.id, entrant1_id=e1.id, entrant2_id=e2.id)]
+    )
+    session.commit()
+
+    for method in (client.patch, client.put):
+        resp = method(
+            f"/entrants/{e1.id}", json={"event_id": other.id}, headers=auth_header
+        )
+        assert resp.status_code == 409
+        assert resp.get_json()["error"] == (
+            f"Entrant {e1.id} has matches in event {event.id}"
+        )
+    session.expire_all()
+    assert session.get(Entrant, e1.id).event_id == event.id
+    assert (event.entrant_count, other.entrant_count) == (2, 0)
+
+    # Other fields still update, and resending the same event isn't a move
+    resp = client.patch(
+        f"/entrants/{e1.id}",
+        json={"event_id": event.id, "alias": "Stays"},
+        headers=auth_header,
+    )
+    assert resp.get_json() == {"id": e1.id, "version": 2, "alias": "Stays"}
+
+
+def test_match_patch_validates_and_updates_standings(
+    client, session, seed_event_with_entrants, auth_header
+):
+    event, e1, e2 = seed_event_with_entrants()
+    outsider = Entrant(name="Elsewhere", event=Event(name="Other"))
+    session.add(outsider)
+    match = Match(event_id=event.id, entrant1_id=e1.id, entrant2_id=e2.id)
+    session.add(match)
+    session.commit()
+
+    for body, message in (
+        ({"winner_id": outsider.id}, "Winner ID must match one of the entrants"),
+        ({"entrant2_id": outsider.id}, f"Entrant {outsider.id} is not in event"),
+        ({"entrant2_id": e1.id}, "Entrants must be distinct"),
+        ({"event_id": 2}, "Unknown or read-only field(s): event_id"),
+        ({"scores": "2:0"}, "scores must be"),
+    ):
+        resp = client.patch(f"/matches/{match.id}", json=body, headers=auth_header)
+        assert resp.status_code == 400
+        assert message in resp.get_json()["error"]
+
+    resp = client.patch(
+        f"/matches/{match.id}",
+        json={"winner_id": e2.id, "scores": "21-15, 18-21, 15-21", "version": 1},
+        headers=auth_header,
+    )
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "id": match.id,
+        "version": 2,
+        "winner_id": e2.id,
+        "scores": "21-15, 18-21, 15-21",
+        "games1": 1,
+        "games2": 2,
+    }
+    standing = session.get(Standing, e2.id)
+    assert (standing.wins, standing.games_won, standing.games_lost) == (1, 2, 1)
+
+    full = client.put(f"/matches/{match.id}", json={}, headers=auth_header)
+    assert full.get_json()["winner"]["name"] == "Hero B"
+    assert full.get_json()["version"] == 2
+
+
+def test_patch_passes_cors_preflight(client, create_event):
+    event = create_event()
+    resp = client.options(
+        f"/events/{event.id}",
+        headers={
+            "Origin": Config.FRONTEND_URL,
+            "Access-Control-Request-Method": "PATCH",
+        },
+    )
+    assert "PATCH" in resp.headers["Access-Control-Allow-Methods"]
@@ -0,0 +1,120 @@
+# File: backend/tests/test_response_cache.py
+# Purpose: Tests for the server-side response cache (backend/response_cache.py).
+# Notes:
+# - Route tests read counters from app.extensions["response_cache"] as deltas,
+#   since the app (and its cache) is shared across the test session.
+
+import threading
+
+from sqlalchemy import update
+
+from backend.etags import bump_event_versions
+from backend.models import Event
+from backend.response_cache import MemoryResponseStore, ResponseCache
+
+
+def _stats(app):
+    return dict(app.extensions["response_cache"].stats())
+
+
+def test_event_detail_is_served_from_cache(app, client, create_event, count_queries):
+    event = create_event(name="Live Cup")
+    url = f"/events/{event.id}"
+    before = _stats(app)
+
+    first = client.get(url)
+    with count_queries() as queries:
+        second = client.get(url)
+
+    assert second.status_code == 200
+    assert second.get_json() == first.get_json()
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert len(queries) == 1  # version lookup only
+    after = _stats(app)
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+
+def test_writes_invalidate_event_and_catalog(app, client, create_event, auth_header):
+    event = create_event(name="Live Cup")
+    other = create_event(name="Other Cup")
+    client.get("/events")
+    client.get(f"/events/{event.id}")
+    client.get(f"/events/{other.id}")
+
+    before = _stats(app)
+    client.post(
+        "/entrants", json={"name": "Hero", "event_id": event.id}, headers=auth_header
+    )
+    assert _stats(app)["invalidations"] - before["invalidations"] == 2
+
+    assert client.get("/events").get_json()[0]["entrant_count"] == 1
+    assert len(client.get(f"/events/{event.id}").get_json()["entrants"]) == 1
+    client.get(f"/events/{other.id}")
+    after = _stats(app)
+    assert after["misses"] - before["misses"] == 2
+    assert after["hits"] - before["hits"] == 1  # untouched event stays cached
+
+
+def test_stale_version_is_never_served(client, create_event, session):
+    event = create_event(name="Live Cup")
+    url = f"/events/{event.id}"
+    client.get(url)
+
+    # Another worker's write: the version moves without touching this cache
+    session.execute(
+        update(Event)
+        .where(Event.id == event.id)
+        .values(name="Renamed Cup", version=Event.version + 1)
+    )
+    session.commit()
+
+    assert client.get(url).get_json()["name"] == "Renamed Cup"
+
+
+def test_lru_evictions_and_ttl():
+    now = [0.0]
+    store = MemoryResponseStore(maxsize=2)
+    store.cache.clock = lambda: now[0]
+    cache = ResponseCache(store, ttl=10)
+
+    cache.put("a", "etag-a", b"A")
+    cache.put("b", "etag-b", b"B")
+    assert cache.get("a", "etag-a") == b"A"
+    cache.put("c", "etag-c", b"C")  # evicts b, the least recently used
+
+    assert cache.get("b", "etag-b") is None
+    assert cache.get("c", "etag-c") == b"C"
+    assert cache.get("a", "etag-stale") is None
+    now[0] = 11
+    assert cache.get("a", "etag-a") is None
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 3
+
+
+def test_bump_drops_only_matching_prefixes(app):
+    with app.test_request_context():
+        cache = app.extensions["response_cache"]
+        cache.put("event:1:/events/1?", "x", b"1")
+        cache.put("event:10:/events/10?", "x", b"10")
+        bump_event_versions([1])
+        assert cache.store.get("event:1:/events/1?") is None
+        assert cache.store.get("event:10:/events/10?") is not None
+
+
+def test_counters_are_exact_across_threads():
+    cache = ResponseCache(MemoryResponseStore(maxsize=4))
+    cache.put("a", "etag-a", b"A")
+
+    def read():
+        for n in range(5000):
+            cache.get("a", "etag-a" if n % 2 else "stale")
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (10000, 10000)
@@ -0,0 +1,133 @@
+# File: backend/tests/test_results.py
+# Purpose: Tests for batch result reporting (POST /events/<id>/results,
+#          backend/results.py).
+
+from backend.models import Event, Match, MatchGame, Standing
+
+
+def _round(session, entrants):
+    """Pair entrants 1v2, 3v4, ... in round 1."""
+    matches = [
+        Match(
+            event_id=entrants[0].event_id, round=1, entrant1_id=a.id, entrant2_id=b.id
+        )
+        for a, b in zip(entrants[::2], entrants[1::2])
+    ]
+    session.add_all(matches)
+    session.commit()
+    return entrants, matches
+
+
+def test_results_apply_in_one_update(
+    client, session, create_event, make_entrants, auth_header, count_queries
+):
+    event = create_event(status="published")
+    (a, b, c, d), (m1, m2) = _round(session, make_entrants(event, 4))
+
+    with count_queries() as queries:
+        resp = client.post(
+            f"/events/{event.id}/results",
+            json=[
+                {"match_id": m1.id, "winner_id": a.id, "scores": "2-1"},
+                {"match_id": m2.id, "winner_id": d.id, "scores": "15-21, 21-19, 9-21"},
+            ],
+            headers=auth_header,
+        )
+    assert resp.status_code == 200
+    updated = {m["id"]: m for m in resp.get_json()}
+    assert updated[m1.id]["winner"]["name"] == "Hero 1"
+    assert (updated[m2.id]["games1"], updated[m2.id]["games2"]) == (1, 2)
+    assert updated[m2.id]["version"] == 2
+    match_updates = [q for q in queries if q.startswith("UPDATE matches")]
+    assert len(match_updates) == 1
+
+    session.expire_all()
+    assert session.get(Standing, d.id).games_won == 2
+    assert session.get(Standing, b.id).losses == 1
+    assert session.query(MatchGame).filter_by(match_id=m2.id).count() == 3
+
+    # Re-sending the same results changes nothing
+    again = client.post(
+        f"/events/{event.id}/results",
+        json=[{"match_id": m1.id, "winner_id": a.id, "scores": "2-1"}],
+        headers=auth_header,
+    )
+    assert again.get_json() == []
+
+
+def test_results_reject_the_whole_batch(
+    client, session, create_event, make_entrants, auth_header
+):
+    event = create_event(status="published")
+    (a, b, c, _), (m1, m2) = _round(session, make_entrants(event, 4))
+    other = Event(name="Other")
+    stray = Match(event=other)
+    session.add(stray)
+    session.commit()
+
+    resp = client.post(
+        f"/events/{event.id}/results",
+        json=[
+            {"match_id": m1.id, "winner_id": a.id},
+            {"match_id": m2.id, "winner_id": a.id},
+            {"match_id": stray.id, "winner_id": None},
+            {"match_id": m1.id, "scores": "2-0"},
+            {"match_id": m2.id},
+            {"match_id": m2.id, "scores": "2-0", "round": 3},
+        ],
+        headers=auth_header,
+    )
+    assert resp.status_code == 400
+    assert [e["error"] for e in resp.get_json()["errors"]] == [
+        "winner_id or scores is required",
+        "Unknown or read-only field(s): round",
+        "Winner ID must match one of the entrants",
+        f"Match {stray.id} is not in event {event.id}",
+        f"Match {m1.id} appears more than once",
+    ]
+    session.expire_all()
+    assert session.get(Match, m1.id).winner_id is None
+
+    stale = client.post(
+        f"/events/{event.id}/results",
+        json=[
+            {"match_id": m1.id, "winner_id": a.id},
+            {"match_id": m2.id, "winner_id": c.id, "version": 7},
+        ],
+        headers=auth_header,
+    )
+    assert stale.status_code == 409
+    assert stale.get_json()["errors"][0]["version"] == 1
+    assert session.get(Match, m1.id).winner_id is None
+
+    missing = client.post("/events/999/results", json=[{}], headers=auth_header)
+    assert missing.status_code == 404
+
+
+def test_results_advance_brackets_once_per_batch(
+    client, session, create_event, make_entrants, auth_header
+):
+    event = create_event(status="published")
+    make_entrants(event, 4)
+    bracket = client.post(
+        "/matches/bracket", json={"event_id": event.id}, headers=auth_header
+    ).get_json()
+    semis = [m for m in bracket if m["round"] == 1]
+    final = next(m for m in bracket if m["round"] == 2)
+
+    resp = client.post(
+        f"/events/{event.id}/results",
+        json=[{"match_id": m["id"], "winner_id": m["entrant2_id"]} for m in semis],
+        headers=auth_header,
+    )
+    assert resp.status_code == 200
+    updated = {m["id"]: m for m in resp.get_json()}
+    assert set(updated) == {semis[0]["id"], semis[1]["id"], final["id"]}
+    assert (
+        updated[final["id"]]["entrant1_id"],
+        updated[final["id"]]["entrant2_id"],
+    ) == (
+        semis[0]["entrant2_id"],
+        semis[1]["entrant2_id"],
+    )
+    assert session.get(Standing, semis[0]["entrant2_id"]).wins == 1
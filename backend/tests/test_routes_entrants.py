@@ -6,6 +6,7 @@
 
 from backend.models import Entrant, Match, db
 from sqlalchemy import select
+import json
 
 
 def test_create_entrant(client, create_event, auth_header):
@@ -103,3 +104,88 @@ def test_create_event_requires_auth(client):
         },
     )
     assert resp.status_code == 401
+
+
+def test_get_entrants_keyset_pagination(client, create_event, session):
+    event = create_event()
+    session.add_all(Entrant(name=f"Hero {i}", event_id=event.id) for i in range(5))
+    session.commit()
+
+    first = client.get(f"/entrants?event_id={event.id}&limit=3").get_json()
+    assert [e["name"] for e in first["items"]] == ["Hero 0", "Hero 1", "Hero 2"]
+    assert first["next_cursor"]
+
+    second = client.get(
+        f"/entrants?event_id={event.id}&limit=3&after={first['next_cursor']}"
+    ).get_json()
+    assert [e["name"] for e in second["items"]] == ["Hero 3", "Hero 4"]
+    assert second["next_cursor"] is None
+
+
+def test_get_entrants_stream_ndjson(client, create_event, session):
+    event = create_event()
+    session.add_all(Entrant(name=f"Hero {i}", event_id=event.id) for i in range(3))
+    session.commit()
+
+    resp = client.get("/entrants?stream=1")
+    assert resp.mimetype == "application/x-ndjson"
+    names = [
+        json.loads(line)["name"] for line in resp.get_data(as_text=True).splitlines()
+    ]
+    assert names == ["Hero 0", "Hero 1", "Hero 2"]
+
+
+def test_create_entrants_bulk(client, create_event, auth_header, count_queries):
+    event = create_event()
+    rows = [{"name": f"Hero {i}", "event_id": event.id} for i in range(300)]
+
+    with count_queries() as queries:
+        resp = client.post("/entrants/bulk", json=rows, headers=auth_header)
+    assert resp.status_code == 201
+    assert len(resp.get_json()) == 300
+    # event check + one batched INSERT (SQLite may split into a few VALUES chunks)
+    inserts = [q for q in queries if q.startswith("INSERT")]
+    assert 1 <= len(inserts) <= 3
+    assert db.session.query(Entrant).count() == 300
+
+
+def test_create_entrants_bulk_keeps_input_order(
+    client, create_event, auth_header, monkeypatch
+):
+    from backend.routes import entrants as routes
+
+    # RETURNING order isn't guaranteed; scramble it to prove it isn't relied on
+    real = routes.in_row_order
+    monkeypatch.setattr(
+        routes, "in_row_order", lambda rows, objects: real(rows, objects[::-1])
+    )
+    event, other = create_event(), create_event(name="Other Cup")
+    rows = [
+        {"name": "Twin", "event_id": event.id},
+        {"name": "Solo", "event_id": other.id, "alias": "S"},
+        {"name": "Twin", "event_id": event.id},
+        {"name": "Late", "event_id": event.id, "dropped": True},
+    ]
+    resp = client.post("/entrants/bulk", json=rows, headers=auth_header)
+    assert resp.status_code == 201
+    created = resp.get_json()
+    assert [(e["name"], e["event_id"], e["dropped"]) for e in created] == [
+        (r["name"], r["event_id"], r.get("dropped", False)) for r in rows
+    ]
+    for item in created:
+        assert db.session.get(Entrant, item["id"]).name == item["name"]
+
+
+def test_create_entrants_bulk_reports_row_errors(client, create_event, auth_header):
+    event = create_event()
+    rows = [
+        {"name": "Valid", "event_id": event.id},
+        {"event_id": event.id},
+        {"name": "Orphan", "event_id": 9999},
+    ]
+    resp = client.post("/entrants/bulk", json=rows, headers=auth_header)
+    assert resp.status_code == 400
+    errors = resp.get_json()["errors"]
+    assert [e["index"] for e in errors] == [1, 2]
+    assert "not found" in errors[1]["error"]
+    assert db.session.query(Entrant).count() == 0
@@ -4,9 +4,12 @@
 # - Uses Flask test client fixture (`client`) and helpers from conftest.py.
 # - Covers create, read (with entrant counts), update, and delete.
 # - Adds regression test for multi-level ordering: date desc → status priority → name asc.
+# - Asserts GET /events/<id> stays within a fixed query budget.
 
-from backend.models import Event, Entrant, db
+from backend.models import Event, Entrant, Match, db
+from backend.pagination import encode_cursor
 from sqlalchemy import select
+import json
 
 
 def test_create_event(client, auth_header):
@@ -105,3 +108,96 @@ def test_get_events_sort_order(client, session):
     # - Within that date: published > drafting (alphabetical Delta < Zeta) > completed
     # - Then the older 2025-09-10 event last
     assert names == ["Beta", "Delta", "Zeta", "Gamma", "Alpha"]
+
+
+def test_get_event_detail_uses_bounded_queries(
+    client, create_event, session, count_queries
+):
+    event = create_event(name="Live Cup", status="published")
+    entrants = [Entrant(name=f"Hero {i}", event_id=event.id) for i in range(32)]
+    session.add_all(entrants)
+    session.flush()
+    session.add_all(
+        Match(
+            event_id=event.id,
+            round=1,
+            entrant1_id=entrants[i].id,
+            entrant2_id=entrants[i + 1].id,
+            winner_id=entrants[i + 1].id,
+        )
+        for i in range(0, 32, 2)
+    )
+    session.commit()
+
+    url = f"/events/{event.id}"
+    with count_queries() as queries:
+        resp = client.get(url)
+    assert resp.status_code == 200
+
+    data = resp.get_json()
+    assert data["entrant_count"] == 32
+    assert len(data["entrants"]) == 32
+    assert len(data["matches"]) == 16
+    assert data["matches"][0]["winner"]["name"] == "Hero 1"
+    # version lookup + event + selectin entrants + selectin matches
+    assert len(queries) <= 4
+
+
+def test_get_event_not_found(client):
+    resp = client.get("/events/9999")
+    assert resp.status_code == 404
+
+
+def test_get_events_keyset_pagination_matches_full_order(client, session):
+    session.add_all(
+        [
+            Event(name="Alpha", date="2025-09-10", status="drafting"),
+            Event(name="Beta", date="2025-09-12", status="published"),
+            Event(name="Gamma", date="2025-09-12", status="completed"),
+            Event(name="Delta", date="2025-09-12", status="drafting"),
+            Event(name="Zeta", date="2025-09-12", status="drafting"),
+            Event(name="Undated", date=None, status="published"),
+        ]
+    )
+    session.commit()
+
+    full = [e["name"] for e in client.get("/events").get_json()]
+
+    names, cursor = [], None
+    while True:
+        url = "/events?limit=2" + (f"&after={cursor}" if cursor else "")
+        resp = client.get(url)
+        assert resp.status_code == 200
+        page = resp.get_json()
+        assert len(page["items"]) <= 2
+        names.extend(e["name"] for e in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert names == full
+    assert names[:5] == ["Beta", "Delta", "Zeta", "Gamma", "Alpha"]
+
+
+def test_get_events_rejects_bad_pagination_args(client):
+    assert client.get("/events?limit=abc").status_code == 400
+    assert client.get("/events?limit=0").status_code == 400
+    assert client.get("/events?after=not-a-cursor").status_code == 400
+    # Well-formed cursors with the wrong value types
+    for values in ([{"a": 1}] * 4, ["2025", 1, "Cup", "7"], ["", 1, None, 7]):
+        cursor = encode_cursor(values)
+        assert client.get(f"/events?limit=2&after={cursor}").status_code == 400
+    assert client.get("/entrants?limit=2&after=W3siYSI6MX1d").status_code == 400
+    assert client.get("/matches?limit=2&after=WyIxIl0").status_code == 400
+
+
+def test_get_events_stream_ndjson(client, create_event):
+    create_event(name="Older", date="2025-01-01")
+    create_event(name="Newer", date="2025-02-01")
+
+    resp = client.get("/events?stream=1")
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+    assert [e["name"] for e in rows] == ["Newer", "Older"]
+    assert rows[0]["entrant_count"] == 0
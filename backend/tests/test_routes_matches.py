@@ -4,9 +4,11 @@
 # - Uses helper fixture seed_event_with_entrants from conftest.py.
 # - Covers create, read, update, and delete for Match.
 # - Includes validation for winner_id correctness.
+# - Guards against N+1 entrant lookups when listing matches with names.
 
-from backend.models import Match, db
+from backend.models import Entrant, Match, db
 from sqlalchemy import select
+import json
 
 
 def test_create_match(client, seed_event_with_entrants, auth_header):
@@ -114,3 +116,132 @@ def test_create_event_requires_auth(client):
         },
     )
     assert resp.status_code == 401
+
+
+def test_get_matches_resolves_names_in_bounded_queries(
+    client, create_event, session, count_queries
+):
+    event = create_event(name="Big Bracket", status="published")
+    entrants = [Entrant(name=f"Hero {i}", event_id=event.id) for i in range(40)]
+    session.add_all(entrants)
+    session.flush()
+    session.add_all(
+        Match(
+            event_id=event.id,
+            round=1,
+            entrant1_id=entrants[i].id,
+            entrant2_id=entrants[i + 1].id,
+            winner_id=entrants[i].id,
+        )
+        for i in range(0, 40, 2)
+    )
+    session.commit()
+
+    url = f"/matches?event_id={event.id}"
+    with count_queries() as queries:
+        resp = client.get(url)
+    assert resp.status_code == 200
+
+    data = resp.get_json()
+    assert len(data) == 20
+    assert data[0]["entrant1"]["name"] == "Hero 0"
+    assert data[0]["winner"]["name"] == "Hero 0"
+    # Version lookup, one query for matches, one batched entrant lookup
+    assert len(queries) == 3
+
+
+def test_get_matches_keyset_pagination(client, seed_event_with_entrants, session):
+    event, e1, e2 = seed_event_with_entrants()
+    session.add_all(
+        Match(event_id=event.id, round=r, entrant1_id=e1.id, entrant2_id=e2.id)
+        for r in range(1, 5)
+    )
+    session.commit()
+
+    first = client.get("/matches?limit=2").get_json()
+    assert [m["round"] for m in first["items"]] == [1, 2]
+    assert first["items"][0]["entrant1"]["name"] == "Hero A"
+
+    second = client.get(f"/matches?limit=2&after={first['next_cursor']}").get_json()
+    assert [m["round"] for m in second["items"]] == [3, 4]
+    assert second["next_cursor"] is None
+
+
+def test_get_matches_stream_ndjson(client, seed_event_with_entrants, session):
+    event, e1, e2 = seed_event_with_entrants()
+    session.add_all(
+        Match(
+            event_id=event.id,
+            round=r,
+            entrant1_id=e1.id,
+            entrant2_id=e2.id,
+            winner_id=e2.id,
+        )
+        for r in range(1, 4)
+    )
+    session.commit()
+
+    for kwargs in (
+        {"query_string": {"stream": "1"}},
+        {"headers": {"Accept": "application/x-ndjson"}},
+    ):
+        resp = client.get("/matches", **kwargs)
+        assert resp.status_code == 200
+        assert resp.mimetype == "application/x-ndjson"
+        rows = [json.loads(line) for line in resp.get_data(as_text=True).splitlines()]
+        assert [m["round"] for m in rows] == [1, 2, 3]
+        assert rows[0]["winner"]["name"] == "Hero B"
+
+
+def test_create_matches_bulk(client, seed_event_with_entrants, auth_header):
+    event, e1, e2 = seed_event_with_entrants()
+    rows = [
+        {
+            "event_id": event.id,
+            "round": r,
+            "entrant1_id": e1.id,
+            "entrant2_id": e2.id,
+            "winner_id": e1.id,
+            "scores": "2-0",
+        }
+        for r in range(1, 51)
+    ]
+    resp = client.post("/matches/bulk", json={"items": rows}, headers=auth_header)
+    assert resp.status_code == 201
+    data = resp.get_json()
+    assert len(data) == 50
+    assert data[0]["winner"]["name"] == "Hero A"
+
+    standings = client.get(f"/events/{event.id}/standings").get_json()
+    assert standings[0]["wins"] == 50
+
+
+def test_create_matches_bulk_reports_row_errors(
+    client, seed_event_with_entrants, create_event, session, auth_header
+):
+    event, e1, e2 = seed_event_with_entrants()
+    other = create_event(name="Other Cup")
+    outsider = Entrant(name="Outsider", event_id=other.id)
+    session.add(outsider)
+    session.commit()
+
+    base = {"event_id": event.id, "entrant1_id": e1.id, "entrant2_id": e2.id}
+    rows = [
+        base,
+        {**base, "winner_id": 999},
+        {**base, "entrant2_id": e1.id},
+        {**base, "entrant2_id": outsider.id},
+        {**base, "entrant1_id": "abc"},
+    ]
+    resp = client.post("/matches/bulk", json=rows, headers=auth_header)
+    assert resp.status_code == 400
+    errors = resp.get_json()["errors"]
+    assert [e["index"] for e in errors] == [1, 2, 3, 4]
+    assert "winner id must match" in errors[0]["error"].lower()
+    assert "not in event" in errors[2]["error"]
+    assert db.session.query(Match).count() == 0
+
+
+def test_create_matches_bulk_rejects_bad_body(client, auth_header):
+    resp = client.post("/matches/bulk", json={"nope": 1}, headers=auth_header)
+    assert resp.status_code == 400
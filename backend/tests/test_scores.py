@@ -0,0 +1,200 @@
+# File: backend/tests/test_scores.py
+# Purpose: Tests for structured match scores (backend/scores.py) through the
+#          match routes, standings rebuild and GET /events/<id>/totals.
+
+import pytest
+
+from backend.models import Entrant, Match, MatchGame, Standing
+from backend.scores import BYE_SCORE, ScoreError, parse_scores
+from backend.standings import rebuild_standings
+
+
+def _points(session, match_id):
+    rows = session.query(MatchGame).filter_by(match_id=match_id)
+    return [(g.points1, g.points2) for g in rows.order_by(MatchGame.number)]
+
+
+def test_parse_scores_formats():
+    assert parse_scores("2-1")[:3] == ("2-1", 2, 1)
+    assert parse_scores(" 0 - 3 ")[:3] == ("0-3", 0, 3)
+    assert parse_scores("21-15,18-21 , 21-19") == (
+        "21-15, 18-21, 21-19",
+        2,
+        1,
+        ((21, 15), (18, 21), (21, 19)),
+    )
+    assert parse_scores([[11, 4], [11, 9]])[:3] == ("11-4, 11-9", 2, 0)
+    assert parse_scores("bye")[:3] == (BYE_SCORE, None, None)
+    assert parse_scores("")[:3] == (None, None, None)
+    assert parse_scores(None)[:3] == (None, None, None)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "two-one",
+        "2-1-0",
+        "21-21, 15-10",
+        [[1, -1], [2, 0]],
+        [[1.5, 0], [2, 0]],
+        [[21, 15]],
+        [],
+        7,
+    ],
+)
+def test_parse_scores_rejects_malformed(value):
+    with pytest.raises(ScoreError):
+        parse_scores(value)
+
+
+def test_match_writes_keep_per_game_rows(
+    client, seed_event_with_entrants, session, auth_header
+):
+    event, e1, e2 = seed_event_with_entrants()
+    resp = client.post(
+        "/matches",
+        json={
+            "event_id": event.id,
+            "entrant1_id": e1.id,
+            "entrant2_id": e2.id,
+            "winner_id": e1.id,
+            "scores": "21-15, 18-21, 21-19",
+        },
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    data = resp.get_json()
+    assert (data["scores"], data["games1"], data["games2"]) == (
+        "21-15, 18-21, 21-19",
+        2,
+        1,
+    )
+    match_id = data["id"]
+    assert _points(session, match_id) == [(21, 15), (18, 21), (21, 19)]
+
+    resp = client.put(
+        f"/matches/{match_id}", json={"scores": "2-0"}, headers=auth_header
+    )
+    assert resp.get_json()["games1"] == 2
+    assert _points(session, match_id) == []
+
+    bad = client.put(
+        f"/matches/{match_id}", json={"scores": "2:0"}, headers=auth_header
+    )
+    assert bad.status_code == 400
+    assert "scores must be" in bad.get_json()["error"]
+
+    client.put(
+        f"/matches/{match_id}", json={"scores": [[3, 5], [5, 2]]}, headers=auth_header
+    )
+    assert _points(session, match_id) == [(3, 5), (5, 2)]
+    assert client.delete(f"/matches/{match_id}", headers=auth_header).status_code
+    assert _points(session, match_id) == []
+
+
+def test_bulk_create_validates_scores(
+    client, seed_event_with_entrants, session, auth_header
+):
+    event, e1, e2 = seed_event_with_entrants()
+    row = {"event_id": event.id, "entrant1_id": e1.id, "entrant2_id": e2.id}
+
+    bad = client.post(
+        "/matches/bulk", json=[{**row, "scores": "1-1, 2-2"}], headers=auth_header
+    )
+    assert bad.status_code == 400
+
+    resp = client.post(
+        "/matches/bulk",
+        json=[{**row, "scores": "2-0"}, {**row, "scores": "11-3, 5-11, 11-7"}],
+        headers=auth_header,
+    )
+    assert resp.status_code == 201
+    first, second = resp.get_json()
+    assert _points(session, first["id"]) == []
+    assert _points(session, second["id"]) == [(11, 3), (5, 11), (11, 7)]
+
+
+def test_bulk_create_stores_each_matchs_own_games(
+    client, seed_event_with_entrants, session, auth_header, monkeypatch
+):
+    from backend.routes import matches as routes
+
+    # RETURNING order isn't guaranteed; scramble it to prove it isn't relied on
+    real = routes.in_row_order
+    monkeypatch.setattr(
+        routes, "in_row_order", lambda rows, objects: real(rows, objects[::-1])
+    )
+    event, e1, e2 = seed_event_with_entrants()
+    played = [
+        ("21-10, 21-12", e1),
+        ("2-1", e2),
+        ("11-3, 5-11, 11-7", e1),
+        ("11-3, 5-11, 11-7", e1),
+        ("9-11, 11-13", e2),
+    ]
+    rows = [
+        {
+            "event_id": event.id,
+            "round": 1,
+            "entrant1_id": e1.id,
+            "entrant2_id": e2.id,
+            "winner_id": winner.id,
+            "scores": scores,
+        }
+        for scores, winner in played
+    ]
+    resp = client.post("/matches/bulk", json=rows, headers=auth_header)
+    assert resp.status_code == 201
+
+    for match, (scores, winner) in zip(resp.get_json(), played):
+        assert (match["scores"], match["winner_id"]) == (scores, winner.id)
+        assert _points(session, match["id"]) == list(parse_scores(scores).points)
+
+
+def test_totals_are_summed_in_sql_and_agree_with_standings(
+    client, create_event, session, auth_header
+):
+    event = create_event(status="published")
+    a, b, c = (Entrant(name=n, event_id=event.id) for n in ("A", "B", "C"))
+    session.add_all([a, b, c])
+    session.commit()
+    for e1, e2, winner, scores in (
+        (a, b, a, "21-10, 21-12"),
+        (c, a, a, "2-1"),
+        (b, c, None, "21-0, 21-0"),  # undecided: not counted
+    ):
+        client.post(
+            "/matches",
+            json={
+                "event_id": event.id,
+                "entrant1_id": e1.id,
+                "entrant2_id": e2.id,
+                "winner_id": winner.id if winner else None,
+                "scores": scores,
+            },
+            headers=auth_header,
+        )
+    session.add(Match(event_id=event.id, entrant1_id=c.id, winner_id=c.id))
+    session.commit()
+
+    totals = {
+        row["entrant_id"]: row
+        for row in client.get(f"/events/{event.id}/totals").get_json()
+    }
+    assert totals[a.id] == {
+        "entrant_id": a.id,
+        "games_won": 3,
+        "games_lost": 2,
+        "points_won": 42,
+        "points_lost": 22,
+    }
+    assert (totals[b.id]["games_won"], totals[b.id]["points_lost"]) == (0, 42)
+    assert (totals[c.id]["games_won"], totals[c.id]["games_lost"]) == (2, 1)
+
+    incremental = session.get(Standing, a.id)
+    assert (incremental.games_won, incremental.games_lost) == (3, 2)
+    rebuild_standings(event.id)
+    session.commit()
+    rebuilt = session.get(Standing, a.id)
+    assert (rebuilt.games_won, rebuilt.games_lost) == (3, 2)
+    assert client.get("/events/999/totals").status_code == 404
@@ -0,0 +1,117 @@
+# File: backend/tests/test_seed_db.py
+# Purpose: Tests for the bulk seed loader (backend/scripts/seed_db.py).
+# Notes:
+# - Tiny chunk sizes force elements to straddle read boundaries.
+
+import json
+
+import pytest
+from sqlalchemy import inspect
+
+from backend.models import Entrant, Event, Match, MatchGame, Standing, db
+from backend.scripts.seed_db import (
+    iter_json_array,
+    load_seed_dir,
+    secondary_indexes_dropped,
+)
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data, indent=2))
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_iter_json_array_streams_across_chunks(tmp_path, chunk_size):
+    items = [{"id": i, "name": f"Hero {i}", "tags": ["a", "]"]} for i in range(20)]
+    items += [12345, "x,y", None]
+    path = _write(tmp_path / "items.json", items)
+
+    assert list(iter_json_array(path, chunk_size=chunk_size)) == items
+
+
+def test_iter_json_array_edge_cases(tmp_path):
+    empty = tmp_path / "empty.json"
+    empty.write_text("  [ ]  ")
+    assert list(iter_json_array(empty)) == []
+
+    for name, text in [("obj.json", '{"a": 1}'), ("cut.json", '[{"a": 1},')]:
+        path = tmp_path / name
+        path.write_text(text)
+        with pytest.raises(ValueError):
+            list(iter_json_array(path, chunk_size=3))
+
+
+# batch_size=1 puts the forward bracket link and each match's games in
+# separate batches
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_load_seed_dir(app, session, client, auth_header, tmp_path, batch_size):
+    _write(
+        tmp_path / "events.json",
+        [{"id": 7, "name": "Seed Cup", "date": "2025-09-10", "status": "published"}],
+    )
+    _write(
+        tmp_path / "entrants.json",
+        [
+            {"id": i, "name": f"Hero {i}", "alias": None, "event_id": 7}
+            for i in (1, 2, 3)
+        ],
+    )
+    _write(
+        tmp_path / "matches.json",
+        [
+            {
+                "id": 1,
+                "round": 1,
+                "event_id": 7,
+                "entrant1_id": 1,
+                "entrant2_id": 2,
+                "scores": "2-1",
+                "winner_id": 1,
+                "next_match_id": 2,
+                "next_match_slot": 1,
+            },
+            {
+                "id": 2,
+                "round": 2,
+                "event_id": 7,
+                "entrant1_id": 1,
+                "entrant2_id": 3,
+                "scores": "11-4, 7-11",
+            },
+        ],
+    )
+
+    counts = load_seed_dir(tmp_path, batch_size=batch_size)
+    session.commit()
+
+    assert counts == {"events": 1, "entrants": 3, "matches": 2}
+    event = db.session.get(Event, 7)
+    assert (event.version, event.updated_at is not None) == (1, True)
+    assert db.session.get(Entrant, 3).dropped is False
+    assert db.session.get(Match, 1).next_match_id == 2
+    standing = Standing.query.filter_by(entrant_id=1).one()
+    assert (standing.wins, standing.games_won, standing.games_lost) == (1, 2, 1)
+    second = db.session.get(Match, 2)
+    assert (second.games1, second.games2) == (1, 1)
+    assert MatchGame.query.filter_by(match_id=2).count() == 2
+    # Indexes dropped for the load are back
+    indexes = {ix["name"] for ix in inspect(db.engine).get_indexes("matches")}
+    assert "ix_matches_event_id_round" in indexes
+
+    resp = client.post(
+        "/entrants", json={"name": "Late", "event_id": 7}, headers=auth_header
+    )
+    assert resp.status_code == 201
+    assert resp.get_json()["id"] == 4
+
+
+def test_indexes_rebuilt_when_load_fails(app, session):
+    table = Match.__table__
+    with pytest.raises(RuntimeError):
+        with secondary_indexes_dropped(db.session.connection(), table):
+            raise RuntimeError("bad row")
+    indexes = {
+        ix["name"] for ix in inspect(db.session.connection()).get_indexes("matches")
+    }
+    assert {ix.name for ix in table.indexes} <= indexes
@@ -0,0 +1,221 @@
+# File: backend/tests/test_standings.py
+# Purpose: Tests for incrementally maintained standings.
+# Notes:
+# - Drives match writes through the API, then compares the incremental
+#   Standing rows with a from-scratch rebuild_standings() recompute.
+
+import random
+
+from backend.models import Entrant, Standing
+from backend.standings import check_standings, rebuild_standings
+
+COLUMNS = (
+    "wins",
+    "losses",
+    "byes",
+    "games_won",
+    "games_lost",
+    "opp_wins",
+    "opp_losses",
+)
+
+
+def _snapshot_table(session, event_id):
+    session.expire_all()
+    return {
+        s.entrant_id: tuple(getattr(s, c) for c in COLUMNS)
+        for s in session.query(Standing).filter_by(event_id=event_id)
+        if any(getattr(s, c) for c in COLUMNS)
+    }
+
+
+def test_standings_endpoint_ranks_by_record(
+    client, create_event, session, auth_header, count_queries
+):
+    event = create_event(status="published")
+    a, b, c = (Entrant(name=n, event_id=event.id) for n in ("A", "B", "C"))
+    session.add_all([a, b, c])
+    session.commit()
+
+    for e1, e2, winner, scores in (
+        (a, b, a, "2-0"),
+        (a, c, a, "2-1"),
+        (c, b, c, "2-1"),
+    ):
+        resp = client.post(
+            "/matches",
+            json={
+                "event_id": event.id,
+                "round": 1,
+                "entrant1_id": e1.id,
+                "entrant2_id": e2.id,
+                "winner_id": winner.id,
+                "scores": scores,
+            },
+            headers=auth_header,
+        )
+        assert resp.status_code == 201
+
+    url = f"/events/{event.id}/standings"
+    with count_queries() as queries:
+        resp = client.get(url)
+    assert resp.status_code == 200
+    assert len(queries) <= 2  # event lookup + one standings join, no match scan
+
+    rows = resp.get_json()
+    assert [r["entrant"]["name"] for r in rows] == ["A", "C", "B"]
+    top = rows[0]
+    assert (top["wins"], top["losses"], top["game_diff"]) == (2, 0, 3)
+    assert top["buchholz"] == 1  # B has 0 wins, C has 1
+    assert rows[1]["opp_win_pct"] == 0.5  # C's opponents: A (2-0), B (0-2)
+
+
+def test_incremental_standings_match_rebuild(
+    client, create_event, session, auth_header
+):
+    rng = random.Random(7)
+    event = create_event(status="published")
+    entrants = [Entrant(name=f"Hero {i}", event_id=event.id) for i in range(8)]
+    session.add_all(entrants)
+    session.commit()
+    ids = [e.id for e in entrants]
+
+    match_ids = []
+    for _ in range(40):
+        action = rng.choice(("create", "create", "update", "delete"))
+        if action == "create" or not match_ids:
+            e1, e2 = rng.sample(ids, 2)
+            resp = client.post(
+                "/matches",
+                json={
+                    "event_id": event.id,
+                    "entrant1_id": e1,
+                    "entrant2_id": e2,
+                    "winner_id": rng.choice((e1, e2, None)),
+                    "scores": f"{rng.randint(0, 2)}-{rng.randint(0, 2)}",
+                },
+                headers=auth_header,
+            )
+            match_ids.append(resp.get_json()["id"])
+        elif action == "update":
+            match = client.get(f"/matches?event_id={event.id}").get_json()
+            m = rng.choice(match)
+            client.put(
+                f"/matches/{m['id']}",
+                json={
+                    "winner_id": rng.choice((m["entrant1_id"], m["entrant2_id"], None)),
+                    "scores": f"{rng.randint(0, 2)}-{rng.randint(0, 2)}",
+                },
+                headers=auth_header,
+            )
+        else:
+            match_id = match_ids.pop(rng.randrange(len(match_ids)))
+            client.delete(f"/matches/{match_id}", headers=auth_header)
+
+    incremental = _snapshot_table(session, event.id)
+    rebuild_standings(event.id)
+    session.commit()
+    assert incremental == _snapshot_table(session, event.id)
+
+
+def test_bracket_byes_and_walkovers_are_recorded(
+    client, create_event, session, auth_header
+):
+    event = create_event(status="published")
+    entrants = [Entrant(name=f"Hero {i}", event_id=event.id) for i in range(3)]
+    session.add_all(entrants)
+    session.commit()
+
+    matches = client.post(
+        "/matches/bracket",
+        json={"event_id": event.id, "format": "double"},
+        headers=auth_header,
+    ).get_json()
+    playable = next(m for m in matches if m["entrant1_id"] and m["entrant2_id"])
+    client.put(
+        f"/matches/{playable['id']}",
+        json={"winner_id": playable["entrant2_id"], "scores": "1-2"},
+        headers=auth_header,
+    )
+
+    incremental = _snapshot_table(session, event.id)
+    assert incremental[entrants[0].id][COLUMNS.index("byes")] == 1
+    rebuild_standings(event.id)
+    session.commit()
+    assert incremental == _snapshot_table(session, event.id)
+
+
+def test_deletes_leave_no_standings_for_reused_ids(
+    client, create_event, session, auth_header
+):
+    event = create_event(status="published")
+    a, b = (Entrant(name=n, event_id=event.id) for n in ("A", "B"))
+    session.add_all([a, b])
+    session.commit()
+    old_ids = (event.id, a.id, b.id)
+    match = client.post(
+        "/matches",
+        json={
+            "event_id": event.id,
+            "entrant1_id": a.id,
+            "entrant2_id": b.id,
+            "winner_id": a.id,
+            "scores": "2-0",
+        },
+        headers=auth_header,
+    ).get_json()
+
+    # Entrant hard delete: the match is gone, its zeroed rows must go too
+    client.delete(f"/matches/{match['id']}", headers=auth_header)
+    assert client.delete(f"/entrants/{b.id}", headers=auth_header).status_code == 204
+    assert session.get(Standing, old_ids[2]) is None
+
+    client.post(
+        "/matches",
+        json={"event_id": event.id, "entrant1_id": a.id, "winner_id": a.id},
+        headers=auth_header,
+    )
+    assert client.delete(f"/events/{event.id}", headers=auth_header).status_code == 204
+    session.expire_all()
+    assert session.query(Standing).count() == 0
+
+    # SQLite hands the same ids to the next event and entrants
+    fresh = create_event(status="published")
+    c, d = (Entrant(name=n, event_id=fresh.id) for n in ("C", "D"))
+    session.add_all([c, d])
+    session.commit()
+    assert (fresh.id, c.id, d.id) == old_ids
+    rows = client.get(f"/events/{fresh.id}/standings").get_json()
+    assert [(r["wins"], r["losses"], r["games_won"]) for r in rows] == [(0, 0, 0)] * 2
+
+
+def test_check_standings_finds_and_repairs_drift(
+    client, create_event, make_entrants, session, auth_header
+):
+    event = create_event(status="published")
+    a, b = make_entrants(event, 2)
+    client.post(
+        "/matches",
+        json={
+            "event_id": event.id,
+            "entrant1_id": a.id,
+            "entrant2_id": b.id,
+            "winner_id": a.id,
+            "scores": "2-1",
+        },
+        headers=auth_header,
+    )
+    assert check_standings() == []
+
+    # A database whose standings were never backfilled, plus a stray row
+    session.query(Standing).delete()
+    stray = {**dict.fromkeys(COLUMNS, 0), "wins": 3}
+    session.add(Standing(entrant_id=999, event_id=event.id, **stray))
+    session.commit()
+    assert check_standings() == [(event.id, [a.id, b.id, 999])]
+
+    assert check_standings(fix=True) == [(event.id, [a.id, b.id, 999])]
+    session.commit()
+    assert check_standings() == []
+    assert session.get(Standing, a.id).games_won == 2
+    assert session.get(Standing, 999) is None
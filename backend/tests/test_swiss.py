@@ -0,0 +1,89 @@
+# File: backend/tests/test_swiss.py
+# Purpose: Tests for Swiss-system pairing.
+# Notes:
+# - Pure pairing checks (rematch avoidance, scale) plus POST /matches/swiss.
+
+import time
+from types import SimpleNamespace
+
+from backend.brackets import BYE_SCORE
+from backend.models import Entrant
+from backend.swiss import pair_round, rank_players, standings_from_matches
+
+
+def test_pair_round_backtracks_to_avoid_rematches():
+    opponents = {1: {2, 3}, 2: {1, 4}, 3: {1, 4}, 4: {2, 3}}
+    assert pair_round([1, 2, 3, 4], opponents) == [(1, 4), (2, 3)]
+
+
+def test_pair_round_allows_rematch_when_unavoidable():
+    opponents = {1: {2}, 2: {1}}
+    assert pair_round([1, 2], opponents) == [(1, 2)]
+
+
+def test_pair_round_budget_fallback_keeps_rematches_minimal():
+    # Player 1 has met everyone, so a clean round doesn't exist; with no
+    # search budget the fallback must still rematch only player 1
+    opponents = {1: {2, 3, 4, 5, 6}, 2: {1, 6}, 3: {1, 4}, 4: {1, 3}, 5: {1, 6}}
+    opponents[6] = {1, 2, 5}
+    pairs = pair_round([1, 2, 3, 4, 5, 6], opponents, budget=0)
+    assert sorted(eid for pair in pairs for eid in pair) == [1, 2, 3, 4, 5, 6]
+    assert sum(b in opponents[a] for a, b in pairs) == 1
+
+
+def test_pairs_2000_players_quickly_without_rematches():
+    ids = list(range(1, 2001))
+    history = []
+    for _ in range(6):
+        points, opponents, _ = standings_from_matches(ids, history)
+        ranked = rank_players(ids, points, opponents)
+        start = time.perf_counter()
+        pairs = pair_round(ranked, opponents)
+        assert time.perf_counter() - start < 1.0
+        assert len(pairs) == 1000
+        assert not any(b in opponents.get(a, ()) for a, b in pairs)
+        history.extend(
+            SimpleNamespace(entrant1_id=a, entrant2_id=b, winner_id=a, scores="2-0")
+            for a, b in pairs
+        )
+
+
+def test_swiss_route_pairs_rounds_by_score(client, create_event, session, auth_header):
+    event = create_event(status="published")
+    session.add_all(Entrant(name=f"Hero {i}", event_id=event.id) for i in range(5))
+    session.commit()
+
+    resp = client.post(
+        "/matches/swiss", json={"event_id": event.id}, headers=auth_header
+    )
+    assert resp.status_code == 201
+    round1 = resp.get_json()
+    assert len(round1) == 3
+    bye = round1[-1]
+    assert bye["scores"] == BYE_SCORE and bye["entrant2_id"] is None
+
+    # Unreported results block the next round
+    resp = client.post(
+        "/matches/swiss", json={"event_id": event.id}, headers=auth_header
+    )
+    assert resp.status_code == 409
+
+    for m in round1[:2]:
+        client.put(
+            f"/matches/{m['id']}",
+            json={"winner_id": m["entrant1_id"], "scores": "2-0"},
+            headers=auth_header,
+        )
+
+    resp = client.post(
+        "/matches/swiss", json={"event_id": event.id}, headers=auth_header
+    )
+    assert resp.status_code == 201
+    round2 = resp.get_json()
+    assert all(m["round"] == 2 for m in round2)
+    played = {frozenset((m["entrant1_id"], m["entrant2_id"])) for m in round1[:2]}
+    assert all(
+        frozenset((m["entrant1_id"], m["entrant2_id"])) not in played for m in round2
+    )
+    # Round-one BYE recipient doesn't get a second one
+    assert round2[-1]["entrant1_id"] != bye["entrant1_id"]
@@ -0,0 +1,60 @@
+# File: backend/tests/test_synthetic.py
+# Purpose: Tests for the synthetic data generator and the route benchmark's
+#          baseline comparison (backend/benchmarks).
+
+from collections import Counter
+
+from backend.benchmarks.bench_routes import compare
+from backend.benchmarks.synthetic import write_seed_dir
+from backend.models import Entrant, Event, Match, Standing
+from backend.scripts.seed_db import load_seed_dir
+
+
+def test_generated_tournaments_load_and_are_consistent(session, tmp_path):
+    counts = write_seed_dir(tmp_path, events=12, entrants=20, rounds=4, seed=7)
+    load_seed_dir(tmp_path)
+    session.commit()
+
+    assert Event.query.count() == counts["events"] == 12
+    assert Entrant.query.count() == counts["entrants"]
+    assert Match.query.count() == counts["matches"] > 0
+
+    for event in Event.query.filter_by(status="completed"):
+        matches = Match.query.filter_by(event_id=event.id).all()
+        assert {m.round for m in matches} == {1, 2, 3, 4}
+        assert all(m.winner_id for m in matches)
+        # Nobody plays twice in a round
+        seats = Counter(
+            (m.round, e) for m in matches for e in (m.entrant1_id, m.entrant2_id) if e
+        )
+        assert max(seats.values()) == 1
+    for event in Event.query.filter(Event.status.in_(["drafting", "cancelled"])):
+        assert Match.query.filter_by(event_id=event.id).count() == 0
+
+    # Standings were rebuilt: every decided match is a win and a loss, a BYE
+    # only a win
+    decided = Match.query.filter(Match.winner_id.isnot(None))
+    byes = decided.filter(Match.entrant2_id.is_(None)).count()
+    results = sum(s.wins + s.losses for s in Standing.query)
+    assert results == 2 * decided.count() - byes
+
+
+def test_compare_flags_latency_and_query_regressions():
+    baseline = {
+        "routes": {
+            "GET /events": {"requests": 10, "p95_ms": 2.0, "queries_max": 2},
+            "GET /matches": {"requests": 10, "p95_ms": 10.0, "queries_max": 3},
+        }
+    }
+    current = {
+        "GET /events": {"requests": 10, "p95_ms": 2.3, "queries_max": 3},
+        "GET /matches": {"requests": 10, "p95_ms": 14.0, "queries_max": 3},
+        "GET /new": {"requests": 10, "p95_ms": 99.0, "queries_max": 9},
+    }
+
+    regressions = compare(current, baseline, tolerance=0.25, min_ms=0.5)
+
+    assert regressions == [
+        "GET /events: queries 2 -> 3",
+        "GET /matches: p95 10.0 -> 14.0 ms",
+    ]
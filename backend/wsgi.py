@@ -0,0 +1,11 @@
+# File: backend/wsgi.py
+# Purpose: Production WSGI entry point.
+# Notes:
+# - Run with: gunicorn -c backend/gunicorn.conf.py backend.wsgi:app
+# - Uses ProductionConfig (no debug, pooled connections sized per worker,
+#   SQLite WAL pragmas when DATABASE_URL points at SQLite).
+
+from backend.app import create_app
+from backend.config import ProductionConfig
+
+app = create_app(ProductionConfig)